@@ -0,0 +1,11 @@
+"""Performance benchmarks, run against a development database.
+
+Each benchmark is a module run with e.g. `just bench episode_insert`.
+"""
+
+import os
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
@@ -0,0 +1,73 @@
+"""Compares parse_date() with plain dateutil parsing over the dates in feed fixtures.
+
+just bench date_parser
+"""
+
+import argparse
+import pathlib
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+import lxml.etree
+from dateutil import parser as date_parser
+
+from radiofeed.feedparser.date_parser import _tz_infos, parse_date
+
+_MOCKS_DIR = pathlib.Path(__file__).parent.parent.joinpath(
+    "radiofeed", "feedparser", "tests", "mocks"
+)
+
+_DATE_TAGS = ("pubDate", "pubdate", "lastBuildDate")
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=20,
+        help="Number of times to parse all dates",
+    )
+    args = parser.parse_args()
+
+    values = _get_dates()
+
+    mismatches = [value for value in values if parse_date(value) != _dateutil(value)]
+
+    print(f"{len(values)} dates, {len(mismatches)} mismatches")
+    for value in mismatches:
+        print(f"    {value!r}")
+
+    for name, fn in (("dateutil", _dateutil), ("parse_date", parse_date)):
+        print(f"{name:<12} {_run(values, fn, args.repeat):>10.0f} dates/sec")
+
+
+def _run(values: list[str], fn: Callable[[str], datetime | None], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for value in values:
+            fn(value)
+    return len(values) * repeat / (time.perf_counter() - start)
+
+
+def _dateutil(value: str) -> datetime | None:
+    try:
+        return parse_date(date_parser.parse(value, tzinfos=_tz_infos()))
+    except date_parser.ParserError:
+        return None
+
+
+def _get_dates() -> list[str]:
+    values = []
+    for path in sorted(_MOCKS_DIR.glob("*.xml")):
+        with path.open("rb") as fp:
+            for _, element in lxml.etree.iterparse(fp, recover=True):
+                if element.tag in _DATE_TAGS and element.text and element.text.strip():
+                    values.append(element.text.strip())
+    return values
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compares bulk_create() with COPY for inserting new episodes.
+
+Run against a development database (all changes are rolled back):
+
+    just bench episode_insert
+"""
+
+import argparse
+import itertools
+import time
+from collections.abc import Callable, Iterator
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from radiofeed.episodes.models import Episode
+from radiofeed.podcasts.models import Podcast
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "sizes",
+        type=int,
+        nargs="*",
+        default=[1_000, 10_000, 50_000],
+        help="Number of feed items",
+    )
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        for name, fn in (
+            ("bulk_create", _bulk_create),
+            ("copy_create", Episode.objects.copy_create),
+        ):
+            elapsed = _run(size, fn)
+            print(f"{size:>8} items {name:<12} {elapsed:8.3f}s")
+
+
+def _run(size: int, fn: Callable[[list[Episode]], object]) -> float:
+    with transaction.atomic():
+        podcast = Podcast.objects.create(rss=f"https://example.com/{size}.xml")
+        episodes = list(_make_episodes(podcast, size))
+
+        start = time.perf_counter()
+        fn(episodes)
+        elapsed = time.perf_counter() - start
+
+        transaction.set_rollback(True)
+    return elapsed
+
+
+def _bulk_create(episodes: list[Episode]) -> None:
+    for batch in itertools.batched(episodes, 100):
+        Episode.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def _make_episodes(podcast: Podcast, size: int) -> Iterator[Episode]:
+    now = timezone.now()
+    for i in range(size):
+        yield Episode(
+            podcast=podcast,
+            guid=f"episode-{i}",
+            pub_date=now - timedelta(hours=i),
+            title=f"Episode {i}",
+            description="Lorem ipsum dolor sit amet. " * 40,
+            media_url=f"https://example.com/{i}.mp3",
+            media_type="audio/mpeg",
+            length=1_000_000,
+            duration="3600",
+            content_hash=f"{i:064x}",
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Measures feed parsing throughput in feeds per minute with a pool of worker processes,
+compared with a pool of worker threads.
+
+just bench feed_parser_processes
+"""
+
+import argparse
+import os
+import pathlib
+import time
+from concurrent import futures
+
+from radiofeed.feedparser.feed_parser import parse_content
+from radiofeed.process_pool import DjangoProcessPoolExecutor
+
+_MOCKS_DIR = pathlib.Path(__file__).parent.parent.joinpath(
+    "radiofeed", "feedparser", "tests", "mocks"
+)
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--feeds",
+        type=int,
+        default=200,
+        help="Number of feeds to parse with each pool",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="*",
+        default=_default_workers(),
+        help="Pool sizes to measure",
+    )
+    args = parser.parse_args()
+
+    fixtures = [path.read_bytes() for path in sorted(_MOCKS_DIR.glob("rss_*.xml"))]
+    contents = [fixtures[i % len(fixtures)] for i in range(args.feeds)]
+
+    for max_workers in args.workers:
+        for label, executor in (
+            ("threads", futures.ThreadPoolExecutor(max_workers)),
+            ("processes", DjangoProcessPoolExecutor(max_workers)),
+        ):
+            with executor:
+                # start workers before timing
+                list(executor.map(_noop, range(max_workers)))
+
+                start = time.perf_counter()
+                num_parsed = sum(
+                    future.exception() is None
+                    for future in [
+                        executor.submit(parse_content, content, "en")
+                        for content in contents
+                    ]
+                )
+                elapsed = time.perf_counter() - start
+
+            print(
+                f"{max_workers:>3} {label:<10} {num_parsed:>6} feeds "
+                f"{num_parsed * 60 / elapsed:>10.0f} feeds/min"
+            )
+
+
+def _default_workers() -> list[int]:
+    cpu_count = os.cpu_count() or 1
+    return sorted({1, 2, 4, 8, cpu_count} & set(range(1, cpu_count + 1)))
+
+
+def _noop(value: int) -> int:
+    return value
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Compares the single-pass RSS item extractor with XPath lookups of each item field,
+in items per second on large feed fixtures.
+
+Full parse_rss() throughput, including validation, is also reported.
+
+just bench rss_parser
+"""
+
+import argparse
+import io
+import pathlib
+import time
+from collections.abc import Callable
+from typing import Any
+
+import lxml.etree
+
+from radiofeed.feedparser.rss_parser import _rss_parser, parse_rss
+
+_MOCKS_DIR = pathlib.Path(__file__).parent.parent.joinpath(
+    "radiofeed", "feedparser", "tests", "mocks"
+)
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "filenames",
+        nargs="*",
+        default=[
+            "rss_mock_iso_8859-1.xml",
+            "rss_bad_cover_urls.xml",
+            "rss_superfeedr.xml",
+            "rss_use_link_ids.xml",
+        ],
+        help="Feed fixtures in radiofeed/feedparser/tests/mocks",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="Number of times to parse each feed",
+    )
+    args = parser.parse_args()
+
+    rss_parser = _rss_parser()
+
+    print(
+        f"{'':<32} {'items':>6} {'xpath':>10} {'single':>10} {'speedup':>8} "
+        f"{'parse_rss':>10}"
+    )
+
+    for filename in args.filenames:
+        content = _MOCKS_DIR.joinpath(filename).read_bytes()
+
+        items = [
+            element
+            for _, element in lxml.etree.iterparse(
+                io.BytesIO(content), tag="item", recover=True, resolve_entities=False
+            )
+        ]
+
+        mismatches = sum(
+            _xpath_extract(item) != rss_parser._extract_item(item) for item in items
+        )
+
+        xpath = _run(items, _xpath_extract, args.repeat)
+        single = _run(items, rss_parser._extract_item, args.repeat)
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            num_items = len(parse_rss(content).items)
+        full = num_items * args.repeat / (time.perf_counter() - start)
+
+        print(
+            f"{filename:<32} {len(items):>6} {xpath:>10.0f} {single:>10.0f} "
+            f"{single / xpath:>7.1f}x {full:>10.0f}"
+            + (f" ({mismatches} mismatches)" if mismatches else "")
+        )
+
+
+def _run(
+    items: list[lxml.etree._Element],
+    fn: Callable[[lxml.etree._Element], Any],
+    repeat: int,
+) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            fn(item)
+    return len(items) * repeat / (time.perf_counter() - start)
+
+
+def _xpath_extract(item: lxml.etree._Element) -> dict[str, str | None]:
+    # one XPathParser.value() call per field, as before the single-pass extractor
+    rss_parser = _rss_parser()
+    return {
+        field: rss_parser._parser.value(
+            item,
+            *(f"{tag}/@{attr}" if attr else f"{tag}/text()" for tag, attr in paths),
+        )
+        for field, paths in rss_parser._ITEM_FIELDS.items()
+    }
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Compares dense cosine similarity with blocked sparse top-k similarity, for increasing
+numbers of podcasts in a category.
+
+just bench similarity
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from radiofeed.podcasts.similarity import find_top_k
+
+
+def main() -> None:
+    """Runs benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[1000, 2000, 4000],
+        help="Numbers of podcasts",
+    )
+    parser.add_argument(
+        "--num-matches",
+        type=int,
+        default=12,
+        help="Number of matches per podcast",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    words = [f"word{i}" for i in range(20000)]
+
+    for size in args.sizes:
+        texts = [
+            " ".join(rng.choice(words, size=200, p=_zipf(len(words))))
+            for _ in range(size)
+        ]
+        matrix = sparse.csr_matrix(HashingVectorizer().transform(texts))
+
+        for name, fn in (("dense", _dense), ("top_k", _top_k)):
+            elapsed, peak = _run(
+                lambda fn=fn, matrix=matrix: fn(matrix, args.num_matches)
+            )
+            print(f"{size:>6} {name:<8} {elapsed:>8.2f}s {peak / 1024 / 1024:>8.1f}MB")
+
+
+def _run(fn: Callable[[], None]) -> tuple[float, int]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def _dense(matrix: sparse.csr_matrix, k: int) -> None:
+    for similar in cosine_similarity(matrix):
+        sorted(enumerate(similar), key=lambda item: item[1], reverse=True)[:k]
+
+
+def _top_k(matrix: sparse.csr_matrix, k: int) -> None:
+    for _ in find_top_k(matrix, k):
+        pass
+
+
+def _zipf(size: int) -> np.ndarray:
+    weights = 1 / np.arange(1, size + 1)
+    return weights / weights.sum()
+
+
+if __name__ == "__main__":
+    main()
@@ -506,10 +506,32 @@ GDPR_COOKIE_NAME = "accept-cookies"
 
 USER_AGENT = env("USER_AGENT", default="Radiofeed/0.0.0")
 
+# HTTP client connections
+# HTTP/2 allows many requests to the same host to share one connection
+
+HTTP_CLIENT_HTTP2 = env.bool("HTTP_CLIENT_HTTP2", default=False)
+
+HTTP_CLIENT_MAX_CONNECTIONS = env.int("HTTP_CLIENT_MAX_CONNECTIONS", default=100)
+
+HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS = env.int(
+    "HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS", default=20
+)
+
+HTTP_CLIENT_KEEPALIVE_EXPIRY = env.float("HTTP_CLIENT_KEEPALIVE_EXPIRY", default=5.0)
+
 # Default page size for paginated views
 
 DEFAULT_PAGE_SIZE = 30
 
+# Number of new episodes in a feed above which episodes are inserted using COPY
+
+EPISODE_COPY_THRESHOLD = env.int("EPISODE_COPY_THRESHOLD", default=1000)
+
+# Directory to keep podcast text vectors between runs of create_recommendations.
+# If not set, the text of every podcast is vectorized on each run.
+
+RECOMMENDER_VECTORS_DIR = env.path("RECOMMENDER_VECTORS_DIR", default=None)
+
 # HTMX configuration
 # https://htmx.org/docs/#config
 
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-17 03:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("episodes", "0004_remove_audiolog_created_remove_audiolog_modified_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="episode",
+            name="content_hash",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
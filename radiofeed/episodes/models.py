@@ -1,9 +1,10 @@
+from collections.abc import Iterable
 from typing import ClassVar, Optional
 
 from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
-from django.db import models
+from django.db import connections, models, transaction
 from django.template.defaultfilters import filesizeformat
 from django.urls import reverse
 from django.utils.functional import cached_property
@@ -28,6 +29,56 @@ class EpisodeQuerySet(SearchQuerySetMixin, FastUpdateQuerySet):
             )
         ).filter(is_subscribed=True)
 
+    def copy_create(self, episodes: Iterable["Episode"]) -> int:
+        """Bulk inserts episodes with PostgreSQL COPY.
+
+        Episodes are copied into a temporary staging table, then inserted in a single
+        statement, ignoring any conflicts with existing episodes. This is much faster
+        than `bulk_create()` for large numbers of episodes.
+
+        The staging table only lasts until the end of the transaction, so this is run
+        in a transaction if not already inside one. Returns number of episodes inserted.
+        """
+        self._for_write = True
+        connection = connections[self.db]
+
+        fields = [
+            field
+            for field in self.model._meta.concrete_fields
+            if not field.primary_key and field.editable
+        ]
+
+        table = connection.ops.quote_name(self.model._meta.db_table)
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+
+        with transaction.atomic(using=self.db), connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE episodes_staging ON COMMIT DROP AS "  # noqa: S608
+                f"SELECT {columns} FROM {table} WITH NO DATA"
+            )
+
+            with cursor.copy(f"COPY episodes_staging ({columns}) FROM STDIN") as copy:
+                for episode in episodes:
+                    copy.write_row(
+                        [
+                            field.get_db_prep_save(
+                                getattr(episode, field.attname), connection
+                            )
+                            for field in fields
+                        ]
+                    )
+
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) "  # noqa: S608
+                f"SELECT {columns} FROM episodes_staging "
+                "ON CONFLICT DO NOTHING"
+            )
+            num_inserted = cursor.rowcount
+
+            cursor.execute("DROP TABLE episodes_staging")
+
+        return num_inserted
+
 
 class Episode(models.Model):
     """Individual podcast episode."""
@@ -62,6 +113,8 @@ class Episode(models.Model):
 
     explicit = models.BooleanField(default=False)
 
+    content_hash = models.CharField(max_length=64, blank=True)
+
     search_vector = SearchVectorField(null=True, editable=False)
 
     objects: models.Manager["Episode"] = EpisodeQuerySet.as_manager()
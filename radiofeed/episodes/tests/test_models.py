@@ -32,6 +32,41 @@ class TestEpisodeManager:
     def test_subscribed_false(self, user, episode):
         assert Episode.objects.subscribed(user).exists() is False
 
+    @pytest.mark.django_db
+    def test_copy_create(self, podcast):
+        existing = EpisodeFactory(
+            podcast=podcast,
+            guid="existing",
+            title="existing",
+            description="existing",
+        )
+
+        episodes = [
+            EpisodeFactory.build(podcast=podcast, guid=guid, title="testing")
+            for guid in ("existing", "a", "b")
+        ]
+
+        assert Episode.objects.copy_create(episodes) == 2
+        assert podcast.episodes.count() == 3
+
+        # existing episode should not be updated
+        existing.refresh_from_db()
+        assert existing.title != "testing"
+
+        # search trigger should be run
+        assert Episode.objects.search("testing").count() == 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_copy_create_autocommit(self, podcast):
+        episodes = EpisodeFactory.build_batch(3, podcast=podcast)
+
+        assert Episode.objects.copy_create(episodes) == 3
+        assert podcast.episodes.count() == 3
+
+    @pytest.mark.django_db
+    def test_copy_create_empty(self):
+        assert Episode.objects.copy_create([]) == 0
+
 
 class TestEpisodeModel:
     link = "https://example.com"
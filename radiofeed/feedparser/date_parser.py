@@ -1,5 +1,9 @@
+import contextvars
+import email.utils
 import functools
+from collections.abc import Callable
 from datetime import date, datetime
+from typing import Final
 
 from dateutil import parser as date_parser
 from django.utils.timezone import is_aware, make_aware
@@ -45,14 +49,63 @@ def _(value: date) -> datetime | None:
 
 @parse_date.register
 def _(value: str) -> datetime | None:
+    if not value:
+        return None
+
+    # Most feeds use the same date format throughout, so try the format which last
+    # succeeded first. Dates are parsed one feed at a time in each thread.
+
+    preferred = _preferred_parser.get()
+
+    for parser in (preferred, *(p for p in _FAST_PARSERS if p is not preferred)):
+        if dt := parser(value):
+            _preferred_parser.set(parser)
+            return parse_date(dt)
+
     try:
-        return (
-            parse_date(date_parser.parse(value, tzinfos=_tz_infos())) if value else None
-        )
+        return parse_date(date_parser.parse(value, tzinfos=_tz_infos()))
     except date_parser.ParserError:
         return None
 
 
+def _parse_rfc_822(value: str) -> datetime | None:
+    # day names are otherwise ignored, whereas dateutil rejects unknown names
+    day, sep, _ = value.partition(",")
+    if sep and day.strip() not in _RFC_822_DAYS:
+        return None
+    try:
+        dt = email.utils.parsedate_to_datetime(value)
+    except ValueError:
+        return None
+    # defer to dateutil for missing timezones, or named timezones with an offset
+    # different from that given to dateutil e.g. AST
+    if (offset := dt.utcoffset()) is None:
+        return None
+    zone = value.split()[-1]
+    if zone.startswith(("+", "-")) or _tz_infos().get(zone) == offset.total_seconds():
+        return dt
+    return None
+
+
+def _parse_iso_8601(value: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+_RFC_822_DAYS: Final = frozenset(["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"])
+
+_FAST_PARSERS: Final[tuple[Callable[[str], datetime | None], ...]] = (
+    _parse_rfc_822,
+    _parse_iso_8601,
+)
+
+_preferred_parser: contextvars.ContextVar[Callable[[str], datetime | None]] = (
+    contextvars.ContextVar("preferred_parser", default=_parse_rfc_822)
+)
+
+
 @functools.cache
 def _tz_infos() -> dict[str, int]:
     return {
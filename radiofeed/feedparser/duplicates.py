@@ -0,0 +1,107 @@
+import collections
+import urllib.parse
+from collections.abc import Iterable
+
+from radiofeed.podcasts.models import Podcast
+
+
+def find_duplicates(feeds: Iterable[tuple[int, str, str]]) -> set[int]:
+    """Checks a batch of feeds for duplicates in a single query.
+
+    Each feed is a tuple of podcast ID, RSS URL and content hash. Returns IDs of any
+    podcasts where another podcast has the same RSS URL or content hash. Feeds are
+    also checked against each other: where feeds in the batch have the same RSS URL
+    or content hash, all but the first are returned.
+    """
+    feeds = list(feeds)
+
+    # separate queries are combined so each can use its own index
+    rows = (
+        Podcast.objects.filter(rss__in={url for _, url, _ in feeds})
+        .values_list("pk", "rss", "content_hash")
+        .union(
+            Podcast.objects.filter(
+                content_hash__in={content_hash for _, _, content_hash in feeds} - {""}
+            ).values_list("pk", "rss", "content_hash")
+        )
+    )
+
+    urls: dict[str, set[int]] = collections.defaultdict(set)
+    hashes: dict[str, set[int]] = collections.defaultdict(set)
+
+    for pk, url, content_hash in rows:
+        urls[url].add(pk)
+        if content_hash:
+            hashes[content_hash].add(pk)
+
+    duplicate_ids: set[int] = set()
+
+    for pk, url, content_hash in feeds:
+        if (urls.get(url, set()) | hashes.get(content_hash, set())) - {pk}:
+            duplicate_ids.add(pk)
+        else:
+            # later feeds in the batch are duplicates of this one
+            urls[url].add(pk)
+            if content_hash:
+                hashes[content_hash].add(pk)
+
+    return duplicate_ids
+
+
+def normalize_url(url: str) -> str:
+    """Returns URL without scheme, "www." prefix, trailing slash or fragment, so that
+    variants of the same feed URL can be matched."""
+    parts = urllib.parse.urlsplit(url.strip())
+
+    host = (parts.hostname or "").removeprefix("www.")
+
+    if parts.port:
+        host = f"{host}:{parts.port}"
+
+    normalized = host + parts.path.rstrip("/")
+
+    if parts.query:
+        normalized = f"{normalized}?{parts.query}"
+
+    return normalized
+
+
+def cluster_duplicates(podcasts: Iterable[Podcast]) -> list[list[Podcast]]:
+    """Groups podcasts with the same content hash or normalized RSS URL. A podcast's
+    redirect URL, if any, is matched as well as its RSS URL.
+
+    Podcasts are grouped transitively, so if A and B share a content hash, and B and
+    C share a URL, all three are in the same cluster. Only clusters of more than one
+    podcast are returned.
+    """
+    podcasts = list(podcasts)
+
+    parents = list(range(len(podcasts)))
+
+    def _find(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owners: dict[tuple[str, str], int] = {}
+
+    for index, podcast in enumerate(podcasts):
+        keys = [("url", normalize_url(podcast.rss))]
+
+        if podcast.redirect_rss:
+            keys.append(("url", normalize_url(podcast.redirect_rss)))
+
+        if podcast.content_hash:
+            keys.append(("hash", podcast.content_hash))
+
+        for key in keys:
+            owner = owners.setdefault(key, index)
+            parents[_find(index)] = _find(owner)
+
+    clusters: dict[int, list[Podcast]] = collections.defaultdict(list)
+
+    for index, podcast in enumerate(podcasts):
+        clusters[_find(index)].append(podcast)
+
+    return [cluster for cluster in clusters.values() if len(cluster) > 1]
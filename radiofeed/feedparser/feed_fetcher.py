@@ -0,0 +1,262 @@
+import asyncio
+import collections
+import contextlib
+import functools
+import itertools
+import logging
+import time
+import urllib.parse
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+import httpx
+
+from radiofeed.feedparser import feed_parser
+from radiofeed.feedparser.exceptions import FeedParserError
+from radiofeed.http_client import AsyncClient, get_limits
+from radiofeed.podcasts.models import Podcast
+from radiofeed.thread_pool import DatabaseSafeThreadPoolExecutor
+
+FetchedFeed = httpx.Response | FeedParserError
+
+logger = logging.getLogger(__name__)
+
+
+class FetchBudget:
+    """Limits time and bytes spent fetching feeds.
+
+    Once either limit is reached, no more feeds are fetched, although any feeds
+    already being fetched are completed.
+    """
+
+    def __init__(
+        self, *, timeout: float | None = None, max_bytes: int | None = None
+    ) -> None:
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        self._max_bytes = max_bytes
+
+        self.num_bytes = 0
+
+    @property
+    def spent(self) -> bool:
+        """Returns True if time or bytes limit reached."""
+        return (self._deadline is not None and time.monotonic() >= self._deadline) or (
+            self._max_bytes is not None and self.num_bytes >= self._max_bytes
+        )
+
+
+FetchFeeds = Callable[[Iterable[Podcast], FetchBudget | None], list[Podcast]]
+
+
+def fetch_feeds(
+    podcasts: Iterable[Podcast],
+    fn: Callable[[Podcast, FetchedFeed], None],
+    budget: FetchBudget | None = None,
+    **kwargs,
+) -> list[Podcast]:
+    """Fetches RSS feeds of podcasts concurrently, using asyncio.
+
+    Podcasts are interleaved by host, so that feeds hosted by the same provider are
+    spread across the run rather than requested all at once, and no more than
+    `max_host_connections` requests are sent to any one host at the same time.
+
+    Each feed response (or error raised fetching the feed) is passed to `fn` in a
+    thread pool of `max_workers` threads, where database access is safe. Response
+    content is streamed from the event loop to the worker thread as it is read.
+
+    At most `max_connections` feeds are downloaded or waiting on a worker at any
+    time, so memory use is bounded regardless of the number of podcasts.
+
+    If a `budget` is provided, no more feeds are fetched once it is spent. Any podcasts
+    not fetched are returned.
+
+    Note that `podcasts` is evaluated before any feeds are fetched, as database
+    queries cannot be run inside the event loop.
+
+    See `open_feed_fetcher()` for other arguments.
+    """
+    with open_feed_fetcher(fn, **kwargs) as fetch:
+        return fetch(podcasts, budget)
+
+
+@contextlib.contextmanager
+def open_feed_fetcher(
+    fn: Callable[[Podcast, FetchedFeed], None],
+    *,
+    max_connections: int = 100,
+    max_host_connections: int = 4,
+    max_workers: int | None = None,
+    **client_kwargs,
+) -> Iterator[FetchFeeds]:
+    """Yields a function which fetches feeds as with `fetch_feeds()`.
+
+    The event loop, HTTP connections and worker threads are kept open between calls,
+    so that long-running processes can fetch many batches of podcasts.
+    """
+
+    # keep connections alive between requests to the same host
+    kwargs: dict[str, Any] = {
+        "limits": get_limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    } | client_kwargs
+
+    with (
+        asyncio.Runner() as runner,
+        DatabaseSafeThreadPoolExecutor(max_workers=max_workers) as executor,
+    ):
+        client = runner.run(AsyncClient(**kwargs).__aenter__())
+
+        fetcher = _FeedFetcher(
+            fn,
+            client,
+            executor,
+            max_connections=max_connections,
+            max_host_connections=max_host_connections,
+        )
+
+        try:
+            yield lambda podcasts, budget: runner.run(
+                fetcher.run(interleave_by_host(podcasts), budget)
+            )
+        finally:
+            runner.run(client.__aexit__(None, None, None))
+
+
+def interleave_by_host(podcasts: Iterable[Podcast]) -> list[Podcast]:
+    """Reorders podcasts round-robin by feed host.
+
+    The original order of podcasts is preserved within each host.
+    """
+    hosts: dict[str, list[Podcast]] = collections.defaultdict(list)
+    for podcast in podcasts:
+        hosts[_get_host(podcast)].append(podcast)
+
+    return [
+        podcast
+        for podcast in itertools.chain.from_iterable(
+            itertools.zip_longest(*hosts.values())
+        )
+        if podcast is not None
+    ]
+
+
+def _get_host(podcast: Podcast) -> str:
+    return urllib.parse.urlsplit(podcast.redirect_rss or podcast.rss).hostname or ""
+
+
+class _FeedFetcher:
+    """Fetches feeds in an event loop, handing off responses to worker threads."""
+
+    def __init__(
+        self,
+        fn: Callable[[Podcast, FetchedFeed], None],
+        client: AsyncClient,
+        executor: DatabaseSafeThreadPoolExecutor,
+        *,
+        max_connections: int,
+        max_host_connections: int,
+    ) -> None:
+        self._fn = fn
+        self._client = client
+        self._executor = executor
+        self._max_connections = max_connections
+
+        self._host_semaphores: collections.defaultdict[str, asyncio.Semaphore] = (
+            collections.defaultdict(
+                functools.partial(asyncio.Semaphore, max_host_connections)
+            )
+        )
+
+    async def run(
+        self, podcasts: list[Podcast], budget: FetchBudget | None = None
+    ) -> list[Podcast]:
+        """Fetches podcast feeds until all fetched or budget spent.
+
+        Returns podcasts not fetched.
+        """
+        podcasts_iter = iter(podcasts)
+
+        await asyncio.gather(
+            *[
+                self._fetch_all(podcasts_iter, budget)
+                for _ in range(min(self._max_connections, len(podcasts)))
+            ]
+        )
+
+        return list(podcasts_iter)
+
+    async def _fetch_all(
+        self, podcasts: Iterator[Podcast], budget: FetchBudget | None
+    ) -> None:
+        # each task pulls the next podcast off the shared iterator once the
+        # previous feed has been parsed by a worker thread
+        while not (budget and budget.spent):
+            if (podcast := next(podcasts, None)) is None:
+                return
+            try:
+                async with (
+                    self._host_semaphores[_get_host(podcast)],
+                    feed_parser.fetch_feed(podcast, self._client) as response,
+                ):
+                    # response content is streamed to the worker as it is parsed
+                    stream = _ThreadSafeByteStream(response)
+                    await self._submit(podcast, stream.make_response())
+
+                    if budget:
+                        budget.num_bytes += stream.num_bytes
+            except FeedParserError as exc:
+                await self._submit(podcast, exc)
+
+    async def _submit(self, podcast: Podcast, fetched: FetchedFeed) -> None:
+        future = self._executor.db_safe_submit(self._fn, podcast, fetched)
+        await asyncio.wait([asyncio.wrap_future(future)])
+
+        # an exception parsing one feed should not stop other feeds being fetched
+        if exc := future.exception():
+            logger.error("Error handling feed %s", podcast.rss, exc_info=exc)
+
+
+class _ThreadSafeByteStream(httpx.SyncByteStream):
+    """Reads raw content of an async response from a worker thread.
+
+    Each chunk is read in the event loop, so must be iterated outside the loop thread.
+    Compressed content is decoded by the worker rather than in the event loop.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self._chunks = response.aiter_raw()
+        self._loop = asyncio.get_running_loop()
+
+        self.num_bytes = 0
+
+    def make_response(self) -> httpx.Response:
+        """Returns synchronous response streaming the content of async response.
+
+        The URL and redirect history are the same as the async response.
+        """
+        response = httpx.Response(
+            status_code=self._response.status_code,
+            headers=self._response.headers,
+            stream=self,
+            request=self._response.request,
+        )
+        response.history = self._response.history
+        return response
+
+    def __iter__(self) -> Iterator[bytes]:
+        """Iterates through content chunks."""
+        while True:
+            try:
+                yield asyncio.run_coroutine_threadsafe(
+                    self._next_chunk(), self._loop
+                ).result()
+            except StopAsyncIteration:
+                return
+
+    async def _next_chunk(self) -> bytes:
+        chunk = await anext(self._chunks)
+        self.num_bytes += len(chunk)
+        return chunk
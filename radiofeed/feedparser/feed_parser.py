@@ -1,21 +1,29 @@
+import collections
+import contextlib
+import dataclasses
 import functools
 import hashlib
+import http
 import itertools
-from collections.abc import Iterator
+import tempfile
+import threading
+import zlib
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent import futures
 from datetime import datetime, timedelta
-from typing import Final
+from typing import Any, Final, NoReturn
 
 import httpx
+from django.conf import settings
 from django.db import transaction
-from django.db.models import Q
 from django.db.models.functions import Lower
-from django.db.utils import DataError
+from django.db.utils import DataError, IntegrityError
 from django.utils import timezone
 from django.utils.http import http_date, quote_etag
 
 from radiofeed import tokenizer
 from radiofeed.episodes.models import Episode
-from radiofeed.feedparser import rss_parser, scheduler
+from radiofeed.feedparser import duplicates, rss_parser, scheduler
 from radiofeed.feedparser.date_parser import parse_date
 from radiofeed.feedparser.exceptions import (
     DuplicateError,
@@ -25,9 +33,21 @@ from radiofeed.feedparser.exceptions import (
     NotModifiedError,
     UnavailableError,
 )
+from radiofeed.feedparser.metrics import ParseMetrics
 from radiofeed.feedparser.models import Feed, Item
-from radiofeed.http_client import Client
-from radiofeed.podcasts.models import Category, Podcast
+from radiofeed.http_client import AsyncClient, Client
+from radiofeed.podcasts.models import Category, FetchMetrics, Podcast
+
+_CONTENT_FINGERPRINT_SIZE: Final = 64 * 1024
+
+_MAX_RETRIES: Final = 3
+
+_PERMANENT_REDIRECTS: Final = frozenset(
+    {
+        http.HTTPStatus.MOVED_PERMANENTLY,
+        http.HTTPStatus.PERMANENT_REDIRECT,
+    }
+)
 
 
 @functools.cache
@@ -44,15 +64,379 @@ def make_content_hash(content: bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+def make_episode_hash(item: Item) -> str:
+    """Hashes episode fields of a feed item, to check if episode has changed."""
+    return hashlib.sha256(
+        item.model_dump_json(exclude={"categories"}).encode()
+    ).hexdigest()
+
+
+def make_content_fingerprint(content: bytes, content_length: str | None = None) -> str:
+    """Returns a cheap checksum of the start of RSS content and its Content-Length.
+
+    This can be checked as soon as the start of the content has been read. A match
+    indicates the content is probably unchanged, but should be confirmed with the
+    full content hash.
+    """
+    checksum = zlib.adler32(content[:_CONTENT_FINGERPRINT_SIZE])
+    return f"{content_length or ''}:{checksum:08x}"
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class ParsedContent:
+    """Feed parsed from RSS content, along with values derived from the feed."""
+
+    feed: Feed
+    extracted_text: str
+    episode_hashes: list[str]
+    metrics: ParseMetrics = dataclasses.field(compare=False)
+
+
+def parse_content(
+    content: bytes | Iterable[bytes],
+    language: str,
+    metrics: ParseMetrics | None = None,
+) -> ParsedContent:
+    """Parses RSS content, tokenizing text and hashing episodes.
+
+    The database is not accessed, so this is safe to run in a worker process.
+
+    Raises:
+        InvalidRSSError: if content is not valid RSS
+    """
+    metrics = metrics or ParseMetrics()
+
+    with metrics.measure("parse_time"):
+        feed = rss_parser.parse_rss_stream(
+            [content] if isinstance(content, bytes) else content, metrics
+        )
+
+        parsed = ParsedContent(
+            feed=feed,
+            extracted_text=_tokenize_feed(feed, language),
+            episode_hashes=[make_episode_hash(item) for item in feed.items],
+            metrics=metrics,
+        )
+
+    metrics.num_items = len(feed.items)
+
+    return parsed
+
+
 def parse_feed(podcast: Podcast, client: Client) -> None:
     """Updates a Podcast instance with its RSS or Atom feed source."""
     _FeedParser(podcast).parse(client)
 
 
+@contextlib.asynccontextmanager
+async def fetch_feed(
+    podcast: Podcast, client: AsyncClient
+) -> AsyncIterator[httpx.Response]:
+    """Fetches the RSS or Atom feed source of a Podcast, without accessing the database.
+
+    The response content is streamed, and should be consumed by `parse_fetched_feed()`
+    before the context exits.
+
+    Raises:
+        FeedParserError: if the feed cannot be fetched.
+    """
+    async with _FeedParser(podcast).fetch(client) as response:
+        yield response
+
+
+def parse_fetched_feed(
+    podcast: Podcast,
+    fetched: httpx.Response | FeedParserError,
+    executor: futures.Executor | None = None,
+    batch: "PodcastUpdateBatch | None" = None,
+) -> None:
+    """Updates a Podcast instance with a feed response returned by `fetch_feed()`, or the
+    error raised trying to fetch it.
+
+    If `executor` is provided, the response content is read in full and passed to
+    `parse_content()` in the executor e.g. a process pool. Otherwise content is parsed
+    in the current thread as it is streamed.
+
+    If `batch` is provided, podcast fields, categories and metrics are added to the
+    batch rather than written immediately. Episodes are always written immediately.
+    Batched feeds are checked for duplicates when the batch is written, rather than
+    raising `DuplicateError`.
+
+    Raises:
+        FeedParserError: if any errors found in fetching or parsing the feed.
+    """
+    _FeedParser(podcast, executor, batch).parse_fetched(fetched)
+
+
+class PodcastUpdateBatch:
+    """Collects podcast updates from the feed parser, so that updates of many podcasts
+    are written to the database together.
+
+    Updates may be added from multiple threads. Parsed feeds are checked for
+    duplicates, against the database and each other, before the batch is written. If
+    writing a batch fails, each update is written individually, so that one invalid
+    update does not affect other podcasts.
+    """
+
+    def __init__(self, batch_size: int = 100) -> None:
+        self._batch_size = batch_size
+        self._updates: dict[int, _PodcastUpdate] = {}
+        self._lock = threading.Lock()
+
+    def add(self, update: "_PodcastUpdate") -> None:
+        """Adds update, writing the batch once full."""
+        batches: list[list[_PodcastUpdate]] = []
+
+        with self._lock:
+            # a podcast can only be updated once in each batch
+            if update.podcast.pk in self._updates:
+                batches.append(self._pop())
+
+            self._updates[update.podcast.pk] = update
+
+            if len(self._updates) >= self._batch_size:
+                batches.append(self._pop())
+
+        for updates in batches:
+            self._write(updates)
+
+    def flush(self) -> None:
+        """Writes any remaining updates."""
+        with self._lock:
+            updates = self._pop()
+
+        if updates:
+            self._write(updates)
+
+    def _pop(self) -> list["_PodcastUpdate"]:
+        updates, self._updates = list(self._updates.values()), {}
+        return updates
+
+    def _write(self, updates: list["_PodcastUpdate"]) -> None:
+        updates = self._check_duplicates(updates)
+        try:
+            with transaction.atomic():
+                _write_updates(updates)
+        except (DataError, IntegrityError):
+            for update in updates:
+                try:
+                    with transaction.atomic():
+                        _write_updates([update])
+                except DataError:
+                    _write_updates([self._error_update(update, InvalidDataError())])
+                except IntegrityError:
+                    # another podcast has been updated with the same RSS URL
+                    _write_updates([self._error_update(update, DuplicateError())])
+
+    def _check_duplicates(
+        self, updates: list["_PodcastUpdate"]
+    ) -> list["_PodcastUpdate"]:
+        duplicate_ids = duplicates.find_duplicates(
+            (update.podcast.pk, update.fields["rss"], update.fields["content_hash"])
+            for update in updates
+            if "content_hash" in update.fields
+        )
+        return [
+            self._error_update(update, DuplicateError())
+            if update.podcast.pk in duplicate_ids
+            else update
+            for update in updates
+        ]
+
+    def _error_update(
+        self, update: "_PodcastUpdate", exc: FeedParserError
+    ) -> "_PodcastUpdate":
+        error_update = _make_error_update(update.podcast, exc)
+        if "content_hash" not in update.fields:
+            return error_update
+        # episodes of the feed have already been written, so the content hash is
+        # cleared to ensure the feed is parsed again in full
+        return dataclasses.replace(
+            error_update,
+            fields=error_update.fields
+            | {"content_hash": "", "content_fingerprint": ""},
+        )
+
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class _PodcastUpdate:
+    podcast: Podcast
+    fields: dict[str, Any]
+    categories: list[Category] | None
+    metrics: FetchMetrics
+
+
+def _make_update(
+    podcast: Podcast,
+    metrics: ParseMetrics,
+    categories: list[Category] | None = None,
+    **fields,
+) -> _PodcastUpdate:
+    now = timezone.now()
+
+    return _PodcastUpdate(
+        podcast=podcast,
+        fields={
+            "updated": now,
+            "parsed": now,
+            "next_fetch_at": scheduler.next_fetch_at(
+                now,
+                fields.get("pub_date", podcast.pub_date),
+                fields.get("frequency", podcast.frequency),
+            ),
+        }
+        | fields,
+        categories=categories,
+        metrics=FetchMetrics(
+            podcast=podcast,
+            parser_error=fields["parser_error"],
+            connect_time=_to_timedelta(metrics.connect_time),
+            ttfb=_to_timedelta(metrics.ttfb),
+            download_time=_to_timedelta(metrics.download_time),
+            parse_time=_to_timedelta(metrics.parse_time),
+            validation_time=_to_timedelta(metrics.validation_time),
+            db_time=_to_timedelta(metrics.db_time),
+            content_length=metrics.content_length,
+            transfer_length=metrics.transfer_length,
+            content_encoding=metrics.content_encoding or "",
+            num_items=metrics.num_items,
+            num_rows=metrics.num_rows,
+        ),
+    )
+
+
+def _make_error_update(
+    podcast: Podcast,
+    exc: FeedParserError,
+    response: httpx.Response | None = None,
+    metrics: ParseMetrics | None = None,
+) -> _PodcastUpdate:
+    active: bool = True
+    num_retries: int = podcast.num_retries
+    frequency: timedelta | None = podcast.frequency
+
+    etag: str = podcast.etag
+    modified: datetime | None = podcast.modified
+
+    match exc:
+        case DuplicateError():
+            active = False
+
+        case NotModifiedError():
+            num_retries = 0
+
+        case _:
+            num_retries += 1
+
+    # if number of errors exceeds threshold then deactivate the podcast
+    active = active and num_retries < _MAX_RETRIES
+
+    # if the feed could not be fetched, the redirect target may be at fault
+    redirect_rss = (
+        ""
+        if isinstance(exc, InaccessibleError | UnavailableError)
+        else _parse_redirect(podcast, response)
+    )
+
+    if active:
+        # if still active, reschedule podcast and set etag and modified headers for next time
+
+        frequency = scheduler.reschedule(podcast.pub_date, podcast.frequency)
+
+        if response:
+            etag = _parse_etag(response)
+            modified = _parse_modified(response)
+
+    return _make_update(
+        podcast,
+        metrics or ParseMetrics(),
+        active=active,
+        num_retries=num_retries,
+        frequency=frequency,
+        etag=etag,
+        modified=modified,
+        redirect_rss=redirect_rss,
+        parser_error=exc.parser_error,
+    )
+
+
+def _parse_redirect(podcast: Podcast, response: httpx.Response | None) -> str:
+    # only permanent redirects from the start of the chain are followed next time
+    redirect_rss = podcast.redirect_rss
+    if response is not None:
+        for redirect, next_response in itertools.pairwise(
+            [*response.history, response]
+        ):
+            if redirect.status_code not in _PERMANENT_REDIRECTS:
+                break
+            redirect_rss = str(next_response.url)
+    return redirect_rss
+
+
+def _parse_etag(response: httpx.Response) -> str:
+    return response.headers.get("ETag", "")
+
+
+def _parse_modified(response: httpx.Response) -> datetime | None:
+    return parse_date(response.headers.get("Last-Modified"))
+
+
+def _write_updates(updates: list[_PodcastUpdate]) -> None:
+    # podcasts with the same fields are updated in a single query
+    def _fields(update: _PodcastUpdate) -> list[str]:
+        return sorted(update.fields)
+
+    for fields, group in itertools.groupby(sorted(updates, key=_fields), key=_fields):
+        Podcast.objects.fast_update(
+            [Podcast(pk=update.podcast.pk, **update.fields) for update in group],
+            fields=fields,
+        )
+
+    if with_categories := [
+        update for update in updates if update.categories is not None
+    ]:
+        through = Podcast.categories.through
+
+        through.objects.filter(
+            podcast__in=[update.podcast for update in with_categories]
+        ).delete()
+
+        through.objects.bulk_create(
+            [
+                through(podcast_id=update.podcast.pk, category_id=category.pk)
+                for update in with_categories
+                for category in update.categories or []
+            ]
+        )
+
+    FetchMetrics.objects.bulk_create([update.metrics for update in updates])
+    FetchMetrics.objects.prune([update.podcast for update in updates])
+
+
+def _to_timedelta(seconds: float | None) -> timedelta | None:
+    return None if seconds is None else timedelta(seconds=seconds)
+
+
+def _tokenize_feed(feed: Feed, language: str) -> str:
+    text = " ".join(
+        value
+        for value in [
+            feed.title,
+            feed.description,
+            feed.owner,
+        ]
+        + sorted(feed.categories)
+        + [item.title for item in feed.items][:6]
+        if value
+    )
+    return " ".join(tokenizer.tokenize(language, text))
+
+
 class _FeedParser:
     """Updates a Podcast instance with its RSS or Atom feed source."""
 
-    _max_retries: Final = 3
+    # compressed content is decoded as it is streamed
+    _accept_encoding_header: Final = "br, zstd, gzip;q=0.9, deflate;q=0.5"
 
     _accept_header: Final = (
         "application/atom+xml,"
@@ -64,8 +448,16 @@ class _FeedParser:
         "*/*;q=0.1"
     )
 
-    def __init__(self, podcast: Podcast) -> None:
+    def __init__(
+        self,
+        podcast: Podcast,
+        executor: futures.Executor | None = None,
+        batch: PodcastUpdateBatch | None = None,
+    ) -> None:
         self._podcast = podcast
+        self._executor = executor
+        self._batch = batch
+        self._metrics = ParseMetrics()
 
     def parse(self, client: Client) -> None:
         """Syncs Podcast instance with RSS or Atom feed source.
@@ -78,40 +470,181 @@ class _FeedParser:
         """
         response: httpx.Response | None = None
         try:
-            response = self._get_response(client)
+            with (
+                self._handle_http_errors(),
+                client.stream(
+                    self._get_url(),
+                    headers=self._get_headers(),
+                    extensions=self._metrics.extensions(),
+                ) as response,
+            ):
+                self._metrics.response_received()
+                self._parse_response(response)
+        except FeedParserError as exc:
+            self._parse_error(exc, response or exc.response)
 
-            content_hash = self._make_content_hash(response)
-            self._check_duplicates(response, content_hash)
+    @contextlib.asynccontextmanager
+    async def fetch(self, client: AsyncClient) -> AsyncIterator[httpx.Response]:
+        """Fetches RSS or Atom feed source, streaming the response content.
 
-            self._parse_ok(
-                response=response,
-                content_hash=content_hash,
-                feed=rss_parser.parse_rss(response.content),
-            )
+        Raises:
+            FeedParserError: if feed cannot be fetched.
+        """
+        with self._handle_http_errors():
+            async with client.stream(
+                self._get_url(),
+                headers=self._get_headers(),
+                extensions=self._metrics.extensions(is_async=True),
+            ) as response:
+                self._metrics.response_received()
+                yield response
+
+    def parse_fetched(self, fetched: httpx.Response | FeedParserError) -> None:
+        """Syncs Podcast instance with fetched feed response, or the error raised when
+        fetching the response.
+
+        Raises:
+            FeedParserError: if any errors found in fetching or parsing the feed.
+        """
+        if isinstance(fetched, FeedParserError):
+            self._metrics = ParseMetrics.from_response(fetched.response)
+            self._parse_error(fetched, fetched.response)
+
+        self._metrics = ParseMetrics.from_response(fetched)
+
+        try:
+            with self._handle_http_errors():
+                self._parse_response(fetched)
         except FeedParserError as exc:
-            self._parse_error(exc, response or exc.response)
+            self._parse_error(exc, fetched)
+
+    def _parse_response(self, response: httpx.Response) -> None:
+        # content is hashed as it is streamed into the parser
+        hasher = hashlib.sha256()
+
+        prefix, chunks = self._read_prefix(self._iter_content(response, hasher))
+
+        content_fingerprint = make_content_fingerprint(
+            prefix, response.headers.get("Content-Length")
+        )
+
+        with tempfile.SpooledTemporaryFile(
+            max_size=_CONTENT_FINGERPRINT_SIZE
+        ) as spooled:
+            if len(prefix) < _CONTENT_FINGERPRINT_SIZE:
+                # all content has been read, so check hash before parsing
+                self._check_content_hash(hasher.hexdigest())
+
+            elif content_fingerprint == self._podcast.content_fingerprint:
+                # content is probably unchanged: read the rest of the content
+                # without parsing, and check hash to confirm
+                spooled.writelines(chunks)
+                self._check_content_hash(hasher.hexdigest())
+
+                spooled.seek(0)
+                chunks = iter(
+                    functools.partial(spooled.read, _CONTENT_FINGERPRINT_SIZE), b""
+                )
+
+            parsed = self._parse_content(itertools.chain([prefix], chunks))
+
+            # consume any remaining content after the closing </channel> tag
+            collections.deque(chunks, maxlen=0)
+
+        content_hash = hasher.hexdigest()
+
+        self._check_content_hash(content_hash)
+        self._check_duplicates(response, content_hash)
+
+        self._parse_ok(
+            response=response,
+            content_hash=content_hash,
+            content_fingerprint=content_fingerprint,
+            parsed=parsed,
+        )
+
+    def _parse_content(self, chunks: Iterator[bytes]) -> ParsedContent:
+        if self._executor is None:
+            return parse_content(chunks, self._podcast.language, self._metrics)
+
+        parsed = self._executor.submit(
+            parse_content, b"".join(chunks), self._podcast.language
+        ).result()
+
+        # add timings recorded in the executor
+        self._metrics.update(parsed.metrics)
+
+        return dataclasses.replace(parsed, metrics=self._metrics)
+
+    def _iter_content(
+        self, response: httpx.Response, hasher: "hashlib._Hash"
+    ) -> Iterator[bytes]:
+        chunks = response.iter_bytes()
+        content_length = 0
+
+        self._metrics.content_encoding = response.headers.get("Content-Encoding", "")
+
+        while True:
+            with self._metrics.measure("download_time"):
+                chunk = next(chunks, None)
+
+            if chunk is None:
+                return
+
+            content_length += len(chunk)
+            self._metrics.content_length = content_length
+            self._metrics.transfer_length = response.num_bytes_downloaded
+
+            hasher.update(chunk)
+            yield chunk
+
+    def _read_prefix(self, chunks: Iterator[bytes]) -> tuple[bytes, Iterator[bytes]]:
+        # read the start of the content, returning the remaining chunks
+        content = bytearray()
+        for chunk in chunks:
+            content += chunk
+            if len(content) >= _CONTENT_FINGERPRINT_SIZE:
+                break
+
+        return (
+            bytes(content[:_CONTENT_FINGERPRINT_SIZE]),
+            itertools.chain([bytes(content[_CONTENT_FINGERPRINT_SIZE:])], chunks),
+        )
+
+    def _check_content_hash(self, content_hash: str) -> None:
+        # check content hash has changed
+        if content_hash == self._podcast.content_hash:
+            raise NotModifiedError
 
     def _parse_ok(
         self,
         *,
         response: httpx.Response,
         content_hash: str,
-        feed: Feed,
+        content_fingerprint: str,
+        parsed: ParsedContent,
     ) -> None:
         categories_dct = get_categories()
+        feed = parsed.feed
 
         try:
             with transaction.atomic():
+                with self._metrics.measure("db_time"):
+                    self._metrics.num_rows = self._episode_updates(parsed)
+
                 self._podcast_update(
+                    categories=self._parse_categories(feed, categories_dct),
                     num_retries=0,
                     parser_error="",
                     content_hash=content_hash,
-                    rss=response.url,
+                    content_fingerprint=content_fingerprint,
+                    rss=str(response.url),
+                    redirect_rss="",
                     active=not (feed.complete),
-                    etag=self._parse_etag(response),
-                    modified=self._parse_modified(response),
+                    etag=_parse_etag(response),
+                    modified=_parse_modified(response),
                     keywords=self._parse_keywords(feed, categories_dct),
-                    extracted_text=self._tokenize_content(feed),
+                    extracted_text=parsed.extracted_text,
                     frequency=scheduler.schedule(feed),
                     **feed.model_dump(
                         exclude={
@@ -122,12 +655,6 @@ class _FeedParser:
                     ),
                 )
 
-                self._podcast.categories.set(
-                    self._parse_categories(feed, categories_dct)
-                )
-
-                self._episode_updates(feed)
-
         except DataError as exc:
             raise InvalidDataError from exc
 
@@ -135,54 +662,19 @@ class _FeedParser:
         self,
         exc: FeedParserError,
         response: httpx.Response | None = None,
-    ) -> None:
-        active: bool = True
-        num_retries: int = self._podcast.num_retries
-        frequency: timedelta | None = self._podcast.frequency
-
-        etag: str = self._podcast.etag
-        modified: datetime | None = self._podcast.modified
-
-        match exc:
-            case DuplicateError():
-                active = False
-
-            case NotModifiedError():
-                num_retries = 0
-
-            case _:
-                num_retries += 1
-
-        # if number of errors exceeds threshold then deactivate the podcast
-        active = active and self._max_retries > num_retries
-
-        if active:
-            # if still active, reschedule podcast and set etag and modified headers for next time
-
-            frequency = scheduler.reschedule(
-                self._podcast.pub_date, self._podcast.frequency
-            )
-
-            if response:
-                etag = self._parse_etag(response)
-                modified = self._parse_modified(response)
-
-        self._podcast_update(
-            active=active,
-            num_retries=num_retries,
-            frequency=frequency,
-            etag=etag,
-            modified=modified,
-            parser_error=exc.parser_error,
+    ) -> NoReturn:
+        self._add_update(
+            _make_error_update(self._podcast, exc, response, self._metrics)
         )
 
         # re-raise original exception
         raise exc
 
-    def _get_response(self, client: Client) -> httpx.Response:
+    @contextlib.contextmanager
+    def _handle_http_errors(self) -> Iterator[None]:
         try:
             try:
-                return client.get(self._podcast.rss, headers=self._get_headers())
+                yield
             except httpx.HTTPStatusError as exc:
                 if exc.response.is_redirect:
                     raise NotModifiedError(response=exc.response) from exc
@@ -192,47 +684,43 @@ class _FeedParser:
         except httpx.HTTPError as exc:
             raise UnavailableError from exc
 
-    def _make_content_hash(self, response: httpx.Response) -> str:
-        content_hash = make_content_hash(response.content)
-
-        # check content hash has changed
-        if content_hash == self._podcast.content_hash:
-            raise NotModifiedError
-
-        return content_hash
-
     def _check_duplicates(self, response: httpx.Response, content_hash: str) -> None:
+        # batched feeds are checked together before the batch is written
+        if self._batch is not None:
+            return
         # check no other podcast with this RSS URL or identical content
-        if (
-            Podcast.objects.exclude(pk=self._podcast.pk)
-            .filter(Q(rss=response.url) | Q(content_hash=content_hash))
-            .exists()
+        if duplicates.find_duplicates(
+            [(self._podcast.pk, str(response.url), content_hash)]
         ):
             raise DuplicateError
 
-    def _parse_etag(self, response: httpx.Response) -> str:
-        return response.headers.get("ETag", "")
-
-    def _parse_modified(self, response: httpx.Response) -> datetime | None:
-        return parse_date(response.headers.get("Last-Modified"))
+    def _get_url(self) -> str:
+        return self._podcast.redirect_rss or self._podcast.rss
 
     def _get_headers(self) -> dict[str, str]:
-        headers = {"Accept": self._accept_header}
+        headers = {
+            "Accept": self._accept_header,
+            "Accept-Encoding": self._accept_encoding_header,
+        }
         if self._podcast.etag:
             headers["If-None-Match"] = quote_etag(self._podcast.etag)
         if self._podcast.modified:
             headers["If-Modified-Since"] = http_date(self._podcast.modified.timestamp())
         return headers
 
-    def _podcast_update(self, **fields) -> None:
-        now = timezone.now()
-
-        Podcast.objects.filter(pk=self._podcast.pk).update(
-            updated=now,
-            parsed=now,
-            **fields,
+    def _podcast_update(
+        self, categories: list[Category] | None = None, **fields
+    ) -> None:
+        self._add_update(
+            _make_update(self._podcast, self._metrics, categories, **fields)
         )
 
+    def _add_update(self, update: _PodcastUpdate) -> None:
+        if self._batch is None:
+            _write_updates([update])
+        else:
+            self._batch.add(update)
+
     def _parse_keywords(self, feed: Feed, categories_dct: dict[str, Category]) -> str:
         return " ".join(
             [value for value in feed.categories if value not in categories_dct]
@@ -247,36 +735,33 @@ class _FeedParser:
             if value in categories_dct
         ]
 
-    def _tokenize_content(self, feed: Feed) -> str:
-        text = " ".join(
-            value
-            for value in [
-                feed.title,
-                feed.description,
-                feed.owner,
-            ]
-            + list(feed.categories)
-            + [item.title for item in feed.items][:6]
-            if value
-        )
-        return " ".join(tokenizer.tokenize(self._podcast.language, text))
-
-    def _episode_updates(self, feed: Feed) -> None:
+    def _episode_updates(self, parsed: ParsedContent) -> int:
+        # returns number of episodes deleted, updated or inserted
         qs = Episode.objects.filter(podcast=self._podcast)
 
         # remove any episodes that may have been deleted on the podcast
-        qs.exclude(guid__in={item.guid for item in feed.items}).delete()
+        _, deleted = qs.exclude(
+            guid__in={item.guid for item in parsed.feed.items}
+        ).delete()
+
+        num_rows = deleted.get(Episode._meta.label, 0)
 
         # determine new/current items based on presence of guid
 
-        guids = dict(qs.values_list("guid", "pk"))
+        guids = {
+            guid: (episode_id, content_hash)
+            for guid, episode_id, content_hash in qs.values_list(
+                "guid", "pk", "content_hash"
+            )
+        }
 
-        # update existing content
+        # update existing content, where changed
 
-        for batch in itertools.batched(self._episodes_for_update(feed, guids), 1000):
-            Episode.objects.fast_update(
+        for batch in itertools.batched(self._episodes_for_update(parsed, guids), 1000):
+            num_rows += Episode.objects.fast_update(
                 batch,
                 fields=[
+                    "content_hash",
                     "cover_url",
                     "description",
                     "duration",
@@ -295,29 +780,51 @@ class _FeedParser:
 
         # add new episodes
 
-        for batch in itertools.batched(self._episodes_for_insert(feed, guids), 100):
-            Episode.objects.bulk_create(batch, ignore_conflicts=True)
+        episodes = list(self._episodes_for_insert(parsed, guids))
+
+        if len(episodes) > settings.EPISODE_COPY_THRESHOLD:
+            num_rows += Episode.objects.copy_create(episodes)
+        else:
+            for batch in itertools.batched(episodes, 100):
+                num_rows += len(
+                    Episode.objects.bulk_create(batch, ignore_conflicts=True)
+                )
+
+        return num_rows
 
     def _episodes_for_insert(
-        self, feed: Feed, guids: dict[str, int]
+        self, parsed: ParsedContent, guids: dict[str, tuple[int, str]]
     ) -> Iterator[Episode]:
-        for item in feed.items:
+        for item, content_hash in zip(
+            parsed.feed.items, parsed.episode_hashes, strict=True
+        ):
             if item.guid not in guids:
-                yield self._make_episode(item)
+                yield self._make_episode(item, content_hash)
 
     def _episodes_for_update(
-        self, feed: Feed, guids: dict[str, int]
+        self, parsed: ParsedContent, guids: dict[str, tuple[int, str]]
     ) -> Iterator[Episode]:
         episode_ids = set()
 
-        for item in [item for item in feed.items if item.guid in guids]:
-            if (episode_id := guids[item.guid]) not in episode_ids:
-                yield self._make_episode(item, episode_id)
+        for item, content_hash in zip(
+            parsed.feed.items, parsed.episode_hashes, strict=True
+        ):
+            if item.guid not in guids:
+                continue
+            episode_id, current_hash = guids[item.guid]
+            if episode_id not in episode_ids:
                 episode_ids.add(episode_id)
+                # skip episodes unchanged since last update
+                if content_hash != current_hash:
+                    yield self._make_episode(item, content_hash, episode_id)
 
-    def _make_episode(self, item: Item, episode_id: int | None = None) -> Episode:
+    def _make_episode(
+        self, item: Item, content_hash: str, episode_id: int | None = None
+    ) -> Episode:
         return Episode(
             pk=episode_id,
             podcast=self._podcast,
-            **item.model_dump(exclude={"categories"}),
+            content_hash=content_hash,
+            # field values map directly to episode columns
+            **{field: value for field, value in item if field != "categories"},
         )
@@ -0,0 +1,55 @@
+from django.core.management.base import BaseCommand, CommandParser
+
+from radiofeed.feedparser import duplicates
+from radiofeed.podcasts.models import Podcast
+
+
+class Command(BaseCommand):
+    """Django management command to find podcasts with duplicate feeds."""
+
+    help = """Find podcasts with the same content or RSS URL."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--merge",
+            action="store_true",
+            help="Deactivate all but one podcast in each group of duplicates",
+        )
+
+    def handle(self, **options) -> None:
+        """Groups podcasts by content hash and normalized RSS or redirect URL.
+
+        The active podcast added first is kept in each group of duplicates.
+        """
+        clusters = duplicates.cluster_duplicates(
+            Podcast.objects.only(
+                "pk", "rss", "redirect_rss", "content_hash", "active"
+            ).iterator()
+        )
+
+        duplicate_ids: list[int] = []
+
+        for cluster in clusters:
+            canonical, *others = sorted(
+                cluster, key=lambda podcast: (not podcast.active, podcast.pk)
+            )
+
+            self.stdout.write(canonical.rss)
+
+            for podcast in others:
+                self.stdout.write(f"  {podcast.rss}")
+                duplicate_ids.append(podcast.pk)
+
+        if options["merge"]:
+            num_merged = Podcast.objects.filter(pk__in=duplicate_ids).update(
+                active=False,
+                parser_error=Podcast.ParserError.DUPLICATE,
+            )
+            self.stdout.write(
+                self.style.SUCCESS(f"{num_merged} duplicate podcasts deactivated")
+            )
+        else:
+            self.stdout.write(
+                self.style.SUCCESS(f"{len(duplicate_ids)} duplicate podcasts found")
+            )
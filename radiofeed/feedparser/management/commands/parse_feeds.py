@@ -1,11 +1,14 @@
+import contextlib
+import functools
+from collections.abc import Iterable, Iterator
+from concurrent import futures
+
 from django.core.management.base import BaseCommand, CommandParser
-from django.db.models import Count, F, QuerySet
 
-from radiofeed.feedparser import feed_parser
+from radiofeed.feedparser import feed_fetcher, feed_parser, scheduler
 from radiofeed.feedparser.exceptions import FeedParserError
-from radiofeed.http_client import Client, get_client
 from radiofeed.podcasts.models import Podcast
-from radiofeed.thread_pool import execute_thread_pool
+from radiofeed.process_pool import DjangoProcessPoolExecutor
 
 
 class Command(BaseCommand):
@@ -22,33 +25,132 @@ class Command(BaseCommand):
             default=360,
         )
 
+        parser.add_argument(
+            "--connections",
+            type=int,
+            help="Maximum number of feeds to fetch concurrently",
+            default=100,
+        )
+
+        parser.add_argument(
+            "--host-connections",
+            type=int,
+            help="Maximum number of feeds to fetch concurrently from the same host",
+            default=4,
+        )
+
+        parser.add_argument(
+            "--workers",
+            type=int,
+            help="Number of worker threads for parsing feeds and updating database",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--processes",
+            type=int,
+            help="Number of worker processes for parsing feed content. If not set, "
+            "feeds are parsed in the worker threads.",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            help="Number of podcast updates to write to the database together",
+            default=100,
+        )
+
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            help="Stop fetching feeds after this many seconds",
+            default=None,
+        )
+
+        parser.add_argument(
+            "--max-bytes",
+            type=int,
+            help="Stop fetching feeds after this many bytes have been downloaded",
+            default=None,
+        )
+
     def handle(
         self,
         **options,
     ) -> None:
         """Parses RSS feeds of all scheduled podcasts."""
-        client = get_client()
 
-        execute_thread_pool(
-            lambda podcast: self._parse_feed(podcast, client),
-            self._get_scheduled_podcasts(options["limit"]),
+        podcasts = scheduler.get_scheduled_podcasts(options["limit"])
+
+        with self._open_feed_fetcher(**options) as fetch_feeds:
+            self._fetch_feeds(fetch_feeds, podcasts, **options)
+
+    def _fetch_feeds(
+        self,
+        fetch_feeds: feed_fetcher.FetchFeeds,
+        podcasts: list[Podcast],
+        **options,
+    ) -> None:
+        budget = feed_fetcher.FetchBudget(
+            timeout=options["timeout"],
+            max_bytes=options["max_bytes"],
         )
 
-    def _get_scheduled_podcasts(self, limit: int) -> QuerySet[Podcast]:
+        if backlog := fetch_feeds(podcasts, budget):
+            # podcasts not fetched should be picked up again on the next run
+            scheduler.release_podcasts(backlog)
+
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Fetch budget spent: {len(backlog)} podcasts not fetched"
+                )
+            )
+
+    @contextlib.contextmanager
+    def _open_feed_fetcher(self, **options) -> Iterator[feed_fetcher.FetchFeeds]:
+        batch = feed_parser.PodcastUpdateBatch(options["batch_size"])
+
+        with (
+            self._open_process_pool(options["processes"]) as executor,
+            feed_fetcher.open_feed_fetcher(
+                functools.partial(self._parse_feed, executor=executor, batch=batch),
+                max_connections=options["connections"],
+                max_host_connections=options["host_connections"],
+                max_workers=options["workers"],
+            ) as fetch_feeds,
+        ):
+
+            def _fetch_feeds(
+                podcasts: Iterable[Podcast], budget: feed_fetcher.FetchBudget | None
+            ) -> list[Podcast]:
+                try:
+                    return fetch_feeds(podcasts, budget)
+                finally:
+                    # write any updates remaining once all feeds parsed
+                    batch.flush()
+
+            yield _fetch_feeds
+
+    def _open_process_pool(
+        self, processes: int | None
+    ) -> contextlib.AbstractContextManager[futures.Executor | None]:
         return (
-            Podcast.objects.scheduled()
-            .alias(subscribers=Count("subscriptions"))
-            .filter(active=True)
-            .order_by(
-                F("subscribers").desc(),
-                F("promoted").desc(),
-                F("parsed").asc(nulls_first=True),
-            )[:limit]
+            DjangoProcessPoolExecutor(processes)
+            if processes
+            else contextlib.nullcontext()
         )
 
-    def _parse_feed(self, podcast: Podcast, client: Client) -> None:
+    def _parse_feed(
+        self,
+        podcast: Podcast,
+        fetched: feed_fetcher.FetchedFeed,
+        *,
+        executor: futures.Executor | None = None,
+        batch: feed_parser.PodcastUpdateBatch | None = None,
+    ) -> None:
         try:
-            feed_parser.parse_feed(podcast, client)
+            feed_parser.parse_fetched_feed(podcast, fetched, executor, batch)
             self.stdout.write(self.style.SUCCESS(f"{podcast}: Success"))
         except FeedParserError as e:
             self.stdout.write(self.style.ERROR(f"{podcast}: {e.parser_error.label}"))
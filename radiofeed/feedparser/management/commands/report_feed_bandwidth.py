@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandParser
+from django.db.models import Avg, F, FloatField
+from django.db.models.functions import Cast, Extract, NullIf
+from django.template.defaultfilters import filesizeformat
+
+from radiofeed.podcasts.models import FetchMetrics
+
+
+class Command(BaseCommand):
+    """Django management command to list podcast feeds using the most bandwidth."""
+
+    help = """List podcast feeds using the most bandwidth."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--limit",
+            type=int,
+            help="Number of feeds to list",
+            default=20,
+        )
+
+    def handle(self, **options) -> None:
+        """Lists active podcasts by estimated bytes transferred per day.
+
+        Estimate is based on the average bytes transferred in recent fetches, and the
+        frequency at which the podcast is scheduled to be fetched.
+        """
+        rows = (
+            FetchMetrics.objects.filter(
+                podcast__active=True,
+                transfer_length__isnull=False,
+            )
+            .values("podcast__rss", "podcast__frequency")
+            .annotate(
+                transfer_length=Avg("transfer_length"),
+                content_length=Avg("content_length"),
+            )
+            .annotate(
+                daily_transfer_length=F("transfer_length")
+                * 24
+                * 60
+                * 60
+                / NullIf(
+                    Cast(Extract("podcast__frequency", "epoch"), FloatField()), 0.0
+                )
+            )
+            .order_by(F("daily_transfer_length").desc(nulls_last=True))
+        )[: options["limit"]]
+
+        for row in rows:
+            self.stdout.write(
+                f"{row['podcast__rss']}: "
+                f"{filesizeformat(row['daily_transfer_length'] or 0)}/day "
+                f"({filesizeformat(row['transfer_length'])} transferred, "
+                f"{filesizeformat(row['content_length'] or 0)} content, "
+                f"every {row['podcast__frequency']})"
+            )
@@ -0,0 +1,57 @@
+import signal
+import threading
+
+from django.core.management.base import CommandParser
+from django.db import close_old_connections
+
+from radiofeed.feedparser import scheduler
+from radiofeed.feedparser.management.commands import parse_feeds
+
+
+class Command(parse_feeds.Command):
+    """Django management command to continuously parse RSS feeds of scheduled
+    podcasts."""
+
+    help = """Run feed parser worker until stopped."""
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        super().add_arguments(parser)
+
+        parser.add_argument(
+            "--wait",
+            type=int,
+            help="Seconds to wait before checking again if no feeds are scheduled",
+            default=60,
+        )
+
+    def handle(self, **options) -> None:
+        """Parses RSS feeds in batches until SIGTERM or SIGINT is received.
+
+        Any batch in progress is completed before stopping.
+        """
+        stopped = threading.Event()
+
+        handlers = {
+            signum: signal.signal(signum, lambda *args: stopped.set())
+            for signum in (signal.SIGTERM, signal.SIGINT)
+        }
+
+        try:
+            self._run(stopped, **options)
+        finally:
+            for signum, handler in handlers.items():
+                signal.signal(signum, handler)
+
+        self.stdout.write("Feed worker stopped")
+
+    def _run(self, stopped: threading.Event, **options) -> None:
+        with self._open_feed_fetcher(**options) as fetch_feeds:
+            while not stopped.is_set():
+                # discard any connections broken while waiting
+                close_old_connections()
+
+                if podcasts := scheduler.get_scheduled_podcasts(options["limit"]):
+                    self._fetch_feeds(fetch_feeds, podcasts, **options)
+                else:
+                    stopped.wait(options["wait"])
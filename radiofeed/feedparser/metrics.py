@@ -0,0 +1,107 @@
+import contextlib
+import dataclasses
+import time
+from collections.abc import Iterator
+from typing import Any, Final
+
+import httpx
+
+_EXTENSION: Final = "parse_metrics"
+
+
+@dataclasses.dataclass(kw_only=True)
+class ParseMetrics:
+    """Timings (in seconds) and sizes recorded while fetching and parsing a feed.
+
+    Content length is the size of the decompressed content, and transfer length the
+    number of bytes received before decompression.
+    """
+
+    connect_time: float | None = None
+    ttfb: float | None = None
+    download_time: float | None = None
+    parse_time: float | None = None
+    validation_time: float | None = None
+    db_time: float | None = None
+
+    content_length: int | None = None
+    transfer_length: int | None = None
+    content_encoding: str | None = None
+    num_items: int | None = None
+    num_rows: int | None = None
+
+    started: float = dataclasses.field(
+        default_factory=time.perf_counter, init=False, repr=False, compare=False
+    )
+
+    _nested: list[float] = dataclasses.field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _connect_started: float | None = dataclasses.field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_response(cls, response: httpx.Response | None) -> "ParseMetrics":
+        """Returns metrics attached to the response request by `extensions()`, or new
+        metrics if none attached."""
+        if response is not None:
+            with contextlib.suppress(RuntimeError):
+                if metrics := response.request.extensions.get(_EXTENSION):
+                    return metrics
+        return cls()
+
+    def extensions(self, *, is_async: bool = False) -> dict[str, Any]:
+        """Returns HTTP request extensions for tracing connections."""
+        return {
+            "trace": self.atrace if is_async else self.trace,
+            _EXTENSION: self,
+        }
+
+    def trace(self, event_name: str, info: dict) -> None:
+        """Records connection time from HTTP trace events."""
+        now = time.perf_counter()
+        match event_name:
+            case "connection.connect_tcp.started":
+                self._connect_started = now
+            case (
+                "connection.connect_tcp.complete" | "connection.start_tls.complete"
+            ) if self._connect_started is not None:
+                self.connect_time = (
+                    (self.connect_time or 0.0) + now - self._connect_started
+                )
+                self._connect_started = now
+
+    async def atrace(self, event_name: str, info: dict) -> None:
+        """Records connection time from async HTTP trace events."""
+        self.trace(event_name, info)
+
+    def response_received(self) -> None:
+        """Records time to first byte, once response headers are received."""
+        self.ttfb = time.perf_counter() - self.started
+
+    def update(self, other: "ParseMetrics") -> None:
+        """Updates with any values recorded by other metrics e.g. in a worker process."""
+        for field in dataclasses.fields(self):
+            if field.init and (value := getattr(other, field.name)) is not None:
+                setattr(self, field.name, value)
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Adds time spent in the context to the named timing.
+
+        Any time measured for other timings within the context is excluded, so
+        for example parse time does not include time waiting for content to download.
+        """
+        self._nested.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._nested.pop()
+
+            setattr(self, name, (getattr(self, name) or 0.0) + elapsed - nested)
+
+            if self._nested:
+                self._nested[-1] += elapsed
@@ -1,9 +1,10 @@
 import contextlib
 import functools
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping
 from datetime import datetime
 from typing import Annotated, Any, ClassVar, Final, TypeVar
 
+import pydantic
 from django.core.exceptions import ValidationError
 from django.core.validators import URLValidator
 from django.utils import timezone
@@ -12,6 +13,9 @@ from pydantic import (
     BaseModel,
     BeforeValidator,
     Field,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    WrapValidator,
     field_validator,
     model_validator,
 )
@@ -94,6 +98,7 @@ def _default_if_none(value: Any, *, default: T) -> T:
     return default if value is None else value
 
 
+@functools.lru_cache(maxsize=1024)
 def _url(value: str | None) -> str:
     if value:
         if not value.startswith("http"):
@@ -225,10 +230,28 @@ class Item(BaseModel):
     @model_validator(mode="after")
     def validate_keywords(self) -> "Item":
         """Set default keywords."""
-        self.keywords = " ".join(filter(None, self.categories))
+        # sorted, so that episode content hashes are consistent between runs
+        self.keywords = " ".join(sorted(filter(None, self.categories)))
         return self
 
 
+def _none_if_invalid(value: Any, handler: ValidatorFunctionWrapHandler) -> Any:
+    try:
+        return handler(value)
+    except pydantic.ValidationError:
+        return None
+
+
+_items_adapter = TypeAdapter(
+    list[Annotated[Item | None, WrapValidator(_none_if_invalid)]]
+)
+
+
+def validate_items(values: Iterable[Mapping[str, Any]]) -> list[Item]:
+    """Validates all items in a single pass, dropping any invalid items."""
+    return [item for item in _items_adapter.validate_python(values) if item]
+
+
 class Feed(BaseModel):
     """RSS/Atom Feed model."""
 
@@ -1,12 +1,16 @@
+import collections
 import contextlib
 import functools
-from collections.abc import Iterator
-from typing import Final
+import itertools
+from collections.abc import Iterable
+from typing import Any, Final
 
+import lxml.etree
 from pydantic import ValidationError
 
 from radiofeed.feedparser.exceptions import InvalidRSSError
-from radiofeed.feedparser.models import Feed, Item
+from radiofeed.feedparser.metrics import ParseMetrics
+from radiofeed.feedparser.models import Feed, Item, validate_items
 from radiofeed.feedparser.xpath_parser import OptionalXmlElement, XPathParser
 
 
@@ -20,7 +24,27 @@ def parse_rss(content: bytes) -> Feed:
         InvalidRSSError: if XML content is unparseable, or the feed is otherwise invalid
         or empty.
     """
-    return _rss_parser().parse(content)
+    return parse_rss_stream([content])
+
+
+def parse_rss_stream(
+    chunks: Iterable[bytes], metrics: ParseMetrics | None = None
+) -> Feed:
+    """Parses RSS or Atom feed incrementally from chunks of content e.g. a streamed
+    HTTP response body.
+
+    Each item is parsed as soon as its element is closed, so the full content
+    is never held in memory.
+
+    Args:
+        chunks: the body of the RSS or Atom feed
+        metrics: records time spent validating the feed
+
+    Raises:
+        InvalidRSSError: if XML content is unparseable, or the feed is otherwise invalid
+        or empty.
+    """
+    return _rss_parser().parse(chunks, metrics or ParseMetrics())
 
 
 class _RSSParser:
@@ -35,16 +59,69 @@ class _RSSParser:
         "podcast": "https://podcastindex.org/namespace/1.0",
     }
 
+    # child element tag and attribute (or text if None) of each item field, in order
+    # of precedence
+    _ITEM_FIELDS: Final = {
+        "description": (
+            ("content:encoded", None),
+            ("description", None),
+            ("itunes:summary", None),
+        ),
+        "cover_url": (("itunes:image", "href"),),
+        "duration": (("itunes:duration", None),),
+        "episode": (("itunes:episode", None),),
+        "episode_type": (("itunes:episodetype", None),),
+        "explicit": (("itunes:explicit", None),),
+        "guid": (
+            ("guid", None),
+            ("atom:id", None),
+            ("link", None),
+        ),
+        "length": (
+            ("enclosure", "length"),
+            ("media:content", "fileSize"),
+        ),
+        "website": (("link", None),),
+        "media_type": (
+            ("enclosure", "type"),
+            ("media:content", "type"),
+        ),
+        "media_url": (
+            ("enclosure", "url"),
+            ("media:content", "url"),
+        ),
+        "pub_date": (
+            ("pubDate", None),
+            ("pubdate", None),
+        ),
+        "season": (("itunes:season", None),),
+        "title": (("title", None),),
+    }
+
     def __init__(self) -> None:
         self._parser = XPathParser(self._NAMESPACES)
+        self._item_fields = self._compile_item_fields()
 
-    def parse(self, content: bytes) -> Feed:
+    def parse(self, chunks: Iterable[bytes], metrics: ParseMetrics) -> Feed:
         """Parse content into Feed instance."""
-        if (channel := self._parser.find(content, "rss", "channel")) is None:
-            raise InvalidRSSError("No <channel /> element found in RSS feed.")
-        return self._parse_feed(channel)
+        items: list[dict[str, Any]] = []
+
+        with contextlib.suppress(lxml.etree.XMLSyntaxError):
+            for element in self._parser.iterstream(chunks, "item", "channel"):
+                match element.tag, self._parent_tag(element):
+                    case "item", "channel":
+                        items.append(self._parse_item(element))
+                    case "channel", "rss":
+                        with metrics.measure("validation_time"):
+                            return self._parse_feed(element, validate_items(items))
+
+        raise InvalidRSSError("No <channel /> element found in RSS feed.")
 
-    def _parse_feed(self, channel: OptionalXmlElement) -> Feed:
+    def _parent_tag(self, element: lxml.etree._Element) -> str | None:
+        parent = element.getparent()
+        return None if parent is None else parent.tag
+
+    def _parse_feed(self, channel: OptionalXmlElement, items: list[Item]) -> Feed:
         try:
             return Feed.model_validate(
                 {
@@ -89,68 +166,61 @@ class _RSSParser:
                         "itunes:author/text()",
                         "itunes:owner/itunes:name/text()",
                     ),
-                    "items": self._parse_items(channel),
+                    "items": items,
                 }
             )
         except ValidationError as exc:
             raise InvalidRSSError from exc
 
-    def _parse_items(self, channel: OptionalXmlElement) -> Iterator[Item]:
-        for item in self._parser.iterfind(channel, "item"):
-            with contextlib.suppress(ValidationError):
-                yield self._parse_item(item)
-
-    def _parse_item(self, item: OptionalXmlElement) -> Item:
-        return Item.model_validate(
-            {
-                "categories": self._parser.itervalues(
-                    item,
-                    "//itunes:category/@text",
-                ),
-                "description": self._parser.value(
-                    item,
-                    "content:encoded/text()",
-                    "description/text()",
-                    "itunes:summary/text()",
-                ),
-                "cover_url": self._parser.value(item, "itunes:image/@href"),
-                "duration": self._parser.value(item, "itunes:duration/text()"),
-                "episode": self._parser.value(item, "itunes:episode/text()"),
-                "episode_type": self._parser.value(
-                    item,
-                    "itunes:episodetype/text()",
-                ),
-                "explicit": self._parser.value(
-                    item,
-                    "itunes:explicit/text()",
-                ),
-                "guid": self._parser.value(
-                    item,
-                    "guid/text()",
-                    "atom:id/text()",
-                    "link/text()",
-                ),
-                "length": self._parser.value(
-                    item, "enclosure/@length", "media:content/@fileSize"
-                ),
-                "website": self._parser.value(item, "link/text()"),
-                "media_type": self._parser.value(
-                    item,
-                    "enclosure/@type",
-                    "media:content/@type",
-                ),
-                "media_url": self._parser.value(
+    def _parse_item(self, item: lxml.etree._Element) -> dict[str, Any]:
+        return {
+            # scoped to the item, as the rest of the document parsed so far depends
+            # on how the content is chunked
+            "categories": set(
+                self._parser.itervalues(
                     item,
-                    "enclosure/@url",
-                    "media:content/@url",
-                ),
-                "pub_date": self._parser.value(
-                    item, "pubDate/text()", "pubdate/text()"
-                ),
-                "season": self._parser.value(item, "itunes:season/text()"),
-                "title": self._parser.value(item, "title/text()"),
-            }
-        )
+                    ".//itunes:category/@text",
+                )
+            ),
+        } | self._extract_item(item)
+
+    def _extract_item(self, item: lxml.etree._Element) -> dict[str, str | None]:
+        # Single pass through child elements of the item, equivalent to calling
+        # XPathParser.value() with each field's paths: a value from an earlier path
+        # takes precedence, otherwise the first non-empty value in document order.
+        values: dict[str, str | None] = dict.fromkeys(self._ITEM_FIELDS)
+        priorities: dict[str, int] = {}
+
+        for child in item:
+            for field, priority, attr in self._item_fields.get(child.tag, ()):
+                if priorities.get(field, priority + 1) > priority and (
+                    value := self._child_value(child, attr)
+                ):
+                    values[field] = value
+                    priorities[field] = priority
+
+        return values
+
+    def _child_value(self, child: lxml.etree._Element, attr: str | None) -> str:
+        if attr:
+            return (child.get(attr) or "").strip()
+
+        # first non-empty text node, as with "text()"
+        for text in itertools.chain([child.text], (el.tail for el in child)):
+            if text and (cleaned := text.strip()):
+                return cleaned
+        return ""
+
+    def _compile_item_fields(self) -> dict[str, list[tuple[str, int, str | None]]]:
+        # maps each namespaced child tag to fields, path priority and attribute
+        item_fields = collections.defaultdict(list)
+        for field, paths in self._ITEM_FIELDS.items():
+            for priority, (tag, attr) in enumerate(paths):
+                prefix, _, name = tag.rpartition(":")
+                if prefix:
+                    name = f"{{{self._NAMESPACES[prefix]}}}{name}"
+                item_fields[name].append((field, priority, attr))
+        return dict(item_fields)
 
 
 @functools.cache
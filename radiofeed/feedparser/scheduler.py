@@ -1,27 +1,88 @@
 import itertools
+import math
+from collections.abc import Iterable
 from datetime import datetime, timedelta
+from typing import Final
 
+from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from radiofeed.feedparser.models import Feed
 from radiofeed.podcasts.models import Podcast
 
+# time before a claimed podcast is scheduled again, if not updated by the feed parser
+_CLAIM_TIMEOUT: Final = timedelta(minutes=30)
 
-def schedule(feed: Feed) -> timedelta:
-    """Estimates frequency of episodes in feed, based on the minimum of time intervals
-    between individual episodes."""
-    try:
-        frequency = min(
-            a - b
-            for a, b in itertools.pairwise(
-                sorted(
-                    [item.pub_date for item in feed.items],
-                    reverse=True,
-                )
+# number of most recent intervals between episodes used to estimate frequency
+_HISTORY_SIZE: Final = 12
+
+# weight of each interval in moving average, relative to the previous average
+_INTERVAL_WEIGHT: Final = 0.3
+
+# rate at which frequency is increased when no new episodes are released
+_BACKOFF_RATE: Final = 1.01
+
+
+def get_scheduled_podcasts(limit: int) -> list[Podcast]:
+    """Returns active podcasts due for update, by priority and then most overdue
+    first, so that podcasts with subscribers are not held back by other feeds.
+
+    The podcasts are claimed by rescheduling them, so that other processes running
+    at the same time do not fetch the same feeds. Rows locked by another process
+    are skipped rather than waited on.
+    """
+    now = timezone.now()
+
+    podcasts: list[Podcast] = []
+
+    with transaction.atomic():
+        # each priority, and podcasts never fetched, are queried separately so that
+        # each query is a range scan of the index, rather than filtering out podcasts
+        # of higher priority not yet due
+        for priority, due in itertools.product(
+            sorted(Podcast.Priority.values, reverse=True),
+            (Q(next_fetch_at__isnull=True), Q(next_fetch_at__lte=now)),
+        ):
+            if (remaining := limit - len(podcasts)) <= 0:
+                break
+
+            podcasts += (
+                Podcast.objects.filter(due, active=True, priority=priority)
+                .order_by("next_fetch_at")
+                .select_for_update(skip_locked=True)[:remaining]
             )
+
+        Podcast.objects.filter(pk__in=[podcast.pk for podcast in podcasts]).update(
+            next_fetch_at=timezone.now() + _CLAIM_TIMEOUT
         )
 
-    except ValueError:
+    return podcasts
+
+
+def release_podcasts(podcasts: Iterable[Podcast]) -> None:
+    """Restores schedule of podcasts claimed by `get_scheduled_podcasts()` but not
+    fetched, so that they are fetched again as soon as possible."""
+    Podcast.objects.bulk_update(podcasts, fields=["next_fetch_at"])
+
+
+def schedule(feed: Feed) -> timedelta:
+    """Estimates frequency of episodes in feed, based on an exponential moving average
+    of time intervals between the most recent episodes.
+
+    More recent intervals have greater weight, so changes in release schedule are
+    picked up quickly without a single short interval dominating the estimate.
+    """
+    pub_dates = sorted({item.pub_date for item in feed.items}, reverse=True)
+
+    intervals = [a - b for a, b in itertools.pairwise(pub_dates[: _HISTORY_SIZE + 1])]
+
+    if intervals:
+        # average from oldest to most recent interval
+        frequency = intervals.pop()
+        for interval in reversed(intervals):
+            frequency = interval * _INTERVAL_WEIGHT + frequency * (1 - _INTERVAL_WEIGHT)
+    else:
         frequency = Podcast.DEFAULT_PARSER_FREQUENCY
 
     # increment until pub date + freq > current time
@@ -29,8 +90,29 @@ def schedule(feed: Feed) -> timedelta:
     return reschedule(feed.pub_date, frequency)
 
 
+def next_fetch_at(
+    parsed: datetime, pub_date: datetime | None, frequency: timedelta | None
+) -> datetime:
+    """Returns time of next scheduled feed update.
+
+    This is the frequency added to the pub date (or last parsed, if no pub date),
+    within 1 hour-3 days of last parsed.
+    """
+    return min(
+        parsed + Podcast.MAX_PARSER_FREQUENCY,
+        max(
+            (pub_date or parsed) + (frequency or Podcast.DEFAULT_PARSER_FREQUENCY),
+            parsed + Podcast.MIN_PARSER_FREQUENCY,
+        ),
+    )
+
+
 def reschedule(pub_date: datetime | None, frequency: timedelta | None) -> timedelta:
-    """Increments update frequency until next scheduled date > current time."""
+    """Increments update frequency by 1% until next scheduled date > current time.
+
+    The number of increments is calculated directly rather than iterated, as this can
+    be large for podcasts which have not released episodes for a long time.
+    """
     if pub_date is None or frequency is None:
         return Podcast.DEFAULT_PARSER_FREQUENCY
 
@@ -38,10 +120,12 @@ def reschedule(pub_date: datetime | None, frequency: timedelta | None) -> timede
 
     frequency = frequency or Podcast.MIN_PARSER_FREQUENCY
 
-    now = timezone.now()
+    elapsed = timezone.now() - pub_date
 
-    while now > pub_date + frequency:
-        frequency += frequency * 0.01
+    if elapsed > frequency:
+        frequency *= _BACKOFF_RATE ** math.ceil(
+            math.log(elapsed / frequency, _BACKOFF_RATE)
+        )
 
     # ensure result falls within bounds
 
@@ -1,11 +1,19 @@
+import http
+import io
 import pathlib
+import signal
+from datetime import timedelta
 
+import httpx
 import pytest
 from django.core.management import call_command
+from django.utils import timezone
 
+from radiofeed.feedparser import feed_parser
 from radiofeed.feedparser.exceptions import DuplicateError
 from radiofeed.podcasts.models import Podcast
-from radiofeed.podcasts.tests.factories import PodcastFactory
+from radiofeed.podcasts.tests.factories import FetchMetricsFactory, PodcastFactory
+from radiofeed.process_pool import DjangoProcessPoolExecutor
 
 
 class TestParseOpml:
@@ -23,6 +31,7 @@ class TestParseOpml:
         podcast = Podcast.objects.first()
         assert podcast is not None
         assert podcast.promoted is False
+        assert podcast.priority == Podcast.Priority.DEFAULT
         patched.assert_called()
 
     @pytest.mark.django_db
@@ -33,6 +42,7 @@ class TestParseOpml:
         podcast = Podcast.objects.first()
         assert podcast is not None
         assert podcast.promoted is True
+        assert podcast.priority == Podcast.Priority.PROMOTED
         patched.assert_called()
 
     @pytest.mark.django_db
@@ -53,17 +63,102 @@ class TestExportFeeds:
         call_command("export_opml", "-", promoted=True)
 
 
+class TestFindDuplicateFeeds:
+    @pytest.fixture
+    def podcasts(self):
+        return [
+            PodcastFactory(rss="https://example.com/feed.xml", active=False),
+            PodcastFactory(rss="https://www.example.com/feed.xml/"),
+            PodcastFactory(rss="https://example.com/other.xml"),
+        ]
+
+    @pytest.mark.django_db
+    def test_find(self, podcasts):
+        out = io.StringIO()
+        call_command("find_duplicate_feeds", stdout=out)
+        assert "1 duplicate podcasts found" in out.getvalue()
+        assert not Podcast.objects.filter(
+            parser_error=Podcast.ParserError.DUPLICATE
+        ).exists()
+
+    @pytest.mark.django_db
+    def test_merge(self, podcasts):
+        out = io.StringIO()
+        call_command("find_duplicate_feeds", merge=True, stdout=out)
+        assert "1 duplicate podcasts deactivated" in out.getvalue()
+
+        duplicate, canonical, other = (
+            Podcast.objects.get(pk=podcast.pk) for podcast in podcasts
+        )
+
+        assert duplicate.parser_error == Podcast.ParserError.DUPLICATE
+        assert canonical.active
+        assert canonical.parser_error == ""
+        assert other.active
+
+
+class TestReportFeedBandwidth:
+    @pytest.mark.django_db
+    def test_report(self):
+        small = PodcastFactory(
+            rss="https://example.com/small.xml", frequency=timedelta(hours=12)
+        )
+        large = PodcastFactory(
+            rss="https://example.com/large.xml", frequency=timedelta(days=7)
+        )
+        frequent = PodcastFactory(
+            rss="https://example.com/frequent.xml", frequency=timedelta(hours=1)
+        )
+
+        FetchMetricsFactory(podcast=small, transfer_length=1000, content_length=5000)
+        FetchMetricsFactory(podcast=large, transfer_length=50000)
+        FetchMetricsFactory(podcast=frequent, transfer_length=10000)
+        FetchMetricsFactory(podcast=frequent, transfer_length=30000)
+        FetchMetricsFactory(transfer_length=None)
+        FetchMetricsFactory(podcast__active=False, transfer_length=100000)
+
+        out = io.StringIO()
+        call_command("report_feed_bandwidth", stdout=out)
+
+        lines = out.getvalue().splitlines()
+
+        assert [
+            line.split(":", 2)[0] + ":" + line.split(":", 2)[1] for line in lines
+        ] == [
+            "https://example.com/frequent.xml",
+            "https://example.com/large.xml",
+            "https://example.com/small.xml",
+        ]
+        assert "468.8\xa0KB/day" in lines[0]
+
+    @pytest.mark.django_db
+    def test_limit(self):
+        FetchMetricsFactory.create_batch(3, transfer_length=1000)
+        out = io.StringIO()
+        call_command("report_feed_bandwidth", limit=2, stdout=out)
+        assert len(out.getvalue().splitlines()) == 2
+
+
 class TestParseFeeds:
+    @pytest.fixture(autouse=True)
+    def mock_fetch(self, mocker):
+        mock_fetch = mocker.patch("radiofeed.feedparser.feed_parser.fetch_feed")
+        mock_fetch.return_value.__aenter__.return_value = httpx.Response(
+            http.HTTPStatus.OK,
+            request=httpx.Request("GET", "https://example.com"),
+        )
+        return mock_fetch
+
     @pytest.fixture
     def mock_parse_ok(self, mocker):
         return mocker.patch(
-            "radiofeed.feedparser.feed_parser.parse_feed",
+            "radiofeed.feedparser.feed_parser.parse_fetched_feed",
         )
 
     @pytest.fixture
     def mock_parse_fail(self, mocker):
         return mocker.patch(
-            "radiofeed.feedparser.feed_parser.parse_feed",
+            "radiofeed.feedparser.feed_parser.parse_fetched_feed",
             side_effect=DuplicateError(),
         )
 
@@ -73,6 +168,23 @@ class TestParseFeeds:
         call_command("parse_feeds")
         mock_parse_ok.assert_called()
 
+    @pytest.mark.django_db()(transaction=True)
+    def test_most_overdue_first(self, mock_parse_ok):
+        now = timezone.now()
+
+        PodcastFactory(next_fetch_at=now - timedelta(hours=1))
+        PodcastFactory(next_fetch_at=now - timedelta(hours=2))
+        PodcastFactory(next_fetch_at=now + timedelta(hours=1))
+        first = PodcastFactory(next_fetch_at=None)
+        second = PodcastFactory(next_fetch_at=now - timedelta(hours=3))
+
+        call_command("parse_feeds", limit=2)
+
+        assert {call.args[0] for call in mock_parse_ok.call_args_list} == {
+            first,
+            second,
+        }
+
     @pytest.mark.django_db()(transaction=True)
     def test_not_scheduled(self, mock_parse_ok):
         PodcastFactory(active=False)
@@ -84,3 +196,81 @@ class TestParseFeeds:
         PodcastFactory(pub_date=None)
         call_command("parse_feeds")
         mock_parse_fail.assert_called()
+
+    @pytest.mark.django_db()(transaction=True)
+    def test_connections(self, mock_parse_ok):
+        PodcastFactory.create_batch(3, pub_date=None)
+        call_command("parse_feeds", connections=1, workers=1)
+        assert mock_parse_ok.call_count == 3
+
+    @pytest.mark.django_db()(transaction=True)
+    def test_budget_spent(self, mock_parse_ok):
+        podcast = PodcastFactory(next_fetch_at=None)
+        out = io.StringIO()
+        call_command("parse_feeds", timeout=0, stdout=out)
+        mock_parse_ok.assert_not_called()
+
+        assert "1 podcasts not fetched" in out.getvalue()
+
+        podcast.refresh_from_db()
+        assert podcast.next_fetch_at is None
+
+    @pytest.mark.django_db()(transaction=True)
+    def test_processes(self, mock_parse_ok):
+        PodcastFactory(pub_date=None)
+        call_command("parse_feeds", processes=1)
+        assert isinstance(mock_parse_ok.call_args.args[2], DjangoProcessPoolExecutor)
+
+    @pytest.mark.django_db()(transaction=True)
+    def test_batch_flushed(self, mocker, mock_parse_ok):
+        mock_flush = mocker.patch(
+            "radiofeed.feedparser.feed_parser.PodcastUpdateBatch.flush"
+        )
+        PodcastFactory(pub_date=None)
+        call_command("parse_feeds", batch_size=10)
+        assert isinstance(
+            mock_parse_ok.call_args.args[3], feed_parser.PodcastUpdateBatch
+        )
+        mock_flush.assert_called()
+
+
+class TestRunFeedWorker:
+    @pytest.fixture(autouse=True)
+    def mock_fetch(self, mocker):
+        mock_fetch = mocker.patch("radiofeed.feedparser.feed_parser.fetch_feed")
+        mock_fetch.return_value.__aenter__.return_value = httpx.Response(
+            http.HTTPStatus.OK,
+            request=httpx.Request("GET", "https://example.com"),
+        )
+        return mock_fetch
+
+    @pytest.fixture
+    def mock_parse_ok(self, mocker):
+        return mocker.patch(
+            "radiofeed.feedparser.feed_parser.parse_fetched_feed",
+        )
+
+    @pytest.mark.django_db()(transaction=True)
+    def test_run(self, mocker, mock_parse_ok):
+        podcast = PodcastFactory()
+
+        def _get_scheduled_podcasts(limit):
+            if mock_scheduled.call_count == 1:
+                return [podcast]
+            if mock_scheduled.call_count == 3:
+                signal.raise_signal(signal.SIGTERM)
+            return []
+
+        mock_scheduled = mocker.patch(
+            "radiofeed.feedparser.scheduler.get_scheduled_podcasts",
+            side_effect=_get_scheduled_podcasts,
+        )
+
+        handler = signal.getsignal(signal.SIGTERM)
+
+        call_command("run_feed_worker", wait=0)
+
+        mock_parse_ok.assert_called_once()
+        assert mock_scheduled.call_count == 3
+
+        assert signal.getsignal(signal.SIGTERM) == handler
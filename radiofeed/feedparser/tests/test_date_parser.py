@@ -42,3 +42,37 @@ class TestParseDate:
 
     def test_invalid_str(self):
         assert parse_date("Fri, 33 June 2020 16:58:03 +0000") is None
+
+    def test_iso_8601(self):
+        dt = datetime.datetime(2020, 6, 19, 16, 58, 3, tzinfo=UTC)
+        assert parse_date("2020-06-19T16:58:03+00:00") == dt
+
+    def test_iso_8601_no_tz(self):
+        dt = datetime.datetime(2020, 6, 19, 16, 58, 3, tzinfo=UTC)
+        assert parse_date("2020-06-19T16:58:03") == dt
+
+    def test_mixed_formats(self):
+        dt = datetime.datetime(2020, 6, 19, 16, 58, 3, tzinfo=UTC)
+        assert parse_date("2020-06-19T16:58:03+00:00") == dt
+        assert parse_date("Fri, 19 Jun 2020 16:58:03 +0000") == dt
+        assert parse_date("2020-06-19T16:58:03+00:00") == dt
+
+    def test_named_tz(self):
+        dt = datetime.datetime(2020, 6, 19, 21, 58, 3, tzinfo=UTC)
+        assert parse_date("Fri, 19 Jun 2020 16:58:03 EST") == dt
+
+    def test_named_tz_offset_differs(self):
+        # email.utils has different offsets for these timezones
+        dt = datetime.datetime(2020, 6, 19, 13, 58, 3, tzinfo=UTC)
+        assert parse_date("Fri, 19 Jun 2020 16:58:03 AST") == dt
+
+        dt = datetime.datetime(2020, 6, 19, 12, 58, 3, tzinfo=UTC)
+        assert parse_date("Fri, 19 Jun 2020 16:58:03 ADT") == dt
+
+    def test_unknown_rfc_822_tz(self):
+        dt = datetime.datetime(2020, 6, 19, 10, 58, 3, tzinfo=UTC)
+        assert parse_date("Fri, 19 Jun 2020 16:58:03 BST") == dt
+
+    def test_long_day_name(self):
+        dt = datetime.datetime(2020, 6, 19, 16, 58, 3, tzinfo=UTC)
+        assert parse_date("Friday, 19 Jun 2020 16:58:03 +0000") == dt
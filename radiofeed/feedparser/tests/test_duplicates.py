@@ -0,0 +1,137 @@
+import pytest
+
+from radiofeed.feedparser.duplicates import (
+    cluster_duplicates,
+    find_duplicates,
+    normalize_url,
+)
+from radiofeed.podcasts.models import Podcast
+from radiofeed.podcasts.tests.factories import PodcastFactory
+
+
+class TestFindDuplicates:
+    @pytest.mark.django_db
+    def test_none(self, podcast):
+        assert (
+            find_duplicates([(podcast.pk, podcast.rss, podcast.content_hash)]) == set()
+        )
+
+    @pytest.mark.django_db
+    def test_empty(self):
+        assert find_duplicates([]) == set()
+
+    @pytest.mark.django_db
+    def test_same_url(self):
+        first = PodcastFactory(rss="https://example.com/first.xml")
+        second = PodcastFactory(rss="https://example.com/second.xml")
+
+        assert find_duplicates(
+            [
+                (first.pk, "https://example.com/second.xml", "abc"),
+                (second.pk, "https://example.com/new.xml", "def"),
+            ]
+        ) == {first.pk}
+
+    @pytest.mark.django_db
+    def test_same_content_hash(self):
+        first = PodcastFactory(content_hash="abc")
+        second = PodcastFactory(content_hash="def")
+
+        assert find_duplicates(
+            [
+                (first.pk, first.rss, "def"),
+                (second.pk, second.rss, "ghi"),
+            ]
+        ) == {first.pk}
+
+    @pytest.mark.django_db
+    def test_same_url_in_batch(self):
+        first, second, third = PodcastFactory.create_batch(3)
+
+        assert find_duplicates(
+            [
+                (first.pk, "https://example.com/new.xml", "abc"),
+                (second.pk, "https://example.com/new.xml", "def"),
+                (third.pk, "https://example.com/other.xml", "ghi"),
+            ]
+        ) == {second.pk}
+
+    @pytest.mark.django_db
+    def test_same_content_hash_in_batch(self):
+        first, second, third = PodcastFactory.create_batch(3)
+
+        assert find_duplicates(
+            [
+                (first.pk, first.rss, "abc"),
+                (second.pk, second.rss, "def"),
+                (third.pk, third.rss, "abc"),
+            ]
+        ) == {third.pk}
+
+    @pytest.mark.django_db
+    def test_empty_content_hash(self):
+        first = PodcastFactory(content_hash="")
+        second = PodcastFactory(content_hash="")
+
+        assert (
+            find_duplicates([(first.pk, first.rss, ""), (second.pk, second.rss, "")])
+            == set()
+        )
+
+
+class TestNormalizeUrl:
+    @pytest.mark.parametrize(
+        ("url", "expected"),
+        [
+            pytest.param(
+                "https://example.com/feed.xml", "example.com/feed.xml", id="https"
+            ),
+            pytest.param("http://www.example.com/feed/", "example.com/feed", id="www"),
+            pytest.param(" HTTP://Example.com/feed#top", "example.com/feed", id="case"),
+            pytest.param(
+                "https://example.com:8080/feed?id=1",
+                "example.com:8080/feed?id=1",
+                id="port and query",
+            ),
+        ],
+    )
+    def test_normalize(self, url, expected):
+        assert normalize_url(url) == expected
+
+
+class TestClusterDuplicates:
+    def test_clusters(self):
+        podcasts = [
+            Podcast(pk=1, rss="https://example.com/a.xml", content_hash="abc"),
+            Podcast(pk=2, rss="http://www.example.com/a.xml/", content_hash="def"),
+            Podcast(pk=3, rss="https://example.com/b.xml", content_hash="def"),
+            Podcast(pk=4, rss="https://example.com/c.xml", content_hash=""),
+            Podcast(pk=5, rss="https://example.com/d.xml", content_hash=""),
+            Podcast(pk=6, rss="https://example.com/e.xml", content_hash="ghi"),
+            Podcast(pk=7, rss="https://example.com/f.xml", content_hash="ghi"),
+        ]
+
+        assert [
+            [podcast.pk for podcast in cluster]
+            for cluster in cluster_duplicates(podcasts)
+        ] == [[1, 2, 3], [6, 7]]
+
+    def test_redirect_rss(self):
+        podcasts = [
+            Podcast(
+                pk=1,
+                rss="https://example.com/old.xml",
+                redirect_rss="https://example.com/new.xml",
+                content_hash="abc",
+            ),
+            Podcast(pk=2, rss="http://www.example.com/new.xml", content_hash="def"),
+            Podcast(pk=3, rss="https://example.com/other.xml", content_hash="ghi"),
+        ]
+
+        assert [
+            [podcast.pk for podcast in cluster]
+            for cluster in cluster_duplicates(podcasts)
+        ] == [[1, 2]]
+
+    def test_empty(self):
+        assert cluster_duplicates([]) == []
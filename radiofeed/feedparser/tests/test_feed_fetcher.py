@@ -0,0 +1,249 @@
+import gzip
+import http
+import logging
+
+import httpx
+import pytest
+
+from radiofeed.feedparser.exceptions import UnavailableError
+from radiofeed.feedparser.feed_fetcher import (
+    FetchBudget,
+    fetch_feeds,
+    interleave_by_host,
+    open_feed_fetcher,
+)
+from radiofeed.feedparser.feed_parser import parse_fetched_feed
+from radiofeed.podcasts.models import Podcast
+from radiofeed.podcasts.tests.factories import PodcastFactory
+
+
+class TestFetchBudget:
+    def test_no_limits(self):
+        assert FetchBudget().spent is False
+
+    def test_timeout(self):
+        assert FetchBudget(timeout=0).spent is True
+
+    def test_timeout_not_spent(self):
+        assert FetchBudget(timeout=60).spent is False
+
+    def test_max_bytes(self):
+        budget = FetchBudget(max_bytes=100)
+        assert budget.spent is False
+
+        budget.num_bytes += 100
+        assert budget.spent is True
+
+
+class TestInterleaveByHost:
+    def test_interleave(self):
+        podcasts = [
+            Podcast(rss="https://a.com/1"),
+            Podcast(rss="https://a.com/2"),
+            Podcast(rss="https://a.com/3"),
+            Podcast(rss="https://b.com/1"),
+            Podcast(rss="https://c.com/1"),
+            Podcast(rss="https://c.com/2"),
+        ]
+
+        assert [podcast.rss for podcast in interleave_by_host(podcasts)] == [
+            "https://a.com/1",
+            "https://b.com/1",
+            "https://c.com/1",
+            "https://a.com/2",
+            "https://c.com/2",
+            "https://a.com/3",
+        ]
+
+    def test_empty(self):
+        assert interleave_by_host([]) == []
+
+    def test_redirect_rss(self):
+        podcasts = [
+            Podcast(rss="https://a.com/1", redirect_rss="https://b.com/1"),
+            Podcast(rss="https://b.com/2"),
+            Podcast(rss="https://c.com/1"),
+        ]
+
+        assert [podcast.rss for podcast in interleave_by_host(podcasts)] == [
+            "https://a.com/1",
+            "https://c.com/1",
+            "https://b.com/2",
+        ]
+
+
+class TestFetchFeeds:
+    def test_ok(self):
+        fetched = {}
+
+        def _handle(request):
+            return httpx.Response(http.HTTPStatus.OK, stream=httpx.ByteStream(b"ok"))
+
+        fetch_feeds(
+            [Podcast(rss=f"https://{i}.example.com") for i in range(5)],
+            lambda podcast, response: fetched.update({podcast.rss: response.read()}),
+            max_connections=2,
+            max_host_connections=1,
+            max_workers=2,
+            transport=httpx.MockTransport(_handle),
+        )
+
+        assert len(fetched) == 5
+        assert all(content == b"ok" for content in fetched.values())
+
+    def test_budget_spent(self):
+        fetched = []
+
+        def _handle(request):
+            return httpx.Response(http.HTTPStatus.OK, stream=httpx.ByteStream(b"ok"))
+
+        podcasts = [Podcast(rss=f"https://{i}.example.com") for i in range(5)]
+
+        budget = FetchBudget(max_bytes=2)
+
+        backlog = fetch_feeds(
+            podcasts,
+            lambda podcast, response: fetched.append(response.read()),
+            budget,
+            max_connections=1,
+            transport=httpx.MockTransport(_handle),
+        )
+
+        assert fetched == [b"ok"]
+        assert budget.num_bytes == 2
+        assert backlog == podcasts[1:]
+
+    def test_compressed(self):
+        fetched = []
+
+        content = b"ok" * 1000
+        compressed = gzip.compress(content)
+
+        def _handle(request):
+            return httpx.Response(
+                http.HTTPStatus.OK,
+                stream=httpx.ByteStream(compressed),
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        def _fn(podcast, response):
+            fetched.append((response.read(), response.num_bytes_downloaded))
+
+        budget = FetchBudget()
+
+        fetch_feeds(
+            [Podcast(rss="https://example.com")],
+            _fn,
+            budget,
+            transport=httpx.MockTransport(_handle),
+        )
+
+        assert fetched == [(content, len(compressed))]
+        assert budget.num_bytes == len(compressed)
+
+    @pytest.mark.django_db(transaction=True)
+    @pytest.mark.parametrize(
+        "response",
+        [
+            pytest.param(
+                httpx.Response(http.HTTPStatus.NOT_MODIFIED),
+                id="not modified",
+            ),
+            pytest.param(
+                httpx.Response(
+                    http.HTTPStatus.OK,
+                    stream=httpx.ByteStream(b"not a feed"),
+                ),
+                id="invalid content",
+            ),
+        ],
+    )
+    def test_permanent_redirect(self, response):
+        podcast = PodcastFactory(rss="http://old.example.com/feed.xml")
+
+        def _handle(request):
+            if request.url.host == "old.example.com":
+                return httpx.Response(
+                    http.HTTPStatus.MOVED_PERMANENTLY,
+                    headers={"Location": "https://example.com/feed.xml"},
+                )
+            return response
+
+        fetch_feeds(
+            [podcast],
+            parse_fetched_feed,
+            transport=httpx.MockTransport(_handle),
+        )
+
+        podcast.refresh_from_db()
+
+        assert podcast.rss == "http://old.example.com/feed.xml"
+        assert podcast.redirect_rss == "https://example.com/feed.xml"
+
+    def test_error(self):
+        fetched = {}
+
+        def _handle(request):
+            raise httpx.HTTPError("fail")
+
+        fetch_feeds(
+            [Podcast(rss="https://example.com")],
+            lambda podcast, response: fetched.update({podcast.rss: response}),
+            transport=httpx.MockTransport(_handle),
+        )
+
+        assert isinstance(fetched["https://example.com"], UnavailableError)
+
+    def test_worker_exception(self, caplog):
+        fetched = []
+
+        def _handle(request):
+            return httpx.Response(http.HTTPStatus.OK)
+
+        def _fn(podcast, response):
+            if podcast.rss == "https://b.com/1":
+                raise ValueError("oops")
+            fetched.append(podcast.rss)
+
+        with caplog.at_level(logging.ERROR):
+            fetch_feeds(
+                [
+                    Podcast(rss="https://a.com/1"),
+                    Podcast(rss="https://b.com/1"),
+                    Podcast(rss="https://c.com/1"),
+                    Podcast(rss="https://a.com/2"),
+                ],
+                _fn,
+                transport=httpx.MockTransport(_handle),
+                max_connections=1,
+            )
+
+        assert sorted(fetched) == [
+            "https://a.com/1",
+            "https://a.com/2",
+            "https://c.com/1",
+        ]
+
+        assert len(caplog.records) == 1
+        assert caplog.records[0].getMessage() == "Error handling feed https://b.com/1"
+        assert caplog.records[0].exc_info[0] is ValueError
+
+    def test_empty(self):
+        fetch_feeds([], lambda podcast, response: None)
+
+
+class TestOpenFeedFetcher:
+    def test_batches(self):
+        fetched = []
+
+        def _handle(request):
+            return httpx.Response(http.HTTPStatus.OK, stream=httpx.ByteStream(b"ok"))
+
+        with open_feed_fetcher(
+            lambda podcast, response: fetched.append(podcast.rss),
+            transport=httpx.MockTransport(_handle),
+        ) as fetch:
+            fetch([Podcast(rss="https://example.com/1")], None)
+            fetch([Podcast(rss="https://example.com/2")], None)
+
+        assert fetched == ["https://example.com/1", "https://example.com/2"]
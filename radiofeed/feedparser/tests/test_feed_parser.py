@@ -1,5 +1,8 @@
+import asyncio
+import gzip
 import http
 import pathlib
+from concurrent import futures
 from datetime import datetime
 
 import httpx
@@ -8,6 +11,7 @@ from django.utils import timezone
 
 from radiofeed.episodes.models import Episode
 from radiofeed.episodes.tests.factories import EpisodeFactory
+from radiofeed.feedparser import duplicates, scheduler
 from radiofeed.feedparser.date_parser import parse_date
 from radiofeed.feedparser.exceptions import (
     DuplicateError,
@@ -18,13 +22,19 @@ from radiofeed.feedparser.exceptions import (
     UnavailableError,
 )
 from radiofeed.feedparser.feed_parser import (
+    PodcastUpdateBatch,
     _FeedParser,
+    fetch_feed,
     get_categories,
+    make_content_fingerprint,
     make_content_hash,
+    make_episode_hash,
+    parse_content,
     parse_feed,
+    parse_fetched_feed,
 )
-from radiofeed.http_client import Client
-from radiofeed.podcasts.models import Category, Podcast
+from radiofeed.http_client import AsyncClient, Client
+from radiofeed.podcasts.models import Category, FetchMetrics, Podcast
 from radiofeed.podcasts.tests.factories import PodcastFactory
 
 
@@ -38,6 +48,21 @@ def _mock_client(*, url="https://example.com", **response_kwargs):
     return Client(transport=httpx.MockTransport(_handle))
 
 
+def _mock_async_client(**response_kwargs):
+    def _handle(request):
+        response = httpx.Response(**response_kwargs)
+        response.request = request
+        return response
+
+    return AsyncClient(transport=httpx.MockTransport(_handle))
+
+
+async def _fetch_feed(podcast, client):
+    async with client, fetch_feed(podcast, client) as response:
+        await response.aread()
+        return response
+
+
 def _mock_error_client(exc):
     def _handle(request):
         raise exc
@@ -56,6 +81,24 @@ class TestMakeContentHash:
         assert make_content_hash(content_a) != make_content_hash(content_b)
 
 
+class TestMakeContentFingerprint:
+    def test_same_content(self):
+        content = _get_mock_file_path("rss_mock.xml").read_bytes()
+        assert make_content_fingerprint(content, "100") == make_content_fingerprint(
+            content, "100"
+        )
+
+    def test_different_length(self):
+        content = _get_mock_file_path("rss_mock.xml").read_bytes()
+        assert make_content_fingerprint(content, "100") != make_content_fingerprint(
+            content, "200"
+        )
+
+    def test_no_length(self):
+        content = _get_mock_file_path("rss_mock.xml").read_bytes()
+        assert make_content_fingerprint(content).startswith(":")
+
+
 class TestFeedParser:
     mock_file = "rss_mock.xml"
     rss = "https://mysteriousuniverse.org/feed/podcast/"
@@ -155,9 +198,27 @@ class TestFeedParser:
         assert podcast.content_hash
         assert podcast.title == "Mysterious Universe"
 
+        assert podcast.next_fetch_at == scheduler.next_fetch_at(
+            podcast.parsed, podcast.pub_date, podcast.frequency
+        )
+
         assert podcast.description == "Blog and Podcast specializing in offbeat news"
         assert podcast.owner == "8th Kind"
 
+        metrics = FetchMetrics.objects.get(podcast=podcast)
+
+        assert metrics.parser_error == ""
+        assert metrics.content_length == len(self.get_rss_content())
+        assert metrics.num_items == 20
+        # 1 deleted, 1 updated, 19 inserted
+        assert metrics.num_rows == 21
+
+        assert metrics.ttfb is not None
+        assert metrics.download_time is not None
+        assert metrics.parse_time is not None
+        assert metrics.validation_time is not None
+        assert metrics.db_time is not None
+
         tokens = set(podcast.extracted_text.split())
 
         assert tokens == set(
@@ -186,6 +247,56 @@ class TestFeedParser:
         assert "Society & Culture" in assigned_categories
         assert "Philosophy" in assigned_categories
 
+    @pytest.mark.django_db
+    def test_parse_unchanged_episodes(self, mocker, categories):
+        podcast = PodcastFactory(
+            rss="https://mysteriousuniverse.org/feed/podcast/",
+        )
+
+        content = self.get_rss_content()
+
+        parse_feed(
+            podcast,
+            _mock_client(
+                url=podcast.rss,
+                status_code=http.HTTPStatus.OK,
+                content=content,
+            ),
+        )
+
+        assert podcast.episodes.count() == 20
+
+        # modify a single episode
+        episode = podcast.episodes.first()
+        assert episode.content_hash
+
+        Episode.objects.filter(pk=episode.pk).update(
+            title="original title", content_hash="modified"
+        )
+
+        podcast.refresh_from_db()
+        podcast.content_hash = ""
+
+        mock_fast_update = mocker.spy(Episode.objects, "fast_update")
+
+        parse_feed(
+            podcast,
+            _mock_client(
+                url=podcast.rss,
+                status_code=http.HTTPStatus.OK,
+                content=content,
+            ),
+        )
+
+        batch = mock_fast_update.call_args.args[0]
+
+        assert len(batch) == 1
+        assert batch[0].pk == episode.pk
+
+        episode.refresh_from_db()
+        assert episode.title != "original title"
+        assert episode.content_hash != "modified"
+
     @pytest.mark.django_db
     def test_parse_links_as_ids(self, categories):
         podcast = PodcastFactory(
@@ -215,6 +326,28 @@ class TestFeedParser:
         assert podcast.title == "Varsovia Vento Podkasto"
         assert podcast.pub_date == parse_date("July 27, 2023 2:00+0000")
 
+    @pytest.mark.django_db
+    def test_parse_copy_episodes(self, mocker, settings, categories):
+        settings.EPISODE_COPY_THRESHOLD = 100
+
+        mock_bulk_create = mocker.spy(Episode.objects, "bulk_create")
+
+        podcast = PodcastFactory(
+            rss="https://feeds.feedburner.com/VarsoviaVentoPodkasto"
+        )
+        client = _mock_client(
+            url=podcast.rss,
+            status_code=http.HTTPStatus.OK,
+            content=self.get_rss_content("rss_use_link_ids.xml"),
+        )
+
+        parse_feed(podcast, client)
+
+        assert podcast.episodes.count() == 373
+        assert all(episode.content_hash for episode in podcast.episodes.all())
+
+        mock_bulk_create.assert_not_called()
+
     @pytest.mark.django_db
     def test_parse_high_num_episodes(self, categories):
         podcast = PodcastFactory()
@@ -306,9 +439,14 @@ class TestFeedParser:
     @pytest.mark.django_db
     def test_parse_same_content(self, mocker, categories):
         content = self.get_rss_content()
-        podcast = PodcastFactory(content_hash=make_content_hash(content))
+        podcast = PodcastFactory(
+            content_hash=make_content_hash(content),
+            content_fingerprint=make_content_fingerprint(content, str(len(content))),
+        )
 
-        mock_parse_rss = mocker.patch("radiofeed.feedparser.rss_parser.parse_rss")
+        mock_parse_rss = mocker.patch(
+            "radiofeed.feedparser.rss_parser.parse_rss_stream"
+        )
 
         client = _mock_client(
             status_code=http.HTTPStatus.OK,
@@ -334,11 +472,76 @@ class TestFeedParser:
         mock_parse_rss.assert_not_called()
 
     @pytest.mark.django_db
-    def test_parse_podcast_another_feed_same_content(self, mocker, podcast, categories):
+    def test_parse_same_content_no_fingerprint(self, categories):
+        content = self.get_rss_content()
+        podcast = PodcastFactory(content_hash=make_content_hash(content))
+
+        client = _mock_client(
+            status_code=http.HTTPStatus.OK,
+            content=content,
+        )
+
+        with pytest.raises(NotModifiedError):
+            parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == Podcast.ParserError.NOT_MODIFIED
+
+    @pytest.mark.django_db
+    def test_parse_same_content_small_feed(self, mocker, categories):
+        content = self.get_rss_content("rss_mock_small.xml")
+        podcast = PodcastFactory(content_hash=make_content_hash(content))
+
+        mock_parse_rss = mocker.patch(
+            "radiofeed.feedparser.rss_parser.parse_rss_stream"
+        )
+
+        client = _mock_client(
+            status_code=http.HTTPStatus.OK,
+            content=content,
+        )
+
+        with pytest.raises(NotModifiedError):
+            parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == Podcast.ParserError.NOT_MODIFIED
+
+        mock_parse_rss.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_parse_same_fingerprint_modified_content(self, categories):
+        content = self.get_rss_content()
+        podcast = PodcastFactory(
+            content_hash="modified",
+            content_fingerprint=make_content_fingerprint(content, str(len(content))),
+        )
+
+        client = _mock_client(
+            url=podcast.rss,
+            status_code=http.HTTPStatus.OK,
+            content=content,
+        )
+
+        parse_feed(podcast, client)
+
+        assert podcast.episodes.count() == 20
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == ""
+        assert podcast.content_hash == make_content_hash(content)
+        assert podcast.content_fingerprint == make_content_fingerprint(
+            content, str(len(content))
+        )
+
+    @pytest.mark.django_db
+    def test_parse_podcast_another_feed_same_content(self, podcast, categories):
         content = self.get_rss_content()
 
         PodcastFactory(content_hash=make_content_hash(content))
-        mock_parse_rss = mocker.patch("radiofeed.feedparser.rss_parser.parse_rss")
 
         client = _mock_client(
             url="https://example.com/other.rss",
@@ -362,8 +565,6 @@ class TestFeedParser:
         assert podcast.modified is None
         assert podcast.parsed
 
-        mock_parse_rss.assert_not_called()
-
     @pytest.mark.django_db
     def test_parse_complete(self, podcast, categories):
         episode_guid = "https://mysteriousuniverse.org/?p=168097"
@@ -550,6 +751,141 @@ class TestFeedParser:
         assert podcast.parsed
         assert podcast.num_retries == 1
 
+    @pytest.mark.django_db
+    def test_parse_compressed(self, podcast, categories):
+        content = self.get_rss_content()
+        compressed = gzip.compress(content)
+
+        def _handle(request):
+            assert "gzip" in request.headers["Accept-Encoding"]
+            return httpx.Response(
+                http.HTTPStatus.OK,
+                stream=httpx.ByteStream(compressed),
+                headers={"Content-Encoding": "gzip"},
+            )
+
+        parse_feed(podcast, Client(transport=httpx.MockTransport(_handle)))
+
+        podcast.refresh_from_db()
+
+        assert podcast.title == "Mysterious Universe"
+
+        metrics = FetchMetrics.objects.get(podcast=podcast)
+
+        assert metrics.content_encoding == "gzip"
+        assert metrics.content_length == len(content)
+        assert metrics.transfer_length == len(compressed)
+
+    @pytest.mark.django_db
+    def test_parse_redirect_not_modified(self, categories):
+        podcast = PodcastFactory(rss="http://old.example.com/feed.xml")
+
+        def _handle(request):
+            if request.url.host == "old.example.com":
+                return httpx.Response(
+                    http.HTTPStatus.MOVED_PERMANENTLY,
+                    headers={"Location": "https://www.example.com/feed.xml"},
+                )
+            if request.url.host == "www.example.com":
+                return httpx.Response(
+                    http.HTTPStatus.PERMANENT_REDIRECT,
+                    headers={"Location": "https://example.com/feed.xml"},
+                )
+            return httpx.Response(http.HTTPStatus.NOT_MODIFIED)
+
+        client = Client(transport=httpx.MockTransport(_handle))
+
+        with pytest.raises(NotModifiedError):
+            parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert podcast.rss == "http://old.example.com/feed.xml"
+        assert podcast.redirect_rss == "https://example.com/feed.xml"
+
+    @pytest.mark.django_db
+    def test_parse_temporary_redirect(self, categories):
+        podcast = PodcastFactory(rss="https://old.example.com/feed.xml")
+
+        def _handle(request):
+            if request.url.host == "old.example.com":
+                return httpx.Response(
+                    http.HTTPStatus.FOUND,
+                    headers={"Location": "https://example.com/feed.xml"},
+                )
+            return httpx.Response(http.HTTPStatus.NOT_MODIFIED)
+
+        client = Client(transport=httpx.MockTransport(_handle))
+
+        with pytest.raises(NotModifiedError):
+            parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert podcast.redirect_rss == ""
+
+    @pytest.mark.django_db
+    def test_parse_redirect_rss(self, categories):
+        podcast = PodcastFactory(
+            rss="https://old.example.com/feed.xml",
+            redirect_rss="https://example.com/feed.xml",
+        )
+
+        requested = []
+
+        def _handle(request):
+            requested.append(str(request.url))
+            return httpx.Response(http.HTTPStatus.NOT_MODIFIED)
+
+        client = Client(transport=httpx.MockTransport(_handle))
+
+        with pytest.raises(NotModifiedError):
+            parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert requested == ["https://example.com/feed.xml"]
+        assert podcast.redirect_rss == "https://example.com/feed.xml"
+
+    @pytest.mark.django_db
+    def test_parse_redirect_rss_ok(self, categories):
+        podcast = PodcastFactory(
+            rss="https://old.example.com/feed.xml",
+            redirect_rss="https://example.com/feed.xml",
+        )
+
+        client = Client(
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    http.HTTPStatus.OK, content=self.get_rss_content()
+                )
+            )
+        )
+
+        parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert podcast.rss == "https://example.com/feed.xml"
+        assert podcast.redirect_rss == ""
+
+    @pytest.mark.django_db
+    def test_parse_redirect_rss_unavailable(self, categories):
+        podcast = PodcastFactory(
+            rss="https://old.example.com/feed.xml",
+            redirect_rss="https://example.com/feed.xml",
+        )
+
+        client = _mock_client(status_code=http.HTTPStatus.INTERNAL_SERVER_ERROR)
+
+        with pytest.raises(UnavailableError):
+            parse_feed(podcast, client)
+
+        podcast.refresh_from_db()
+
+        assert podcast.rss == "https://old.example.com/feed.xml"
+        assert podcast.redirect_rss == ""
+
     @pytest.mark.django_db
     def test_parse_not_modified(self, podcast, categories):
         client = _mock_client(
@@ -570,6 +906,15 @@ class TestFeedParser:
         assert podcast.parsed
         assert podcast.num_retries == 0
 
+        metrics = FetchMetrics.objects.get(podcast=podcast)
+
+        assert metrics.parser_error == Podcast.ParserError.NOT_MODIFIED
+        assert metrics.parse_time is None
+
+        assert podcast.next_fetch_at == scheduler.next_fetch_at(
+            podcast.parsed, podcast.pub_date, podcast.frequency
+        )
+
     @pytest.mark.django_db
     def test_parse_http_gone(self, podcast, categories):
         client = _mock_client(
@@ -633,3 +978,344 @@ class TestFeedParser:
         assert podcast.active is False
         assert podcast.parsed
         assert podcast.num_retries == 4
+
+
+class TestParseContent:
+    def test_parse_bytes(self):
+        parsed = parse_content(_get_mock_file_path("rss_mock.xml").read_bytes(), "en")
+
+        assert parsed.feed.title == "Mysterious Universe"
+        assert "mysterious" in parsed.extracted_text.split()
+        assert parsed.episode_hashes == [
+            make_episode_hash(item) for item in parsed.feed.items
+        ]
+
+    def test_parse_chunks(self):
+        content = _get_mock_file_path("rss_mock.xml").read_bytes()
+
+        assert parse_content(
+            [content[i : i + 1024] for i in range(0, len(content), 1024)], "en"
+        ) == parse_content(content, "en")
+
+
+class TestFetchFeed:
+    @pytest.fixture(autouse=True)
+    def _clear_categories_cache(self):
+        get_categories.cache_clear()
+
+    def get_rss_content(self):
+        return _get_mock_file_path("rss_mock.xml").read_bytes()
+
+    @pytest.mark.django_db
+    def test_parse_ok(self, podcast):
+        client = _mock_async_client(
+            status_code=http.HTTPStatus.OK,
+            content=self.get_rss_content(),
+        )
+
+        parse_fetched_feed(podcast, asyncio.run(_fetch_feed(podcast, client)))
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == ""
+        assert podcast.title == "Mysterious Universe"
+        assert podcast.episodes.count() == 20
+
+    @pytest.mark.django_db
+    def test_parse_ok_executor(self, podcast):
+        client = _mock_async_client(
+            status_code=http.HTTPStatus.OK,
+            content=self.get_rss_content(),
+        )
+
+        with futures.ThreadPoolExecutor() as executor:
+            parse_fetched_feed(
+                podcast, asyncio.run(_fetch_feed(podcast, client)), executor
+            )
+
+        podcast.refresh_from_db()
+
+        metrics = FetchMetrics.objects.get(podcast=podcast)
+
+        assert metrics.ttfb is not None
+        assert metrics.parse_time is not None
+        assert metrics.num_items == 20
+
+        assert podcast.parser_error == ""
+        assert podcast.title == "Mysterious Universe"
+        assert podcast.episodes.count() == 20
+
+    @pytest.mark.django_db
+    def test_parse_not_modified(self, podcast):
+        client = _mock_async_client(status_code=http.HTTPStatus.NOT_MODIFIED)
+
+        with pytest.raises(NotModifiedError) as exc_info:
+            asyncio.run(_fetch_feed(podcast, client))
+
+        with pytest.raises(NotModifiedError):
+            parse_fetched_feed(podcast, exc_info.value)
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == Podcast.ParserError.NOT_MODIFIED
+        assert podcast.active
+        assert podcast.parsed
+
+    @pytest.mark.django_db
+    def test_parse_http_gone(self, podcast):
+        client = _mock_async_client(status_code=http.HTTPStatus.GONE)
+
+        with pytest.raises(InaccessibleError) as exc_info:
+            asyncio.run(_fetch_feed(podcast, client))
+
+        with pytest.raises(InaccessibleError):
+            parse_fetched_feed(podcast, exc_info.value)
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == Podcast.ParserError.INACCESSIBLE
+        assert podcast.num_retries == 1
+
+    @pytest.mark.django_db
+    def test_parse_stream_error(self, podcast):
+        class _ErrorStream(httpx.SyncByteStream):
+            def __iter__(self):
+                raise httpx.ReadError("fail")
+
+        response = httpx.Response(
+            http.HTTPStatus.OK,
+            stream=_ErrorStream(),
+            request=httpx.Request("GET", podcast.rss),
+        )
+
+        with pytest.raises(UnavailableError):
+            parse_fetched_feed(podcast, response)
+
+        podcast.refresh_from_db()
+
+        assert podcast.parser_error == Podcast.ParserError.UNAVAILABLE
+        assert podcast.num_retries == 1
+
+
+class TestPodcastUpdateBatch:
+    @pytest.fixture(autouse=True)
+    def _clear_categories_cache(self):
+        get_categories.cache_clear()
+
+    @pytest.mark.django_db
+    def test_flush(self):
+        podcasts = PodcastFactory.create_batch(3, parsed=None)
+
+        batch = PodcastUpdateBatch()
+
+        content = _get_mock_file_path("rss_mock.xml").read_bytes()
+
+        for podcast in podcasts:
+            parse_fetched_feed(
+                podcast,
+                httpx.Response(
+                    http.HTTPStatus.OK,
+                    # feeds with identical content would be duplicates
+                    content=content + f"<!-- {podcast.pk} -->".encode(),
+                    request=httpx.Request("GET", podcast.rss),
+                ),
+                batch=batch,
+            )
+
+        # episodes are written immediately
+        assert Episode.objects.count() == 60
+        assert not Podcast.objects.filter(parsed__isnull=False).exists()
+
+        batch.flush()
+
+        for podcast in podcasts:
+            podcast.refresh_from_db()
+            assert podcast.parsed
+            assert podcast.title == "Mysterious Universe"
+            assert podcast.categories.exists()
+
+        assert FetchMetrics.objects.count() == 3
+
+    @pytest.mark.django_db
+    def test_flush_empty(self):
+        PodcastUpdateBatch().flush()
+
+    @pytest.mark.django_db
+    def test_batch_full(self):
+        podcasts = PodcastFactory.create_batch(3, parsed=None)
+
+        batch = PodcastUpdateBatch(batch_size=2)
+
+        for podcast in podcasts:
+            _FeedParser(podcast, batch=batch)._podcast_update(parser_error="")
+
+        assert Podcast.objects.filter(parsed__isnull=False).count() == 2
+
+        batch.flush()
+
+        assert Podcast.objects.filter(parsed__isnull=False).count() == 3
+
+    @pytest.mark.django_db
+    def test_same_podcast(self, podcast):
+        batch = PodcastUpdateBatch()
+
+        _FeedParser(podcast, batch=batch)._podcast_update(
+            parser_error="", title="first"
+        )
+        _FeedParser(podcast, batch=batch)._podcast_update(
+            parser_error="", title="second"
+        )
+
+        podcast.refresh_from_db()
+        assert podcast.title == "first"
+
+        batch.flush()
+
+        podcast.refresh_from_db()
+        assert podcast.title == "second"
+
+        assert FetchMetrics.objects.filter(podcast=podcast).count() == 2
+
+    @pytest.mark.django_db
+    def test_invalid_data(self):
+        first, second = PodcastFactory.create_batch(2, parsed=None)
+
+        batch = PodcastUpdateBatch()
+
+        # integer out of range
+        _FeedParser(first, batch=batch)._podcast_update(
+            parser_error="", num_retries=2**40
+        )
+        _FeedParser(second, batch=batch)._podcast_update(parser_error="", title="ok")
+
+        batch.flush()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        assert first.parser_error == Podcast.ParserError.INVALID_DATA
+        assert first.num_retries == 1
+        assert first.parsed
+
+        assert second.parser_error == ""
+        assert second.title == "ok"
+
+    @pytest.mark.django_db
+    def test_same_rss(self):
+        first, second = PodcastFactory.create_batch(
+            2, parsed=None, content_hash="old", content_fingerprint="old"
+        )
+
+        batch = PodcastUpdateBatch()
+
+        # both feeds redirect to the same URL
+        for podcast, content_hash in [(first, "first"), (second, "second")]:
+            _FeedParser(podcast, batch=batch)._podcast_update(
+                parser_error="",
+                rss="https://example.com/rss.xml",
+                content_hash=content_hash,
+                content_fingerprint=content_hash,
+            )
+
+        batch.flush()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        assert first.parser_error == ""
+        assert first.rss == "https://example.com/rss.xml"
+        assert first.content_hash == "first"
+
+        assert second.parser_error == Podcast.ParserError.DUPLICATE
+        assert not second.active
+        assert second.content_hash == ""
+        assert second.content_fingerprint == ""
+
+        assert FetchMetrics.objects.count() == 2
+
+    @pytest.mark.django_db
+    def test_same_rss_not_found(self, mocker):
+        first, second = PodcastFactory.create_batch(2, parsed=None)
+
+        batch = PodcastUpdateBatch()
+
+        # another process writes the same URL after the duplicate check
+        mocker.patch(
+            "radiofeed.feedparser.feed_parser.duplicates.find_duplicates",
+            return_value=set(),
+        )
+
+        for podcast, content_hash in [(first, "first"), (second, "second")]:
+            _FeedParser(podcast, batch=batch)._podcast_update(
+                parser_error="",
+                rss="https://example.com/rss.xml",
+                content_hash=content_hash,
+            )
+
+        batch.flush()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        assert first.parser_error == ""
+        assert second.parser_error == Podcast.ParserError.DUPLICATE
+
+    @pytest.mark.django_db
+    def test_duplicates_checked_once(self, mocker):
+        podcasts = PodcastFactory.create_batch(3, parsed=None)
+        existing = PodcastFactory(content_hash="existing")
+
+        batch = PodcastUpdateBatch()
+
+        mock_find_duplicates = mocker.spy(duplicates, "find_duplicates")
+
+        for podcast, content_hash in zip(
+            podcasts, ["first", "existing", "first"], strict=True
+        ):
+            _FeedParser(podcast, batch=batch)._podcast_update(
+                parser_error="",
+                rss=podcast.rss,
+                content_hash=content_hash,
+            )
+
+        batch.flush()
+
+        mock_find_duplicates.assert_called_once()
+
+        assert set(
+            Podcast.objects.filter(
+                parser_error=Podcast.ParserError.DUPLICATE
+            ).values_list("pk", flat=True)
+        ) == {podcasts[1].pk, podcasts[2].pk}
+
+        existing.refresh_from_db()
+        assert existing.active
+
+    @pytest.mark.django_db
+    def test_flush_same_content(self):
+        first, second = PodcastFactory.create_batch(2, parsed=None)
+
+        batch = PodcastUpdateBatch()
+
+        for podcast in (first, second):
+            parse_fetched_feed(
+                podcast,
+                httpx.Response(
+                    http.HTTPStatus.OK,
+                    content=_get_mock_file_path("rss_mock.xml").read_bytes(),
+                    request=httpx.Request("GET", podcast.rss),
+                ),
+                batch=batch,
+            )
+
+        batch.flush()
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+
+        assert first.parser_error == ""
+        assert first.content_hash
+
+        assert second.parser_error == Podcast.ParserError.DUPLICATE
+        assert not second.active
+        assert second.content_hash == ""
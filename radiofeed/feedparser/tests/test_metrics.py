@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+
+from radiofeed.feedparser.metrics import ParseMetrics
+
+
+class TestParseMetrics:
+    def test_from_response_none(self):
+        assert ParseMetrics.from_response(None) == ParseMetrics()
+
+    def test_from_response_no_request(self):
+        assert ParseMetrics.from_response(httpx.Response(200)) == ParseMetrics()
+
+    def test_from_response_no_extension(self):
+        response = httpx.Response(200, request=httpx.Request("GET", "https://a.com"))
+        assert ParseMetrics.from_response(response) == ParseMetrics()
+
+    def test_from_response(self):
+        metrics = ParseMetrics()
+        response = httpx.Response(
+            200,
+            request=httpx.Request(
+                "GET", "https://a.com", extensions=metrics.extensions()
+            ),
+        )
+        assert ParseMetrics.from_response(response) is metrics
+
+    def test_trace(self):
+        metrics = ParseMetrics()
+        trace = metrics.extensions()["trace"]
+
+        trace("connection.connect_tcp.started", {})
+        trace("connection.connect_tcp.complete", {})
+        trace("connection.start_tls.started", {})
+        trace("connection.start_tls.complete", {})
+        trace("http11.send_request_headers.started", {})
+
+        assert metrics.connect_time is not None
+        assert metrics.connect_time > 0
+
+    def test_trace_not_started(self):
+        metrics = ParseMetrics()
+        metrics.trace("connection.connect_tcp.complete", {})
+        assert metrics.connect_time is None
+
+    def test_atrace(self):
+        metrics = ParseMetrics()
+        trace = metrics.extensions(is_async=True)["trace"]
+
+        asyncio.run(trace("connection.connect_tcp.started", {}))
+        asyncio.run(trace("connection.connect_tcp.complete", {}))
+
+        assert metrics.connect_time is not None
+
+    def test_response_received(self):
+        metrics = ParseMetrics()
+        metrics.response_received()
+        assert metrics.ttfb is not None
+
+    def test_measure_nested(self):
+        metrics = ParseMetrics()
+
+        with metrics.measure("parse_time"):
+            with metrics.measure("download_time"):
+                time.sleep(0.05)
+            with metrics.measure("download_time"):
+                time.sleep(0.05)
+
+        assert metrics.download_time == pytest.approx(0.1, abs=0.05)
+        assert metrics.parse_time is not None
+        assert metrics.parse_time < 0.05
+
+    def test_update(self):
+        metrics = ParseMetrics(ttfb=1.0, parse_time=1.0)
+        metrics.update(ParseMetrics(parse_time=2.0, num_items=3))
+
+        assert metrics.ttfb == 1.0
+        assert metrics.parse_time == 2.0
+        assert metrics.num_items == 3
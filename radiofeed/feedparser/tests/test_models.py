@@ -4,7 +4,7 @@ import pytest
 from django.utils import timezone
 from pydantic import ValidationError
 
-from radiofeed.feedparser.models import Feed, Item
+from radiofeed.feedparser.models import Feed, Item, validate_items
 from radiofeed.feedparser.tests.factories import FeedFactory, ItemFactory
 
 
@@ -39,7 +39,7 @@ class TestItem:
 
     def test_default_keywords_from_categories(self):
         item = Item(**ItemFactory(categories=["Gaming", "Hobbies", "Video Games"]))
-        assert set(item.keywords.split()) == {"gaming", "hobbies", "video", "games"}
+        assert item.keywords == "gaming hobbies video games"
 
     def test_defaults(self):
         item = Item(**ItemFactory())
@@ -64,6 +64,22 @@ class TestItem:
         assert Item(**ItemFactory(duration=value)).duration == expected
 
 
+class TestValidateItems:
+    def test_validate(self):
+        items = validate_items(
+            [
+                ItemFactory(),
+                ItemFactory(pub_date=None),
+                ItemFactory(length="1000"),
+            ]
+        )
+        assert len(items) == 2
+        assert items[1].length == 1000
+
+    def test_empty(self):
+        assert validate_items([]) == []
+
+
 class TestFeed:
     @pytest.fixture
     def item(self):
@@ -1,9 +1,10 @@
+import itertools
 import pathlib
 
 import pytest
 
 from radiofeed.feedparser.exceptions import InvalidRSSError
-from radiofeed.feedparser.rss_parser import parse_rss
+from radiofeed.feedparser.rss_parser import parse_rss, parse_rss_stream
 
 
 class TestParseRss:
@@ -34,6 +35,74 @@ class TestParseRss:
         assert len(feed.items) == 20
         assert feed.title == "Mysterious Universe"
 
+    def test_item_fallbacks(self):
+        feed = parse_rss(
+            b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd"
+    xmlns:content="http://purl.org/rss/1.0/modules/content/"
+    xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+<title>Testing</title>
+<item>
+    <title>  </title>
+    <title>Episode 1</title>
+    <itunes:summary>Summary</itunes:summary>
+    <description> <b>bold</b> description </description>
+    <link>https://example.com/1</link>
+    <pubDate>Fri, 19 Jun 2020 16:58:03 +0000</pubDate>
+    <media:content url="https://example.com/1.ogg" type="audio/ogg" />
+    <enclosure url="" type="audio/mpeg" length="1000" />
+    <enclosure url="https://example.com/1.mp3" type="audio/mpeg" />
+    <!-- comment -->
+</item>
+</channel>
+</rss>"""
+        )
+
+        assert len(feed.items) == 1
+
+        item = feed.items[0]
+
+        assert item.title == "Episode 1"
+        assert item.description == "description"
+        assert item.guid == "https://example.com/1"
+        assert item.website == "https://example.com/1"
+        assert item.media_url == "https://example.com/1.mp3"
+        assert item.media_type == "audio/mpeg"
+        assert item.length == 1000
+
+    @pytest.mark.parametrize("chunk_size", [64, None])
+    def test_item_categories(self, chunk_size):
+        content = b"""<?xml version="1.0" encoding="UTF-8"?>
+<rss xmlns:itunes="http://www.itunes.com/dtds/podcast-1.0.dtd">
+<channel>
+<title>Testing</title>
+<itunes:category text="Science" />
+<item>
+    <title>Episode 1</title>
+    <guid>1</guid>
+    <enclosure url="https://example.com/1.mp3" type="audio/mpeg" />
+    <pubDate>Fri, 19 Jun 2020 16:58:03 +0000</pubDate>
+    <itunes:category text="Physics" />
+</item>
+<item>
+    <title>Episode 2</title>
+    <guid>2</guid>
+    <enclosure url="https://example.com/2.mp3" type="audio/mpeg" />
+    <pubDate>Fri, 19 Jun 2020 16:58:03 +0000</pubDate>
+</item>
+<itunes:category text="History" />
+</channel>
+</rss>"""
+
+        feed = parse_rss_stream(
+            [content]
+            if chunk_size is None
+            else (bytes(chunk) for chunk in itertools.batched(content, chunk_size))
+        )
+
+        assert [item.categories for item in feed.items] == [{"physics"}, set()]
+
     @pytest.mark.parametrize(
         ("filename", "title", "num_items"),
         [
@@ -97,3 +166,21 @@ class TestParseRss:
         feed = parse_rss(self.read_mock_file(filename))
         assert feed.title == title
         assert len(feed.items) == num_items
+
+
+class TestParseRssStream:
+    def test_parse_chunks(self):
+        content = (
+            pathlib.Path(__file__).parent / "mocks" / "rss_mock.xml"
+        ).read_bytes()
+
+        feed = parse_rss_stream(
+            bytes(chunk) for chunk in itertools.batched(content, 256)
+        )
+
+        assert feed == parse_rss(content)
+        assert len(feed.items) == 20
+
+    def test_empty(self):
+        with pytest.raises(InvalidRSSError):
+            parse_rss_stream([])
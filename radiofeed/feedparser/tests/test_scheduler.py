@@ -6,6 +6,110 @@ from django.utils import timezone
 from radiofeed.feedparser import scheduler
 from radiofeed.feedparser.models import Feed, Item
 from radiofeed.feedparser.tests.factories import FeedFactory, ItemFactory
+from radiofeed.podcasts.tests.factories import PodcastFactory, SubscriptionFactory
+
+
+class TestGetScheduledPodcasts:
+    @pytest.mark.django_db
+    def test_get_scheduled(self):
+        now = timezone.now()
+
+        first = PodcastFactory(next_fetch_at=None)
+        second = PodcastFactory(next_fetch_at=now - timedelta(hours=3))
+
+        PodcastFactory(next_fetch_at=now - timedelta(hours=1))
+        PodcastFactory(next_fetch_at=now + timedelta(hours=1))
+        PodcastFactory(next_fetch_at=None, active=False)
+
+        assert scheduler.get_scheduled_podcasts(2) == [first, second]
+
+        # claimed podcasts should not be returned again
+        assert len(scheduler.get_scheduled_podcasts(10)) == 1
+
+        first.refresh_from_db()
+        assert first.next_fetch_at > now
+
+    @pytest.mark.django_db
+    def test_get_scheduled_priority(self):
+        now = timezone.now()
+
+        PodcastFactory(next_fetch_at=None)
+        PodcastFactory(next_fetch_at=now - timedelta(hours=1))
+
+        subscribed = SubscriptionFactory(
+            podcast=PodcastFactory(next_fetch_at=now - timedelta(minutes=5))
+        ).podcast
+
+        promoted = PodcastFactory(
+            next_fetch_at=now - timedelta(hours=3),
+            promoted=True,
+        )
+
+        assert scheduler.get_scheduled_podcasts(2) == [subscribed, promoted]
+
+    @pytest.mark.django_db
+    def test_get_scheduled_priority_not_due(self):
+        now = timezone.now()
+
+        SubscriptionFactory(
+            podcast=PodcastFactory(next_fetch_at=now + timedelta(hours=1))
+        )
+
+        due = PodcastFactory(next_fetch_at=now - timedelta(hours=1))
+        never_fetched = PodcastFactory(next_fetch_at=None)
+
+        assert scheduler.get_scheduled_podcasts(10) == [never_fetched, due]
+
+    @pytest.mark.django_db
+    def test_none_scheduled(self):
+        PodcastFactory(next_fetch_at=timezone.now() + timedelta(hours=1))
+        assert scheduler.get_scheduled_podcasts(10) == []
+
+
+class TestReleasePodcasts:
+    @pytest.mark.django_db
+    def test_release(self):
+        next_fetch_at = timezone.now() - timedelta(hours=1)
+
+        podcast = PodcastFactory(next_fetch_at=next_fetch_at)
+
+        podcasts = scheduler.get_scheduled_podcasts(1)
+        assert podcasts == [podcast]
+
+        scheduler.release_podcasts(podcasts)
+
+        podcast.refresh_from_db()
+        assert podcast.next_fetch_at == next_fetch_at
+
+
+class TestNextFetchAt:
+    def test_pub_date(self):
+        now = timezone.now()
+        assert scheduler.next_fetch_at(
+            now, now - timedelta(hours=1), timedelta(hours=3)
+        ) == now + timedelta(hours=2)
+
+    def test_pub_date_none(self):
+        now = timezone.now()
+        assert scheduler.next_fetch_at(
+            now, None, timedelta(hours=3)
+        ) == now + timedelta(hours=3)
+
+    def test_frequency_none(self):
+        now = timezone.now()
+        assert scheduler.next_fetch_at(now, None, None) == now + timedelta(hours=24)
+
+    def test_min(self):
+        now = timezone.now()
+        assert scheduler.next_fetch_at(
+            now, now - timedelta(days=3), timedelta(hours=3)
+        ) == now + timedelta(hours=1)
+
+    def test_max(self):
+        now = timezone.now()
+        assert scheduler.next_fetch_at(now, now, timedelta(days=30)) == now + timedelta(
+            days=3
+        )
 
 
 class TestReschedule:
@@ -26,6 +130,15 @@ class TestReschedule:
             24.24,
         )
 
+    def test_increment_dormant(self):
+        frequency = scheduler.reschedule(
+            timezone.now() - timedelta(days=365 * 5), timedelta(hours=1)
+        )
+        assert timedelta(days=365 * 5) <= frequency < timedelta(days=365 * 5 * 1.01)
+
+    def test_zero_frequency(self):
+        self.assert_hours_diff(scheduler.reschedule(timezone.now(), timedelta()), 1)
+
     def assert_hours_diff(self, delta, hours):
         assert delta.total_seconds() / 3600 == pytest.approx(hours)
 
@@ -109,6 +222,32 @@ class TestSchedule:
 
         assert scheduler.schedule(feed).days == pytest.approx(3)
 
+    def test_recent_intervals_weighted(self):
+        items = []
+        last = timezone.now()
+
+        for day in [2, 2, 2] + [7] * 9:
+            pub_date = last - timedelta(days=day)
+            items.append(Item(**ItemFactory(pub_date=pub_date)))
+            last = pub_date
+
+        feed = Feed(**FeedFactory(items=items))
+
+        assert timedelta(days=2) < scheduler.schedule(feed) < timedelta(days=5)
+
+    def test_history_size(self):
+        items = []
+        last = timezone.now()
+
+        for day in [7] * 13 + [1] * 12:
+            pub_date = last - timedelta(days=day)
+            items.append(Item(**ItemFactory(pub_date=pub_date)))
+            last = pub_date
+
+        feed = Feed(**FeedFactory(items=items))
+
+        assert scheduler.schedule(feed).days == pytest.approx(7)
+
     def test_min_frequency(self):
         now = timezone.now()
         feed = Feed(
@@ -1,7 +1,7 @@
 import contextlib
 import functools
 import io
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TypeAlias
 
 import lxml.etree
@@ -34,6 +34,32 @@ class XPathParser:
             finally:
                 element.clear()
 
+    def iterstream(self, chunks: Iterable[bytes], *tags: str) -> Iterator:
+        """Parses document incrementally from chunks of content, yielding each element
+        matching tags as soon as it is closed.
+
+        Elements are removed from the document once consumed, so only the elements
+        currently being parsed are kept in memory rather than the whole document.
+
+        Raises:
+            lxml.etree.XMLSyntaxError: if document cannot be parsed.
+        """
+        parser = lxml.etree.XMLPullParser(
+            tag=tags or None,
+            encoding="utf-8",
+            no_network=True,
+            resolve_entities=False,
+            recover=True,
+            events=("end",),
+        )
+
+        for chunk in chunks:
+            parser.feed(chunk)
+            yield from self._read_events(parser)
+
+        parser.close()
+        yield from self._read_events(parser)
+
     def find(self, *args, **kwargs) -> OptionalXmlElement:
         """Returns first matching element, or None if not found."""
         try:
@@ -62,6 +88,15 @@ class XPathParser:
                 if isinstance(value, str) and (cleaned := value.strip()):
                     yield cleaned
 
+    def _read_events(self, parser: lxml.etree.XMLPullParser) -> Iterator:
+        for _, element in parser.read_events():
+            try:
+                yield element
+            finally:
+                element.clear()
+                if (parent := element.getparent()) is not None:
+                    parent.remove(element)
+
     @functools.lru_cache(maxsize=60)  # noqa: B019
     def _xpath(self, path: str) -> lxml.etree.XPath:
         return lxml.etree.XPath(path, namespaces=self._namespaces)
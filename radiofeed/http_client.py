@@ -1,11 +1,19 @@
+import contextlib
 import functools
+from collections.abc import AsyncIterator, Iterator
 
 import httpx
 from django.conf import settings
 
 
 class Client:
-    """Handles HTTP GET requests."""
+    """Handles HTTP GET requests.
+
+    If `http2` is enabled, requests to the same host share a single connection where
+    the server supports HTTP/2. Defaults to the `HTTP_CLIENT_HTTP2` setting.
+
+    Connection pool `limits` default to `get_limits()`.
+    """
 
     def __init__(
         self,
@@ -13,6 +21,8 @@ class Client:
         *,
         follow_redirects: bool = True,
         timeout: int = 5,
+        http2: bool | None = None,
+        limits: httpx.Limits | None = None,
         **kwargs,
     ) -> None:
         self._headers = {
@@ -23,6 +33,8 @@ class Client:
             headers=self._headers,
             follow_redirects=follow_redirects,
             timeout=timeout,
+            http2=settings.HTTP_CLIENT_HTTP2 if http2 is None else http2,
+            limits=limits or get_limits(),
             **kwargs,
         )
 
@@ -34,8 +46,106 @@ class Client:
 
         return response
 
+    @contextlib.contextmanager
+    def stream(
+        self, url: str, headers: dict | None = None, **kwargs
+    ) -> Iterator[httpx.Response]:
+        """Does an HTTP GET request, without reading the response content.
+
+        Content should be read within the context e.g. with `response.iter_bytes()`.
+        """
+        with self._client.stream("GET", url, headers=headers, **kwargs) as response:
+            response.raise_for_status()
+            yield response
+
+
+class AsyncClient:
+    """Handles asynchronous HTTP GET requests.
+
+    Should be used as an async context manager, so that connections are closed
+    within the same event loop in which they are opened.
+
+    Takes the same arguments as `Client`.
+    """
+
+    def __init__(
+        self,
+        headers: dict | None = None,
+        *,
+        follow_redirects: bool = True,
+        timeout: int = 5,
+        http2: bool | None = None,
+        limits: httpx.Limits | None = None,
+        **kwargs,
+    ) -> None:
+        self._headers = {
+            "User-Agent": settings.USER_AGENT,
+        } | (headers or {})
+
+        self._client = httpx.AsyncClient(
+            headers=self._headers,
+            follow_redirects=follow_redirects,
+            timeout=timeout,
+            http2=settings.HTTP_CLIENT_HTTP2 if http2 is None else http2,
+            limits=limits or get_limits(),
+            **kwargs,
+        )
+
+    async def __aenter__(self) -> "AsyncClient":
+        """Opens the client."""
+        await self._client.__aenter__()
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        """Closes the client and any open connections."""
+        await self._client.__aexit__(*args)
+
+    async def get(
+        self, url: str, headers: dict | None = None, **kwargs
+    ) -> httpx.Response:
+        """Does an HTTP GET request."""
+
+        response = await self._client.get(url, headers=headers, **kwargs)
+        response.raise_for_status()
+
+        return response
+
+    @contextlib.asynccontextmanager
+    async def stream(
+        self, url: str, headers: dict | None = None, **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        """Does an HTTP GET request, without reading the response content.
+
+        Content should be read within the context e.g. with `response.aiter_bytes()`.
+        """
+        async with self._client.stream(
+            "GET", url, headers=headers, **kwargs
+        ) as response:
+            response.raise_for_status()
+            yield response
+
 
 @functools.cache
 def get_client(**kwargs) -> Client:
     """Returns Client instance"""
     return Client(**kwargs)
+
+
+def get_limits(
+    *,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+) -> httpx.Limits:
+    """Returns connection pool limits, using settings for any limits not provided."""
+    return httpx.Limits(
+        max_connections=settings.HTTP_CLIENT_MAX_CONNECTIONS
+        if max_connections is None
+        else max_connections,
+        max_keepalive_connections=settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS
+        if max_keepalive_connections is None
+        else max_keepalive_connections,
+        keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_EXPIRY
+        if keepalive_expiry is None
+        else keepalive_expiry,
+    )
@@ -4,7 +4,7 @@ from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.timesince import timesince, timeuntil
 
-from radiofeed.podcasts.models import Category, Podcast, Subscription
+from radiofeed.podcasts.models import Category, FetchMetrics, Podcast, Subscription
 
 
 @admin.register(Category)
@@ -188,6 +188,63 @@ class ScheduledFilter(admin.SimpleListFilter):
         return queryset.scheduled() if self.value() == "yes" else queryset
 
 
+class FetchMetricsInline(admin.TabularInline):
+    """Most recent fetch metrics of a podcast."""
+
+    model = FetchMetrics
+    ordering = ("-created",)
+    extra = 0
+
+    fields = readonly_fields = (
+        "created",
+        "parser_error",
+        "connect_time",
+        "ttfb",
+        "download_time",
+        "parse_time",
+        "validation_time",
+        "db_time",
+        "content_length",
+        "transfer_length",
+        "content_encoding",
+        "num_items",
+        "num_rows",
+    )
+
+    def has_add_permission(self, request: HttpRequest, obj: Podcast | None) -> bool:
+        """Metrics are only added by the feed parser."""
+        return False
+
+
+@admin.register(FetchMetrics)
+class FetchMetricsAdmin(admin.ModelAdmin):
+    """Fetch metrics admin, for finding slow or large feeds."""
+
+    list_display = (
+        "podcast",
+        "created",
+        "parser_error",
+        "ttfb",
+        "download_time",
+        "parse_time",
+        "db_time",
+        "content_length",
+        "transfer_length",
+        "num_items",
+    )
+
+    list_filter = ("parser_error",)
+    list_select_related = ("podcast",)
+
+    ordering = ("-created",)
+
+    raw_id_fields = ("podcast",)
+
+    def has_add_permission(self, request: HttpRequest) -> bool:
+        """Metrics are only added by the feed parser."""
+        return False
+
+
 @admin.register(Podcast)
 class PodcastAdmin(admin.ModelAdmin):
     """Podcast model admin."""
@@ -216,6 +273,8 @@ class PodcastAdmin(admin.ModelAdmin):
 
     raw_id_fields = ("recipients",)
 
+    inlines = (FetchMetricsInline,)
+
     readonly_fields = (
         "pub_date",
         "parsed",
@@ -225,6 +284,9 @@ class PodcastAdmin(admin.ModelAdmin):
         "modified",
         "etag",
         "content_hash",
+        "redirect_rss",
+        "recommendations_hash",
+        "priority",
     )
 
     actions = ("make_promoted",)
@@ -1,4 +1,4 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandParser
 
 from radiofeed import tokenizer
 from radiofeed.podcasts import recommender
@@ -10,6 +10,19 @@ class Command(BaseCommand):
 
     help = """Generate recommendations based on podcast similarity."""
 
+    def add_arguments(self, parser: CommandParser) -> None:
+        """Add command arguments."""
+        parser.add_argument(
+            "--incremental",
+            action="store_true",
+            help="Only update recommendations of podcasts with changed text or "
+            "categories, and of podcasts recommending them",
+        )
+
     def handle(self, *args, **options):
         """Handle implementation."""
-        execute_thread_pool(recommender.recommend, tokenizer.NLTK_LANGUAGES)
+        execute_thread_pool(
+            recommender.recommend,
+            tokenizer.NLTK_LANGUAGES,
+            incremental=options["incremental"],
+        )
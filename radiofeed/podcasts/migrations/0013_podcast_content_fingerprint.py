@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-17 03:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0012_remove_podcast_podcasts_po_itunes__8b4558_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="content_fingerprint",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
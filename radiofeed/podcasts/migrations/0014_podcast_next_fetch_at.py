@@ -0,0 +1,43 @@
+# Generated by Django 5.1.5 on 2026-10-17 03:57
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Coalesce, Greatest, Least
+
+
+def set_next_fetch_at(apps, schema_editor):
+    apps.get_model("podcasts", "Podcast").objects.filter(parsed__isnull=False).update(
+        next_fetch_at=Least(
+            models.F("parsed") + timedelta(days=3),
+            Greatest(
+                Coalesce("pub_date", "parsed") + models.F("frequency"),
+                models.F("parsed") + timedelta(hours=1),
+            ),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0013_podcast_content_fingerprint"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="next_fetch_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(set_next_fetch_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="podcast",
+            index=models.Index(
+                models.OrderBy(models.F("next_fetch_at"), nulls_first=True),
+                condition=models.Q(("active", True)),
+                name="podcasts_podcast_next_fetch_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,85 @@
+# Generated by Django 5.1.5 on 2026-10-17 04:43
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0014_podcast_next_fetch_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="FetchMetrics",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("created", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "parser_error",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("duplicate", "Duplicate"),
+                            ("inaccessible", "Inaccessible"),
+                            ("invalid_data", "Invalid Data"),
+                            ("invalid_rss", "Invalid RSS"),
+                            ("not_modified", "Not Modified"),
+                            ("unavailable", "Unavailable"),
+                        ],
+                        max_length=30,
+                    ),
+                ),
+                ("connect_time", models.DurationField(blank=True, null=True)),
+                (
+                    "ttfb",
+                    models.DurationField(
+                        blank=True, null=True, verbose_name="Time to First Byte"
+                    ),
+                ),
+                ("download_time", models.DurationField(blank=True, null=True)),
+                ("parse_time", models.DurationField(blank=True, null=True)),
+                ("validation_time", models.DurationField(blank=True, null=True)),
+                (
+                    "db_time",
+                    models.DurationField(
+                        blank=True, null=True, verbose_name="Database Time"
+                    ),
+                ),
+                ("content_length", models.PositiveIntegerField(blank=True, null=True)),
+                ("num_items", models.PositiveIntegerField(blank=True, null=True)),
+                (
+                    "num_rows",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="Episodes Changed"
+                    ),
+                ),
+                (
+                    "podcast",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="fetch_metrics",
+                        to="podcasts.podcast",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "fetch metrics",
+                "indexes": [
+                    models.Index(
+                        fields=["podcast", "-created"],
+                        name="podcasts_fe_podcast_122d98_idx",
+                    )
+                ],
+            },
+        ),
+    ]
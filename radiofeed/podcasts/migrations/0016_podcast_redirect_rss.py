@@ -0,0 +1,21 @@
+# Generated by Django 5.1.5 on 2026-10-17 05:05
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0015_fetch_metrics"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="redirect_rss",
+            field=models.URLField(
+                blank=True,
+                help_text="Target of permanent redirects from RSS URL",
+                max_length=500,
+            ),
+        ),
+    ]
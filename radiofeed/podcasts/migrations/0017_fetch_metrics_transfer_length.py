@@ -0,0 +1,24 @@
+# Generated by Django 5.1.5 on 2026-10-17 05:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0016_podcast_redirect_rss"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="fetchmetrics",
+            name="content_encoding",
+            field=models.CharField(blank=True, max_length=30),
+        ),
+        migrations.AddField(
+            model_name="fetchmetrics",
+            name="transfer_length",
+            field=models.PositiveIntegerField(
+                blank=True, null=True, verbose_name="Bytes Transferred"
+            ),
+        ),
+    ]
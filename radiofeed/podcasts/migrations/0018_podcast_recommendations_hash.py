@@ -0,0 +1,17 @@
+# Generated by Django 5.1.5 on 2026-10-17 05:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0017_fetch_metrics_transfer_length"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="podcast",
+            name="recommendations_hash",
+            field=models.CharField(blank=True, max_length=64),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.1.5 on 2026-10-17 06:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def set_priority(apps, schema_editor):
+    apps.get_model("podcasts", "Podcast").objects.update(
+        priority=models.Case(
+            models.When(
+                models.Exists(
+                    apps.get_model("podcasts", "Subscription").objects.filter(
+                        podcast=models.OuterRef("pk")
+                    )
+                ),
+                then=models.Value(2),
+            ),
+            models.When(promoted=True, then=models.Value(1)),
+            default=models.Value(0),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0018_podcast_recommendations_hash"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="podcast",
+            name="podcasts_podcast_next_fetch_idx",
+        ),
+        migrations.AddField(
+            model_name="podcast",
+            name="priority",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "Default"), (1, "Promoted"), (2, "Subscribed")],
+                default=0,
+                help_text="Due podcasts with higher priority are updated first.",
+            ),
+        ),
+        migrations.RunPython(set_priority, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="podcast",
+            index=models.Index(
+                models.OrderBy(models.F("priority"), descending=True),
+                models.OrderBy(models.F("next_fetch_at"), nulls_first=True),
+                condition=models.Q(("active", True)),
+                name="podcasts_podcast_next_fetch_idx",
+            ),
+        ),
+    ]
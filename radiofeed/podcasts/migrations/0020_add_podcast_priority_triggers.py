@@ -0,0 +1,64 @@
+# Generated by Django 5.1.5 on 2026-10-17 06:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("podcasts", "0019_podcast_priority"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="podcast",
+            name="priority",
+            field=models.PositiveSmallIntegerField(
+                choices=[(0, "Default"), (1, "Promoted"), (2, "Subscribed")],
+                default=0,
+                editable=False,
+                help_text="Due podcasts with higher priority are updated first.",
+            ),
+        ),
+        migrations.RunSQL(
+            sql="""
+CREATE OR REPLACE FUNCTION podcast_priority_trigger() RETURNS trigger AS $$
+BEGIN
+    NEW.priority := CASE
+        WHEN EXISTS (
+            SELECT 1 FROM podcasts_subscription WHERE podcast_id = NEW.id
+        ) THEN 2
+        WHEN NEW.promoted THEN 1
+        ELSE 0
+    END;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER podcast_priority_trigger
+BEFORE INSERT OR UPDATE OF promoted, priority ON podcasts_podcast
+FOR EACH ROW EXECUTE FUNCTION podcast_priority_trigger();
+
+CREATE OR REPLACE FUNCTION subscription_priority_trigger() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        UPDATE podcasts_podcast SET priority = priority WHERE id = OLD.podcast_id;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        UPDATE podcasts_podcast SET priority = priority WHERE id = NEW.podcast_id;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER subscription_priority_trigger
+AFTER INSERT OR DELETE OR UPDATE OF podcast_id ON podcasts_subscription
+FOR EACH ROW EXECUTE FUNCTION subscription_priority_trigger();
+
+UPDATE podcasts_podcast SET priority = priority;""",
+            reverse_sql="""
+DROP TRIGGER IF EXISTS subscription_priority_trigger ON podcasts_subscription;
+DROP FUNCTION IF EXISTS subscription_priority_trigger;
+DROP TRIGGER IF EXISTS podcast_priority_trigger ON podcasts_podcast;
+DROP FUNCTION IF EXISTS podcast_priority_trigger;""",
+        ),
+    ]
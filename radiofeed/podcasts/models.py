@@ -1,3 +1,4 @@
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from typing import ClassVar, Final
 
@@ -6,12 +7,13 @@ from django.contrib.postgres.indexes import GinIndex
 from django.contrib.postgres.search import SearchVectorField
 from django.core.validators import MinLengthValidator
 from django.db import models
-from django.db.models.functions import Coalesce, Lower
+from django.db.models.functions import Coalesce, Lower, RowNumber
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.encoding import force_str
 from django.utils.functional import cached_property
 from django.utils.text import slugify
+from fast_update.query import FastUpdateQuerySet
 
 from radiofeed.html import strip_html
 from radiofeed.search import SearchQuerySetMixin
@@ -66,7 +68,7 @@ class Category(models.Model):
         return slugify(self.name, allow_unicode=False)
 
 
-class PodcastQuerySet(SearchQuerySetMixin, models.QuerySet):
+class PodcastQuerySet(SearchQuerySetMixin, FastUpdateQuerySet):
     """Custom QuerySet of Podcast model."""
 
     def search(self, search_term) -> models.QuerySet["Podcast"]:
@@ -110,29 +112,11 @@ class PodcastQuerySet(SearchQuerySetMixin, models.QuerySet):
     def scheduled(self) -> models.QuerySet["Podcast"]:
         """Returns all podcasts scheduled for feed parser update.
 
-        1. If parsed is NULL, should be ASAP.
-        2. If pub date is NULL, add frequency to last parsed
-        3. If pub date is not NULL, add frequency to pub date
-        4. Scheduled time should always be in range of 1 hour-3 days.
-
-        Podcasts should not be parsed more than once per hour.
+        Podcasts are due if `next_fetch_at` has passed, or if never parsed.
         """
-        now = timezone.now()
-
         return self.filter(
-            models.Q(parsed__isnull=True)
-            | models.Q(
-                models.Q(parsed__lt=now - self.model.MAX_PARSER_FREQUENCY)
-                | models.Q(
-                    pub_date__isnull=True,
-                    parsed__lt=now - models.F("frequency"),  # type: ignore[operator]
-                )
-                | models.Q(
-                    pub_date__isnull=False,
-                    pub_date__lt=now - models.F("frequency"),  # type: ignore[operator]
-                ),
-                parsed__lt=now - self.model.MIN_PARSER_FREQUENCY,
-            )
+            models.Q(next_fetch_at__isnull=True)
+            | models.Q(next_fetch_at__lte=timezone.now())
         )
 
     def recommended(self, user: User) -> models.QuerySet["Podcast"]:
@@ -199,8 +183,19 @@ class Podcast(models.Model):
         NOT_MODIFIED = "not_modified", "Not Modified"
         UNAVAILABLE = "unavailable", "Unavailable"
 
+    class Priority(models.IntegerChoices):
+        DEFAULT = 0, "Default"
+        PROMOTED = 1, "Promoted"
+        SUBSCRIBED = 2, "Subscribed"
+
     rss = models.URLField(unique=True, max_length=500)
 
+    redirect_rss = models.URLField(
+        max_length=500,
+        blank=True,
+        help_text="Target of permanent redirects from RSS URL",
+    )
+
     active = models.BooleanField(
         default=True,
         help_text="Inactive podcasts will no longer be updated from their RSS feeds.",
@@ -218,6 +213,8 @@ class Podcast(models.Model):
 
     parsed = models.DateTimeField(null=True, blank=True)
 
+    next_fetch_at = models.DateTimeField(null=True, blank=True)
+
     parser_error = models.CharField(
         max_length=30, choices=ParserError.choices, blank=True
     )
@@ -230,6 +227,7 @@ class Podcast(models.Model):
     )
 
     content_hash = models.CharField(max_length=64, blank=True)
+    content_fingerprint = models.CharField(max_length=64, blank=True)
 
     num_retries = models.PositiveSmallIntegerField(default=0)
 
@@ -248,6 +246,10 @@ class Podcast(models.Model):
     website = models.URLField(max_length=2083, blank=True)
     keywords = models.TextField(blank=True)
     extracted_text = models.TextField(blank=True)
+
+    # hash of extracted text and categories when recommendations were last created
+    recommendations_hash = models.CharField(max_length=64, blank=True)
+
     owner = models.TextField(blank=True)
 
     created = models.DateTimeField(auto_now_add=True)
@@ -259,6 +261,14 @@ class Podcast(models.Model):
     explicit = models.BooleanField(default=False)
     promoted = models.BooleanField(default=False)
 
+    # set from subscriptions and promotion by database triggers
+    priority = models.PositiveSmallIntegerField(
+        choices=Priority.choices,
+        default=Priority.DEFAULT,
+        editable=False,
+        help_text="Due podcasts with higher priority are updated first.",
+    )
+
     categories = models.ManyToManyField(
         "podcasts.Category",
         blank=True,
@@ -281,6 +291,12 @@ class Podcast(models.Model):
             models.Index(fields=["pub_date"]),
             models.Index(fields=["promoted"]),
             models.Index(fields=["content_hash"]),
+            models.Index(
+                models.F("priority").desc(),
+                models.F("next_fetch_at").asc(nulls_first=True),
+                condition=models.Q(active=True),
+                name="%(app_label)s_%(class)s_next_fetch_idx",
+            ),
             models.Index(
                 Lower("title"),
                 name="%(app_label)s_%(class)s_lwr_title_idx",
@@ -480,3 +496,79 @@ class Recommendation(models.Model):
                 f"recommended {self.recommended_id}",
             ]
         )
+
+
+class FetchMetricsQuerySet(models.QuerySet):
+    """Custom QuerySet for FetchMetrics model."""
+
+    def prune(self, podcasts: Iterable[Podcast]) -> int:
+        """Deletes all but the most recent metrics of each podcast.
+
+        Returns:
+            number of rows deleted
+        """
+        deleted, _ = self.filter(
+            pk__in=self.filter(podcast__in=podcasts)
+            .annotate(
+                rank=models.Window(
+                    RowNumber(),
+                    partition_by=models.F("podcast"),
+                    order_by=models.F("created").desc(),
+                )
+            )
+            .filter(rank__gt=FetchMetrics.MAX_PER_PODCAST)
+            .values("pk")
+        ).delete()
+        return deleted
+
+
+class FetchMetrics(models.Model):
+    """Timings and sizes recorded each time a podcast feed is fetched and parsed.
+
+    Only the most recent metrics of each podcast are kept.
+    """
+
+    MAX_PER_PODCAST: Final = 10
+
+    podcast = models.ForeignKey(
+        "podcasts.Podcast",
+        on_delete=models.CASCADE,
+        related_name="fetch_metrics",
+    )
+
+    created = models.DateTimeField(default=timezone.now)
+
+    parser_error = models.CharField(
+        max_length=30, choices=Podcast.ParserError.choices, blank=True
+    )
+
+    connect_time = models.DurationField(null=True, blank=True)
+    ttfb = models.DurationField(
+        null=True, blank=True, verbose_name="Time to First Byte"
+    )
+    download_time = models.DurationField(null=True, blank=True)
+    parse_time = models.DurationField(null=True, blank=True)
+    validation_time = models.DurationField(null=True, blank=True)
+    db_time = models.DurationField(null=True, blank=True, verbose_name="Database Time")
+
+    content_length = models.PositiveIntegerField(null=True, blank=True)
+    transfer_length = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name="Bytes Transferred"
+    )
+    content_encoding = models.CharField(max_length=30, blank=True)
+    num_items = models.PositiveIntegerField(null=True, blank=True)
+    num_rows = models.PositiveIntegerField(
+        null=True, blank=True, verbose_name="Episodes Changed"
+    )
+
+    objects: models.Manager["FetchMetrics"] = FetchMetricsQuerySet.as_manager()
+
+    class Meta:
+        verbose_name_plural = "fetch metrics"
+        indexes: ClassVar[list] = [
+            models.Index(fields=["podcast", "-created"]),
+        ]
+
+    def __str__(self) -> str:
+        """Required __str__ method"""
+        return f"podcast {self.podcast_id} | {self.created}"
@@ -1,29 +1,36 @@
 import collections
-import contextlib
 import functools
+import hashlib
 import itertools
-import operator
 import statistics
-from collections.abc import Iterator
+from collections.abc import Iterator, Sequence
 from datetime import timedelta
 
+from django.conf import settings
+from django.db import transaction
 from django.db.models import QuerySet
 from django.utils import timezone
+from scipy import sparse
 from sklearn.feature_extraction.text import HashingVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from radiofeed import tokenizer
+from radiofeed.podcasts import similarity
 from radiofeed.podcasts.models import Category, Podcast, Recommendation
+from radiofeed.podcasts.vectors import VectorStore
 
 
 def recommend(language: str, **kwargs) -> None:
     """Generates Recommendation instances based on podcast similarity, grouped by
     language and category.
 
-    Any existing recommendations are first deleted.
+    Any existing recommendations are replaced in a single transaction.
 
     Only podcasts matching certain languages and updated within the past 90 days are
     included.
+
+    If `incremental` is True, recommendations are only replaced for podcasts whose
+    text or categories have changed since recommendations were last created, and for
+    podcasts which had those podcasts as recommendations.
     """
     _Recommender(language, **kwargs).recommend()
 
@@ -38,91 +45,204 @@ class _Recommender:
         *,
         since: timedelta = timedelta(days=90),
         num_matches: int = 12,
+        incremental: bool = False,
     ) -> None:
         self._language = language
         self._since = since
         self._num_matches = num_matches
+        self._incremental = incremental
 
         self._vectorizer = HashingVectorizer(
-            stop_words=list(tokenizer.get_stopwords(self._language))
+            stop_words=sorted(tokenizer.get_stopwords(self._language))
         )
 
     def recommend(self) -> None:
         """Creates recommendation instances."""
+        vectors = self._get_vectors()
+        podcast_categories = self._get_podcast_categories()
+
+        hashes = {
+            int(podcast_id): hashlib.sha256(
+                " ".join(
+                    map(
+                        str,
+                        [
+                            text_hash,
+                            *sorted(podcast_categories.get(int(podcast_id), set())),
+                        ],
+                    )
+                ).encode()
+            ).hexdigest()
+            for podcast_id, text_hash in zip(vectors.ids, vectors.hashes, strict=True)
+        }
+
+        stored_hashes = dict(
+            Podcast.objects.filter(language__iexact=self._language)
+            .exclude(recommendations_hash="")
+            .values_list("pk", "recommendations_hash")
+        )
+
+        changed = {
+            podcast_id
+            for podcast_id, recommendations_hash in hashes.items()
+            if stored_hashes.get(podcast_id) != recommendations_hash
+        } | (stored_hashes.keys() - hashes.keys())
+
+        recommendations = Recommendation.objects.filter(
+            podcast__language=self._language
+        )
+
+        if self._incremental:
+            if not changed:
+                return
+
+            affected = changed | set(
+                recommendations.filter(recommended__in=changed).values_list(
+                    "podcast", flat=True
+                )
+            )
+
+            recommendations = recommendations.filter(podcast__in=affected)
+
+            # only categories including an affected podcast need to be compared
+            category_ids = set().union(
+                *(podcast_categories.get(podcast_id, set()) for podcast_id in affected)
+            )
+
+            categories = [
+                category for category in get_categories() if category.pk in category_ids
+            ]
+
+        else:
+            affected = None
+            categories = get_categories()
+
+        matches = self._build_matches_dict(
+            vectors, podcast_categories, categories, affected
+        )
 
-        # Delete existing recommendations first
-        Recommendation.objects.filter(podcast__language=self._language).bulk_delete()
-
-        for batch in itertools.batched(self._build_matches_dict().items(), 1000):
-            Recommendation.objects.bulk_create(
-                (
-                    Recommendation(
-                        podcast_id=podcast_id,
-                        recommended_id=recommended_id,
-                        similarity=statistics.median(scores),
-                        frequency=len(scores),
+        # existing recommendations remain visible until the transaction is committed
+        with transaction.atomic():
+            recommendations.bulk_delete()
+
+            for batch in itertools.batched(matches.items(), 1000):
+                Recommendation.objects.bulk_create(
+                    (
+                        Recommendation(
+                            podcast_id=podcast_id,
+                            recommended_id=recommended_id,
+                            similarity=statistics.median(scores),
+                            frequency=len(scores),
+                        )
+                        for (podcast_id, recommended_id), scores in batch
+                    ),
+                    batch_size=100,
+                    ignore_conflicts=True,
+                )
+
+            Podcast.objects.fast_update(
+                [
+                    Podcast(
+                        pk=podcast_id, recommendations_hash=hashes.get(podcast_id, "")
                     )
-                    for (podcast_id, recommended_id), scores in batch
-                ),
-                batch_size=100,
-                ignore_conflicts=True,
+                    for podcast_id in changed
+                ],
+                fields=["recommendations_hash"],
             )
 
+    def _get_vectors(self) -> VectorStore:
+        # text of each podcast is only vectorized once per run, or if saved to disk
+        # only if changed since the last run
+        path = (
+            settings.RECOMMENDER_VECTORS_DIR / self._language
+            if settings.RECOMMENDER_VECTORS_DIR
+            else None
+        )
+
+        vectors = (VectorStore.load(path) if path else VectorStore.empty()).update(
+            self._get_podcasts()
+            .order_by("pk")
+            .values_list("pk", "extracted_text")
+            .iterator(),
+            self._vectorizer,
+        )
+
+        if path:
+            vectors.save(path)
+
+        return vectors
+
+    def _get_podcast_categories(self) -> dict[int, set[int]]:
+        podcast_categories: dict[int, set[int]] = collections.defaultdict(set)
+
+        for podcast_id, category_id in Podcast.categories.through.objects.filter(
+            podcast__in=self._get_podcasts()
+        ).values_list("podcast", "category"):
+            podcast_categories[podcast_id].add(category_id)
+
+        return podcast_categories
+
     def _build_matches_dict(
         self,
+        vectors: VectorStore,
+        podcast_categories: dict[int, set[int]],
+        categories: list[Category],
+        affected: set[int] | None,
     ) -> collections.defaultdict[tuple[int, int], list[float]]:
         matches = collections.defaultdict(list)
 
-        for category in get_categories():
-            for batch in itertools.batched(
-                self._get_podcasts(category)
-                .values_list("id", "extracted_text")
-                .iterator(),
-                1000,
+        category_podcasts: dict[int, list[int]] = collections.defaultdict(list)
+
+        for podcast_id, category_ids in sorted(podcast_categories.items()):
+            for category_id in category_ids:
+                category_podcasts[category_id].append(podcast_id)
+
+        for category in categories:
+            for podcast_id, recommended_id, score in self._find_similarities(
+                vectors,
+                vectors.get_rows(category_podcasts.get(category.pk, [])),
+                affected,
             ):
-                for (
-                    podcast_id,
-                    recommended_id,
-                    similarity,
-                ) in self._find_similarities(dict(batch)):
-                    matches[(podcast_id, recommended_id)].append(similarity)
+                matches[(podcast_id, recommended_id)].append(score)
 
         return matches
 
-    def _get_podcasts(self, category: Category) -> QuerySet[Podcast]:
+    def _get_podcasts(self) -> QuerySet[Podcast]:
         return Podcast.objects.filter(
             pub_date__gt=timezone.now() - self._since,
             language__iexact=self._language,
-            categories=category,
             active=True,
             private=False,
         ).exclude(extracted_text="")
 
     def _find_similarities(
-        self, rows: dict[int, str]
+        self,
+        vectors: VectorStore,
+        rows: Sequence[int],
+        affected: set[int] | None,
     ) -> Iterator[tuple[int, int, float]]:
-        # build a data model of podcasts with same language and category
-
-        with contextlib.suppress(ValueError):
-            cosine_sim = cosine_similarity(self._vectorizer.transform(rows.values()))
-
-            podcast_ids = list(rows.keys())
-
-            for current_id, similar in zip(podcast_ids, cosine_sim, strict=True):
-                with contextlib.suppress(IndexError):
-                    for index, similarity in itertools.islice(
-                        sorted(
-                            enumerate(similar),
-                            key=operator.itemgetter(1),
-                            reverse=True,
-                        ),
-                        self._num_matches,
-                    ):
-                        if (
-                            similarity > 0
-                            and (recommended_id := podcast_ids[index]) != current_id
-                        ):
-                            yield current_id, recommended_id, similarity
+        # similarities of all podcasts with same language and category
+        if not rows:
+            return
+
+        matrix = sparse.csr_matrix(vectors.matrix[rows])
+        podcast_ids = [int(podcast_id) for podcast_id in vectors.ids[rows]]
+
+        # only find matches for affected podcasts, if any
+        query_rows = (
+            None
+            if affected is None
+            else [
+                index
+                for index, podcast_id in enumerate(podcast_ids)
+                if podcast_id in affected
+            ]
+        )
+
+        for index, similar_index, score in similarity.find_top_k(
+            matrix, self._num_matches, rows=query_rows
+        ):
+            yield podcast_ids[index], podcast_ids[similar_index], score
 
 
 @functools.cache
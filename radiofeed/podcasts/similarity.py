@@ -0,0 +1,82 @@
+import heapq
+from collections.abc import Iterator, Sequence
+
+import numpy as np
+from scipy import sparse
+
+
+def find_top_k(
+    matrix: sparse.csr_matrix,
+    k: int,
+    *,
+    rows: Sequence[int] | None = None,
+    block_size: int = 500,
+) -> Iterator[tuple[int, int, float]]:
+    """Finds the `k` most similar rows to each row of a sparse matrix, by cosine
+    similarity.
+
+    Rows should be L2-normalized, as with `HashingVectorizer` output, so that the dot
+    product of two rows is their cosine similarity.
+
+    Similarities are calculated as sparse matrix products of each block of
+    `block_size` rows against every other block. The best matches of each row in each
+    block are selected without a full sort, and merged into a heap of at most `k`
+    matches per row. Memory used for similarities therefore depends on the block size
+    rather than the number of rows.
+
+    If `rows` is given, matches are only found for those row indices, although matches
+    may be any row of the matrix.
+
+    Yields tuples of row index, similar row index and similarity, most similar first
+    for each row. Each row itself, and any rows with no similarity, are excluded.
+    """
+    num_rows, _ = matrix.get_shape()
+    selected = np.arange(num_rows) if rows is None else np.asarray(rows, dtype=int)
+
+    for start in range(0, len(selected), block_size):
+        block_rows = selected[start : start + block_size]
+
+        # heap items are (similarity, -index), so ties favour the lowest index
+        heaps: list[list[tuple[float, int]]] = [[] for _ in block_rows]
+
+        for block_start in range(0, num_rows, block_size):
+            block = sparse.csr_matrix(
+                matrix[block_rows] @ matrix[block_start : block_start + block_size].T
+            )
+
+            for offset, heap in enumerate(heaps):
+                indices, similarities = _top_k(
+                    block.indices[block.indptr[offset] : block.indptr[offset + 1]]
+                    + block_start,
+                    block.data[block.indptr[offset] : block.indptr[offset + 1]],
+                    block_rows[offset],
+                    k,
+                )
+
+                for index, similarity in zip(indices, similarities, strict=True):
+                    item = (float(similarity), -int(index))
+                    if len(heap) < k:
+                        heapq.heappush(heap, item)
+                    elif item > heap[0]:
+                        heapq.heapreplace(heap, item)
+
+        for row, heap in zip(block_rows, heaps, strict=True):
+            for similarity, index in sorted(heap, reverse=True):
+                yield int(row), -index, similarity
+
+
+def _top_k(
+    indices: np.ndarray,
+    similarities: np.ndarray,
+    row: int,
+    k: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    mask = (indices != row) & (similarities > 0)
+    indices, similarities = indices[mask], similarities[mask]
+
+    if len(similarities) > k:
+        # partition so that the k highest similarities come first, in any order
+        top = np.argpartition(-similarities, k - 1)[:k]
+        indices, similarities = indices[top], similarities[top]
+
+    return indices, similarities
@@ -3,6 +3,7 @@ from django.utils import timezone
 
 from radiofeed.podcasts.models import (
     Category,
+    FetchMetrics,
     Podcast,
     Recommendation,
     Subscription,
@@ -49,3 +50,10 @@ class SubscriptionFactory(factory.django.DjangoModelFactory):
 
     class Meta:
         model = Subscription
+
+
+class FetchMetricsFactory(factory.django.DjangoModelFactory):
+    podcast = factory.SubFactory(PodcastFactory)
+
+    class Meta:
+        model = FetchMetrics
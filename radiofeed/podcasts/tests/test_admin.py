@@ -8,6 +8,8 @@ from django.utils import timezone
 from radiofeed.podcasts.admin import (
     ActiveFilter,
     CategoryAdmin,
+    FetchMetricsAdmin,
+    FetchMetricsInline,
     ParserErrorFilter,
     PodcastAdmin,
     PrivateFilter,
@@ -16,7 +18,7 @@ from radiofeed.podcasts.admin import (
     ScheduledFilter,
     SubscribedFilter,
 )
-from radiofeed.podcasts.models import Category, Podcast
+from radiofeed.podcasts.models import Category, FetchMetrics, Podcast
 from radiofeed.podcasts.tests.factories import PodcastFactory, SubscriptionFactory
 
 
@@ -65,6 +67,7 @@ class TestPodcastAdmin:
     def test_make_promoted(self, podcasts, podcast_admin, req):
         podcast_admin.make_promoted(req, Podcast.objects.all())
         assert Podcast.objects.filter(promoted=True).count() == 3
+        assert Podcast.objects.filter(priority=Podcast.Priority.PROMOTED).count() == 3
 
     @pytest.mark.django_db
     def test_get_search_results(self, podcasts, podcast_admin, req):
@@ -115,6 +118,22 @@ class TestPodcastAdmin:
         assert podcast_admin.next_scheduled_update(podcast) == "-"
 
 
+class TestFetchMetricsAdmin:
+    def test_has_add_permission(self, req):
+        assert (
+            FetchMetricsAdmin(FetchMetrics, AdminSite()).has_add_permission(req)
+            is False
+        )
+
+
+class TestFetchMetricsInline:
+    def test_has_add_permission(self, req):
+        assert (
+            FetchMetricsInline(Podcast, AdminSite()).has_add_permission(req, None)
+            is False
+        )
+
+
 class TestPubDateFilter:
     @pytest.mark.django_db
     def test_none(self, podcasts, podcast_admin, req):
@@ -231,7 +250,12 @@ class TestScheduledFilter:
     @pytest.fixture
     def unscheduled(self):
         now = timezone.now()
-        return PodcastFactory(pub_date=now, parsed=now, frequency=timedelta(hours=3))
+        return PodcastFactory(
+            pub_date=now,
+            parsed=now,
+            frequency=timedelta(hours=3),
+            next_fetch_at=now + timedelta(hours=3),
+        )
 
     @pytest.mark.django_db
     def test_none(self, podcast_admin, req, scheduled, unscheduled):
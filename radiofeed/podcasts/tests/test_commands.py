@@ -17,6 +17,12 @@ class TestCreateRecommendations:
         call_command("create_recommendations")
         patched.assert_called()
 
+    @pytest.mark.django_db
+    def test_incremental(self, mocker):
+        patched = mocker.patch("radiofeed.podcasts.recommender.recommend")
+        call_command("create_recommendations", incremental=True)
+        patched.assert_any_call("en", incremental=True)
+
 
 class TestSendRecommendationsEmails:
     @pytest.fixture
@@ -4,9 +4,16 @@ import pytest
 from django.utils import timezone
 
 from radiofeed.episodes.tests.factories import EpisodeFactory
-from radiofeed.podcasts.models import Category, Podcast, Recommendation, Subscription
+from radiofeed.podcasts.models import (
+    Category,
+    FetchMetrics,
+    Podcast,
+    Recommendation,
+    Subscription,
+)
 from radiofeed.podcasts.tests.factories import (
     CategoryFactory,
+    FetchMetricsFactory,
     PodcastFactory,
     RecommendationFactory,
     SubscriptionFactory,
@@ -139,77 +146,17 @@ class TestPodcastManager:
         assert Podcast.objects.published(published=arg).exists() is result
 
     @pytest.mark.parametrize(
-        ("kwargs", "exists"),
+        ("next_fetch_at", "exists"),
         [
-            pytest.param(
-                {},
-                True,
-                id="parsed is None",
-            ),
-            pytest.param(
-                {"frequency": timedelta(hours=3)},
-                True,
-                id="parsed is None",
-            ),
-            pytest.param(
-                {
-                    "parsed": timedelta(hours=3),
-                    "frequency": timedelta(hours=1),
-                },
-                True,
-                id="pub date is None",
-            ),
-            pytest.param(
-                {
-                    "parsed": timedelta(seconds=1200),
-                    "pub_date": timedelta(days=3),
-                    "frequency": timedelta(hours=3),
-                },
-                False,
-                id="just parsed",
-            ),
-            pytest.param(
-                {
-                    "parsed": timedelta(hours=3),
-                    "pub_date": timedelta(days=3),
-                    "frequency": timedelta(hours=3),
-                },
-                True,
-                id="parsed before pub date+frequency",
-            ),
-            pytest.param(
-                {
-                    "parsed": timedelta(days=8),
-                    "pub_date": timedelta(days=8),
-                    "frequency": timedelta(days=15),
-                },
-                True,
-                id="parsed just before max frequency",
-            ),
-            pytest.param(
-                {
-                    "parsed": timedelta(days=30),
-                    "pub_date": timedelta(days=90),
-                    "frequency": timedelta(days=30),
-                },
-                True,
-                id="parsed before max frequency",
-            ),
+            pytest.param(None, True, id="never parsed"),
+            pytest.param(timedelta(hours=-1), True, id="due"),
+            pytest.param(timedelta(hours=1), False, id="not due"),
         ],
     )
     @pytest.mark.django_db
-    def test_get_scheduled_podcasts(self, kwargs, exists):
-        now = timezone.now()
-
-        parsed = kwargs.get("parsed", None)
-        pub_date = kwargs.get("pub_date", None)
-
-        frequency = kwargs.get("frequency", Podcast.DEFAULT_PARSER_FREQUENCY)
-
+    def test_get_scheduled_podcasts(self, next_fetch_at, exists):
         PodcastFactory(
-            frequency=frequency,
-            parsed=now - parsed if parsed else None,
-            pub_date=now - pub_date if pub_date else None,
+            next_fetch_at=timezone.now() + next_fetch_at if next_fetch_at else None
         )
 
         assert Podcast.objects.scheduled().exists() is exists
@@ -350,9 +297,92 @@ class TestPodcastModel:
         assert delta.total_seconds() / 3600 == pytest.approx(hours)
 
 
+class TestPodcastPriority:
+    @pytest.mark.django_db
+    def test_default(self):
+        podcast = PodcastFactory(priority=Podcast.Priority.SUBSCRIBED)
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.DEFAULT
+
+    @pytest.mark.django_db
+    def test_promoted(self):
+        podcast = PodcastFactory()
+
+        Podcast.objects.update(promoted=True)
+
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.PROMOTED
+
+        podcast.promoted = False
+        podcast.save()
+
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.DEFAULT
+
+    @pytest.mark.django_db
+    def test_subscribed(self):
+        podcast = PodcastFactory(promoted=True)
+        subscription = SubscriptionFactory(podcast=podcast)
+
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.SUBSCRIBED
+
+        subscription.delete()
+
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.PROMOTED
+
+    @pytest.mark.django_db
+    def test_bulk_create_subscriptions(self, user):
+        podcasts = PodcastFactory.create_batch(3)
+
+        Subscription.objects.bulk_create(
+            [Subscription(podcast=podcast, subscriber=user) for podcast in podcasts]
+        )
+
+        assert Podcast.objects.filter(priority=Podcast.Priority.SUBSCRIBED).count() == 3
+
+    @pytest.mark.django_db
+    def test_subscriber_deleted(self):
+        podcast = PodcastFactory()
+        subscription = SubscriptionFactory(podcast=podcast)
+
+        subscription.subscriber.delete()
+
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.DEFAULT
+
+
 class TestSubscriptionModel:
     def test_str(self):
         assert (
             str(Subscription(podcast_id=1, subscriber_id=2))
             == "subscriber 2 | podcast 1"
         )
+
+
+class TestFetchMetricsModel:
+    def test_str(self):
+        now = timezone.now()
+        assert str(FetchMetrics(podcast_id=1, created=now)) == f"podcast 1 | {now}"
+
+    @pytest.mark.django_db
+    def test_prune(self, podcast):
+        now = timezone.now()
+
+        metrics = [
+            FetchMetricsFactory(podcast=podcast, created=now - timedelta(hours=hours))
+            for hours in range(12)
+        ]
+
+        other = FetchMetricsFactory(created=now - timedelta(days=1))
+
+        assert FetchMetrics.objects.prune([podcast]) == 2
+
+        assert set(podcast.fetch_metrics.all()) == set(metrics[:10])
+        assert FetchMetrics.objects.filter(pk=other.pk).exists()
+
+    @pytest.mark.django_db
+    def test_prune_none(self, podcast):
+        FetchMetricsFactory(podcast=podcast)
+        assert FetchMetrics.objects.prune([podcast]) == 0
@@ -1,6 +1,6 @@
 import pytest
 
-from radiofeed.podcasts.models import Category, Recommendation
+from radiofeed.podcasts.models import Category, Podcast, Recommendation
 from radiofeed.podcasts.recommender import get_categories, recommend
 from radiofeed.podcasts.tests.factories import (
     PodcastFactory,
@@ -121,3 +121,125 @@ class TestRecommend:
         )
         assert recommendations.count() == 1
         assert recommendations[0].recommended == podcast_1
+
+
+class TestRecommendIncremental:
+    @pytest.fixture
+    def category(self):
+        category, _ = Category.objects.get_or_create(name="Science")
+        return category
+
+    @pytest.fixture
+    def podcasts(self, category):
+        return [
+            PodcastFactory(
+                extracted_text="Cool science podcast science physics astronomy",
+                categories=[category],
+            ),
+            PodcastFactory(
+                extracted_text="Another cool science podcast science physics astronomy",
+                categories=[category],
+            ),
+            PodcastFactory(
+                extracted_text="Philosophy things thinking",
+                categories=[category],
+            ),
+        ]
+
+    def _get_recommended(self, podcast):
+        return set(
+            Recommendation.objects.filter(podcast=podcast).values_list(
+                "recommended", flat=True
+            )
+        )
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_clear_categories_cache")
+    def test_hashes_saved(self, podcasts):
+        recommend("en")
+
+        for podcast in podcasts:
+            podcast.refresh_from_db()
+            assert len(podcast.recommendations_hash) == 64
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_clear_categories_cache")
+    def test_vectors_saved(self, podcasts, settings, tmp_path):
+        settings.RECOMMENDER_VECTORS_DIR = tmp_path
+
+        recommend("en")
+
+        assert (tmp_path / "en" / "ids.npy").exists()
+        assert self._get_recommended(podcasts[0]) == {podcasts[1].pk}
+
+        Podcast.objects.filter(pk=podcasts[0].pk).update(
+            extracted_text="Philosophy things thinking"
+        )
+
+        recommend("en", incremental=True)
+
+        assert self._get_recommended(podcasts[0]) == {podcasts[2].pk}
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_clear_categories_cache")
+    def test_unchanged(self, podcasts):
+        recommend("en")
+
+        # not replaced unless podcasts have changed
+        recommendation = RecommendationFactory(
+            podcast=podcasts[2], recommended=podcasts[0]
+        )
+
+        recommend("en", incremental=True)
+
+        assert Recommendation.objects.filter(pk=recommendation.pk).exists()
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_clear_categories_cache")
+    def test_text_changed(self, podcasts):
+        recommend("en")
+
+        assert self._get_recommended(podcasts[0]) == {podcasts[1].pk}
+        assert self._get_recommended(podcasts[1]) == {podcasts[0].pk}
+
+        Podcast.objects.filter(pk=podcasts[0].pk).update(
+            extracted_text="Philosophy things thinking"
+        )
+
+        recommend("en", incremental=True)
+
+        # changed podcast and podcasts recommending it are both updated
+        assert self._get_recommended(podcasts[0]) == {podcasts[2].pk}
+        assert self._get_recommended(podcasts[1]) == set()
+
+        # unchanged podcast not recommending changed podcast is not updated
+        assert self._get_recommended(podcasts[2]) == set()
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_clear_categories_cache")
+    def test_categories_changed(self, podcasts):
+        recommend("en")
+
+        podcasts[1].categories.set(
+            [Category.objects.get_or_create(name="Philosophy")[0]]
+        )
+
+        recommend("en", incremental=True)
+
+        assert self._get_recommended(podcasts[0]) == set()
+        assert self._get_recommended(podcasts[1]) == set()
+
+    @pytest.mark.django_db
+    @pytest.mark.usefixtures("_clear_categories_cache")
+    def test_podcast_removed(self, podcasts):
+        recommend("en")
+
+        Podcast.objects.filter(pk=podcasts[1].pk).update(active=False)
+
+        recommend("en", incremental=True)
+
+        assert self._get_recommended(podcasts[0]) == set()
+        assert self._get_recommended(podcasts[1]) == set()
+
+        podcasts[1].refresh_from_db()
+        assert podcasts[1].recommendations_hash == ""
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+from scipy import sparse
+from sklearn.metrics.pairwise import cosine_similarity
+from sklearn.preprocessing import normalize
+
+from radiofeed.podcasts.similarity import find_top_k
+
+
+class TestFindTopK:
+    def test_matches_dense(self):
+        rng = np.random.default_rng(42)
+
+        matrix = normalize(
+            sparse.random(50, 200, density=0.05, format="csr", random_state=rng)
+        )
+
+        dense = cosine_similarity(matrix)
+
+        results = list(find_top_k(matrix, 5, block_size=7))
+
+        for row in range(50):
+            expected = [
+                index
+                for index in np.argsort(-dense[row], kind="stable")
+                if index != row and dense[row, index] > 0
+            ][:5]
+
+            matches = [
+                (index, score) for current, index, score in results if current == row
+            ]
+
+            assert [index for index, _ in matches] == expected
+            assert [score for _, score in matches] == pytest.approx(
+                [dense[row, index] for index in expected]
+            )
+
+    def test_block_size(self):
+        rng = np.random.default_rng(0)
+
+        matrix = normalize(
+            sparse.random(40, 100, density=0.1, format="csr", random_state=rng)
+        )
+
+        expected = list(find_top_k(matrix, 3, block_size=40))
+
+        for block_size in (1, 3, 16):
+            assert [
+                (row, index)
+                for row, index, _ in find_top_k(matrix, 3, block_size=block_size)
+            ] == [(row, index) for row, index, _ in expected]
+
+    def test_ties(self):
+        matrix = normalize(sparse.csr_matrix(np.ones((5, 2))))
+
+        assert [
+            (row, index) for row, index, _ in find_top_k(matrix, 2, block_size=2)
+        ] == [
+            (0, 1),
+            (0, 2),
+            (1, 0),
+            (1, 2),
+            (2, 0),
+            (2, 1),
+            (3, 0),
+            (3, 1),
+            (4, 0),
+            (4, 1),
+        ]
+
+    def test_excludes_self_and_unrelated(self):
+        matrix = normalize(
+            sparse.csr_matrix(
+                [
+                    [1.0, 0.0, 0.0],
+                    [1.0, 1.0, 0.0],
+                    [0.0, 0.0, 1.0],
+                ]
+            )
+        )
+
+        assert [(row, index) for row, index, _ in find_top_k(matrix, 12)] == [
+            (0, 1),
+            (1, 0),
+        ]
+
+    def test_fewer_than_k(self):
+        matrix = normalize(sparse.csr_matrix(np.ones((3, 2))))
+        assert len(list(find_top_k(matrix, 12))) == 6
+
+    def test_empty(self):
+        assert list(find_top_k(sparse.csr_matrix((0, 10)), 12)) == []
@@ -0,0 +1,145 @@
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from radiofeed.podcasts.vectors import VectorStore
+
+
+class TestVectorStore:
+    @pytest.fixture
+    def vectorizer(self):
+        return HashingVectorizer()
+
+    @pytest.fixture
+    def store(self, vectorizer):
+        return VectorStore.empty().update(
+            [
+                (3, "science physics astronomy"),
+                (1, "philosophy things thinking"),
+                (2, "history wars"),
+            ],
+            vectorizer,
+        )
+
+    def test_update(self, store, vectorizer):
+        assert store.ids.tolist() == [3, 1, 2]
+        assert (
+            store.matrix
+            != vectorizer.transform(
+                [
+                    "science physics astronomy",
+                    "philosophy things thinking",
+                    "history wars",
+                ]
+            )
+        ).nnz == 0
+
+    def test_update_changed(self, mocker, store, vectorizer):
+        transform = mocker.spy(vectorizer, "transform")
+
+        updated = store.update(
+            [
+                (1, "philosophy things thinking"),
+                (2, "history of science"),
+                (4, "science physics astronomy"),
+            ],
+            vectorizer,
+        )
+
+        # only new or changed text is vectorized
+        transform.assert_called_once_with(
+            ["history of science", "science physics astronomy"]
+        )
+
+        assert updated.ids.tolist() == [1, 2, 4]
+        assert updated.hashes[0] == store.hashes[1]
+        assert updated.hashes[2] == store.hashes[0]
+        assert (
+            updated.matrix
+            != HashingVectorizer().transform(
+                [
+                    "philosophy things thinking",
+                    "history of science",
+                    "science physics astronomy",
+                ]
+            )
+        ).nnz == 0
+
+    def test_update_vectorizer_changed(self, store):
+        vectorizer = HashingVectorizer(stop_words=["science"])
+
+        updated = store.update([(3, "science physics astronomy")], vectorizer)
+
+        assert updated.hashes[0] != store.hashes[0]
+        assert (
+            updated.matrix != vectorizer.transform(["science physics astronomy"])
+        ).nnz == 0
+
+    def test_update_empty(self, store, vectorizer):
+        updated = store.update([], vectorizer)
+        assert len(updated.ids) == 0
+        assert updated.matrix.get_shape()[0] == 0
+
+    def test_save(self, store, tmp_path):
+        path = tmp_path / "vectors" / "en"
+
+        store.save(path)
+        loaded = VectorStore.load(path)
+
+        assert loaded.ids.tolist() == [3, 1, 2]
+        assert np.array_equal(loaded.hashes, store.hashes)
+        assert (loaded.matrix != store.matrix).nnz == 0
+
+    def test_save_existing(self, store, vectorizer, tmp_path):
+        store.save(tmp_path / "en")
+        store.update([(1, "philosophy things thinking")], vectorizer).save(
+            tmp_path / "en"
+        )
+
+        assert VectorStore.load(tmp_path / "en").ids.tolist() == [1]
+        assert [path.name for path in tmp_path.iterdir()] == ["en"]
+
+    def test_load_not_found(self, tmp_path):
+        assert len(VectorStore.load(tmp_path / "en").ids) == 0
+
+    def test_get_rows(self, store):
+        assert store.get_rows([2, 5, 3]) == [2, 0]
+
+    @pytest.mark.parametrize(
+        "stop_words",
+        [
+            pytest.param(frozenset({"the", "and", "of", "a", "in"}), id="frozenset"),
+            pytest.param(["the", "and", "of", "a", "in"], id="list"),
+            pytest.param("english", id="name"),
+            pytest.param(None, id="none"),
+        ],
+    )
+    def test_hashes_stable_across_processes(self, stop_words):
+        # text hashes must not depend on the hash seed of the process, e.g. from set
+        # ordering of stopwords, or stores saved by one run are never reused by the next
+        code = (
+            "from sklearn.feature_extraction.text import HashingVectorizer;"
+            "from radiofeed.podcasts.vectors import VectorStore;"
+            f"vectorizer = HashingVectorizer(stop_words={stop_words!r});"
+            "print(VectorStore.empty().update([(1, 'text')], vectorizer).hashes[0])"
+        )
+
+        assert (
+            len(
+                {
+                    subprocess.run(  # noqa: S603
+                        [sys.executable, "-c", code],
+                        env=os.environ | {"PYTHONHASHSEED": str(seed)},
+                        capture_output=True,
+                        check=True,
+                        text=True,
+                    ).stdout
+                    for seed in range(5)
+                }
+            )
+            == 1
+        )
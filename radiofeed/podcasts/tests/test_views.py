@@ -4,7 +4,7 @@ from pytest_django.asserts import assertContains, assertTemplateUsed
 
 from radiofeed.episodes.tests.factories import EpisodeFactory
 from radiofeed.podcasts import itunes
-from radiofeed.podcasts.models import Subscription
+from radiofeed.podcasts.models import Podcast, Subscription
 from radiofeed.podcasts.tests.factories import (
     CategoryFactory,
     PodcastFactory,
@@ -410,6 +410,9 @@ class TestSubscribe:
             podcast=podcast, subscriber=auth_user
         ).exists()
 
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.SUBSCRIBED
+
     @pytest.mark.django_db()(transaction=True)
     def test_already_subscribed(
         self,
@@ -473,6 +476,9 @@ class TestUnsubscribe:
             podcast=podcast, subscriber=auth_user
         ).exists()
 
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.DEFAULT
+
     @pytest.mark.django_db
     def test_unsubscribe_private(self, client, auth_user):
         podcast = SubscriptionFactory(
@@ -552,6 +558,9 @@ class TestRemovePrivateFeed:
             subscriber=auth_user, podcast=podcast
         ).exists()
 
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.DEFAULT
+
     @pytest.mark.django_db
     def test_not_private_feed(self, client, auth_user):
         podcast = PodcastFactory(private=False)
@@ -590,6 +599,7 @@ class TestAddPrivateFeed:
         ).podcast
 
         assert podcast.private
+        assert podcast.priority == Podcast.Priority.SUBSCRIBED
 
     @pytest.mark.django_db
     def test_existing_private(self, client, auth_user):
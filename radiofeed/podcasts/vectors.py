@@ -0,0 +1,173 @@
+import hashlib
+import pathlib
+import shutil
+import tempfile
+from collections.abc import Iterable, Sequence
+from typing import Self
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+_FILENAMES = ("ids", "hashes", "data", "indices", "indptr")
+
+
+class VectorStore:
+    """Sparse text vectors of podcasts, with the ID and a hash of the text of each
+    podcast.
+
+    Stores can be saved to a directory as uncompressed arrays, and loaded as memory
+    maps so that vectors are only read from disk as they are used.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        hashes: np.ndarray,
+        matrix: sparse.csr_matrix,
+    ) -> None:
+        self.ids = ids
+        self.hashes = hashes
+        self.matrix = matrix
+
+        self._rows = {int(podcast_id): row for row, podcast_id in enumerate(ids)}
+
+    @classmethod
+    def empty(cls) -> Self:
+        """Returns store without any vectors."""
+        return cls(
+            np.empty(0, dtype=np.int64),
+            np.empty(0, dtype=np.uint64),
+            sparse.csr_matrix((0, 0)),
+        )
+
+    @classmethod
+    def load(cls, path: pathlib.Path) -> Self:
+        """Loads store saved to directory. Returns empty store if not found."""
+        if not path.exists():
+            return cls.empty()
+
+        ids, hashes, data, indices, indptr = (
+            np.load(path / f"{filename}.npy", mmap_mode="r") for filename in _FILENAMES
+        )
+
+        return cls(
+            ids,
+            hashes,
+            sparse.csr_matrix(
+                (data, indices, indptr),
+                shape=(len(ids), int(np.load(path / "num_features.npy"))),
+                copy=False,
+            ),
+        )
+
+    def save(self, path: pathlib.Path) -> None:
+        """Saves store to directory, replacing any existing store."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        # write to a new directory first so a store is never partially written
+        tmp_path = pathlib.Path(tempfile.mkdtemp(dir=path.parent))
+
+        for filename, values in zip(
+            _FILENAMES,
+            (
+                self.ids,
+                self.hashes,
+                self.matrix.data,
+                self.matrix.indices,
+                self.matrix.indptr,
+            ),
+            strict=True,
+        ):
+            np.save(tmp_path / f"{filename}.npy", values)
+
+        np.save(tmp_path / "num_features.npy", self.matrix.get_shape()[1])
+
+        if path.exists():
+            old_path = path.rename(tmp_path.with_name(f"{tmp_path.name}.old"))
+            tmp_path.rename(path)
+            shutil.rmtree(old_path)
+        else:
+            tmp_path.rename(path)
+
+    def update(
+        self,
+        podcasts: Iterable[tuple[int, str]],
+        vectorizer: HashingVectorizer,
+    ) -> Self:
+        """Returns new store with vectors of podcasts, as tuples of ID and text, in
+        the same order.
+
+        Vectors are reused from this store where the podcast text is unchanged, so
+        only new or changed text is vectorized. Podcasts not included are dropped.
+        """
+        key = _make_key(vectorizer)
+
+        ids: list[int] = []
+        hashes: list[int] = []
+
+        reused: list[tuple[int, int]] = []
+        changed: list[tuple[int, str]] = []
+
+        for position, (podcast_id, text) in enumerate(podcasts):
+            text_hash = int.from_bytes(
+                hashlib.blake2b(text.encode(), digest_size=8, key=key).digest()
+            )
+
+            ids.append(podcast_id)
+            hashes.append(text_hash)
+
+            row = self._rows.get(podcast_id)
+
+            if row is not None and self.hashes[row] == text_hash:
+                reused.append((position, row))
+            else:
+                changed.append((position, text))
+
+        matrices = [
+            sparse.csr_matrix(matrix)
+            for matrix in (
+                self.matrix[[row for _, row in reused]] if reused else None,
+                vectorizer.transform([text for _, text in changed])
+                if changed
+                else None,
+            )
+            if matrix is not None
+        ]
+
+        if not matrices:
+            return self.empty()
+
+        # rows of reused and new vectors are combined back into the original order
+        order = np.argsort(
+            [position for position, _ in reused] + [position for position, _ in changed]
+        )
+
+        return type(self)(
+            np.array(ids, dtype=np.int64),
+            np.array(hashes, dtype=np.uint64),
+            sparse.csr_matrix(sparse.vstack(matrices, format="csr"))[order],
+        )
+
+    def get_rows(self, podcast_ids: Iterable[int]) -> Sequence[int]:
+        """Returns rows of podcasts in the store, ignoring any not found."""
+        return [
+            row
+            for podcast_id in podcast_ids
+            if (row := self._rows.get(podcast_id)) is not None
+        ]
+
+
+def _make_key(vectorizer: HashingVectorizer) -> bytes:
+    # vectors are invalidated if vectorizer parameters, e.g. stopwords, change
+    params = vectorizer.get_params()
+
+    # stopwords may be any collection, so are sorted for a key stable across processes
+    if isinstance(stop_words := params["stop_words"], Iterable) and not isinstance(
+        stop_words, str
+    ):
+        params["stop_words"] = sorted(stop_words)
+
+    return hashlib.blake2b(
+        repr(sorted(params.items())).encode(), digest_size=16
+    ).digest()
@@ -0,0 +1,20 @@
+import multiprocessing
+from concurrent import futures
+
+import django
+
+
+class DjangoProcessPoolExecutor(futures.ProcessPoolExecutor):
+    """ProcessPoolExecutor subclass which sets up Django in each worker process.
+
+    Workers are started with the "forkserver" method, so do not inherit the threads
+    or database connections of the parent process. Functions run in the pool should
+    not access the database.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        super().__init__(
+            max_workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=django.setup,
+        )
@@ -0,0 +1,110 @@
+import asyncio
+import http
+
+import httpx
+import pytest
+
+from radiofeed.http_client import AsyncClient, Client, get_limits
+
+
+def _handle(request):
+    if request.url.path == "/missing":
+        return httpx.Response(http.HTTPStatus.NOT_FOUND)
+    return httpx.Response(http.HTTPStatus.OK, content=b"ok")
+
+
+def _get_pool(client):
+    return client._client._transport._pool
+
+
+class TestGetLimits:
+    def test_defaults(self, settings):
+        settings.HTTP_CLIENT_MAX_CONNECTIONS = 50
+        settings.HTTP_CLIENT_MAX_KEEPALIVE_CONNECTIONS = 10
+        settings.HTTP_CLIENT_KEEPALIVE_EXPIRY = 30.0
+
+        assert get_limits() == httpx.Limits(
+            max_connections=50,
+            max_keepalive_connections=10,
+            keepalive_expiry=30.0,
+        )
+
+    def test_overrides(self):
+        limits = get_limits(max_connections=5, max_keepalive_connections=5)
+        assert limits.max_connections == 5
+        assert limits.max_keepalive_connections == 5
+
+    def test_zero_overrides(self):
+        limits = get_limits(max_keepalive_connections=0, keepalive_expiry=0)
+        assert limits.max_keepalive_connections == 0
+        assert limits.keepalive_expiry == 0
+
+
+class TestClient:
+    @pytest.fixture
+    def client(self):
+        return Client(transport=httpx.MockTransport(_handle))
+
+    def test_http2_setting(self, settings):
+        settings.HTTP_CLIENT_HTTP2 = True
+        assert _get_pool(Client())._http2 is True
+
+    def test_http2_disabled(self, settings):
+        settings.HTTP_CLIENT_HTTP2 = True
+        assert _get_pool(Client(http2=False))._http2 is False
+
+    def test_limits(self):
+        pool = _get_pool(Client(limits=get_limits(max_connections=5)))
+        assert pool._max_connections == 5
+
+    def test_get(self, client):
+        assert client.get("https://example.com").content == b"ok"
+
+    def test_get_error(self, client):
+        with pytest.raises(httpx.HTTPStatusError):
+            client.get("https://example.com/missing")
+
+    def test_stream(self, client):
+        with client.stream("https://example.com") as response:
+            assert response.read() == b"ok"
+
+    def test_stream_error(self, client):
+        with (
+            pytest.raises(httpx.HTTPStatusError),
+            client.stream("https://example.com/missing"),
+        ):
+            pass
+
+
+class TestAsyncClient:
+    def get_client(self):
+        return AsyncClient(transport=httpx.MockTransport(_handle))
+
+    def test_http2_setting(self, settings):
+        settings.HTTP_CLIENT_HTTP2 = True
+        assert _get_pool(AsyncClient())._http2 is True
+
+    def test_get(self):
+        async def _get():
+            async with self.get_client() as client:
+                return await client.get("https://example.com")
+
+        assert asyncio.run(_get()).content == b"ok"
+
+    def test_get_error(self):
+        async def _get():
+            async with self.get_client() as client:
+                return await client.get("https://example.com/missing")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(_get())
+
+    def test_stream(self):
+        async def _stream():
+            async with (
+                self.get_client() as client,
+                client.stream("https://example.com") as response,
+            ):
+                return await response.aread()
+
+        assert asyncio.run(_stream()) == b"ok"
@@ -0,0 +1,18 @@
+import pathlib
+
+from radiofeed.feedparser.feed_parser import parse_content
+from radiofeed.process_pool import DjangoProcessPoolExecutor
+
+
+class TestDjangoProcessPoolExecutor:
+    def test_submit(self):
+        content = (
+            pathlib.Path(__file__)
+            .parent.parent.joinpath("feedparser", "tests", "mocks", "rss_mock.xml")
+            .read_bytes()
+        )
+
+        with DjangoProcessPoolExecutor(1) as executor:
+            parsed = executor.submit(parse_content, content, "en").result()
+
+        assert parsed == parse_content(content, "en")
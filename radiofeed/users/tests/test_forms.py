@@ -3,7 +3,7 @@ import pathlib
 import pytest
 from django.core.files.uploadedfile import SimpleUploadedFile
 
-from radiofeed.podcasts.models import Subscription
+from radiofeed.podcasts.models import Podcast, Subscription
 from radiofeed.podcasts.tests.factories import PodcastFactory
 from radiofeed.users.forms import OpmlUploadForm
 
@@ -38,6 +38,9 @@ class TestOpmlUploadForm:
             Subscription.objects.filter(subscriber=user, podcast=podcast).count() == 1
         )
 
+        podcast.refresh_from_db()
+        assert podcast.priority == Podcast.Priority.SUBSCRIBED
+
     @pytest.mark.django_db
     def test_subscribe_to_feeds_parser_error(self, user, podcast):
         form = OpmlUploadForm()